@@ -1,4 +1,5 @@
 from django.db import NotSupportedError
+from django.db.models import FloatField
 from django.db.models.aggregates import (
     Aggregate,
     Count,
@@ -6,12 +7,15 @@ from django.db.models.aggregates import (
     StringAgg,
     Variance,
 )
-from django.db.models.expressions import Case, Value, When
+from django.db.models.expressions import Case, Func, OrderBy, Value, When
 from django.db.models.functions.comparison import Coalesce
 from django.db.models.lookups import IsNull
 from django.db.models.sql.where import WhereNode
 
 from django_mongodb_backend.expressions import Remove
+from django_mongodb_backend.query_utils import process_lhs
+
+__all__ = ["Median", "Percentile"]
 
 # Aggregates whose MongoDB aggregation name differs from
 # Aggregate.function.lower().
@@ -87,8 +91,113 @@ def stddev_variance(self, compiler, connection):
     return aggregate(self, compiler, connection, operator=operator)
 
 
-def string_agg(self, compiler, connection, resolve_inner_expression=False):  # noqa: ARG001
-    raise NotSupportedError("StringAgg is not supported.")
+def string_agg(self, compiler, connection, resolve_inner_expression=False):
+    """
+    When resolve_inner_expression=True, return the value that $group pushes
+    to an array ($push, or $addToSet if distinct=True): the expression, or, if
+    the aggregate has an order_by, a document with the expression and the
+    ordering keys. Otherwise, the expression is that array: sort it, drop the
+    nulls, and join the values with the delimiter.
+    """
+    expression, delimiter, *_ = self.get_source_expressions()
+    order_by = []
+    for expr in self.order_by.get_source_expressions() if self.order_by else ():
+        if not isinstance(expr, OrderBy):
+            expr = OrderBy(expr)
+        if expr.nulls_first or expr.nulls_last:
+            raise NotSupportedError(
+                "StringAgg.order_by doesn't support nulls_first and nulls_last on MongoDB."
+            )
+        order_by.append(expr)
+    if resolve_inner_expression:
+        if self.filter is not None:
+            # Skip rows that don't meet the criteria.
+            expression = Case(When(self.filter.condition, then=expression), default=Remove())
+        value = expression.as_mql(compiler, connection, as_expr=True)
+        if not order_by:
+            return value
+        keys = {
+            f"key{i}": expr.expression.as_mql(compiler, connection, as_expr=True)
+            for i, expr in enumerate(order_by)
+        }
+        return {"value": value, **keys}
+    values = expression.as_mql(compiler, connection, as_expr=True)
+    if order_by:
+        sort_by = {f"key{i}": -1 if expr.descending else 1 for i, expr in enumerate(order_by)}
+        values = {
+            "$map": {
+                "input": {"$sortArray": {"input": values, "sortBy": sort_by}},
+                "in": "$$this.value",
+            }
+        }
+    (delimiter,) = process_lhs(delimiter, compiler, connection, as_expr=True)
+    return {
+        "$reduce": {
+            "input": {"$filter": {"input": values, "cond": {"$ne": ["$$this", None]}}},
+            # The result is null if there are no values.
+            "initialValue": None,
+            "in": {
+                "$cond": {
+                    "if": {"$eq": ["$$value", None]},
+                    "then": "$$this",
+                    "else": {"$concat": ["$$value", delimiter, "$$this"]},
+                }
+            },
+        }
+    }
+
+
+class Percentile(Aggregate):
+    """
+    Return the approximate percentile (a number between 0 and 1) of the
+    expression's values using $percentile.
+    """
+
+    function = "PERCENTILE"
+    name = "Percentile"
+    output_field = FloatField()
+    arity = 1
+
+    def __init__(self, expression, percentile, **extra):
+        if (
+            not isinstance(percentile, (int, float))
+            or isinstance(percentile, bool)
+            or not 0 <= percentile <= 1
+        ):
+            raise ValueError("Percentile's percentile must be a number between 0 and 1.")
+        self.percentile = percentile
+        super().__init__(expression, **extra)
+
+    def as_mql_expr(self, compiler, connection, resolve_inner_expression=False):
+        lhs_mql = aggregate(self, compiler, connection, resolve_inner_expression=True)
+        if resolve_inner_expression:
+            return lhs_mql
+        return {"$percentile": {"input": lhs_mql, "p": [self.percentile], "method": "approximate"}}
+
+
+class PercentileValue(Func):
+    """The value in the array of percentiles that $percentile returns."""
+
+    def as_mql_expr(self, compiler, connection):
+        (array,) = process_lhs(self, compiler, connection, as_expr=True)
+        return {"$arrayElemAt": [array, 0]}
+
+
+class Median(Aggregate):
+    """
+    Return the approximate median of the expression's values using $median.
+    """
+
+    function = "MEDIAN"
+    name = "Median"
+    output_field = FloatField()
+    arity = 1
+
+    def as_mql_expr(self, compiler, connection, resolve_inner_expression=False):
+        lhs_mql = aggregate(self, compiler, connection, resolve_inner_expression=True)
+        if resolve_inner_expression:
+            return lhs_mql
+        return {"$median": {"input": lhs_mql, "method": "approximate"}}
 
 
 def register_aggregates():
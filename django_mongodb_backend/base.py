@@ -3,7 +3,7 @@ import logging
 import os
 import warnings
 
-from bson import Decimal128
+from bson import Decimal128, json_util
 from django.apps import apps
 from django.core.exceptions import EmptyResultSet, FullResultSet, ImproperlyConfigured
 from django.db import DEFAULT_DB_ALIAS, NotSupportedError
@@ -15,7 +15,10 @@ from pymongo.collection import Collection
 from pymongo.driver_info import DriverInfo
 from pymongo.encryption import ClientEncryption
 from pymongo.mongo_client import MongoClient
+from pymongo.read_concern import ReadConcern
+from pymongo.read_preferences import _ServerMode
 from pymongo.uri_parser import parse_uri
+from pymongo.write_concern import WriteConcern
 
 from . import __version__ as django_mongodb_backend_version
 from . import dbapi as Database
@@ -24,11 +27,24 @@ from .creation import DatabaseCreation
 from .features import DatabaseFeatures
 from .introspection import DatabaseIntrospection
 from .operations import DatabaseOperations
+from .query_cache import QueryCache
 from .schema import DatabaseSchemaEditor
+from .search_index_cache import SearchIndexCache
 from .utils import OperationDebugWrapper
 from .validation import DatabaseValidation
 
 
+def _get_option_key(value):
+    """
+    Return a hashable key for a get_collection() option. Read preferences,
+    read concerns, and write concerns aren't hashable, so they're keyed by
+    their type and their document (e.g. {"mode": "secondaryPreferred"}).
+    """
+    if isinstance(value, (_ServerMode, ReadConcern, WriteConcern)):
+        return (type(value), json_util.dumps(value.document))
+    return value
+
+
 class Cursor:
     """DB-API style cursors aren't supported by MongoDB."""
 
@@ -229,6 +245,10 @@ class DatabaseWrapper(BaseDatabaseWrapper):
         self.in_atomic_block_mongo = False
         # Current number of nested 'atomic' calls.
         self.nested_atomics = 0
+        # Current number of nested reads_from_primary() blocks.
+        self.primary_reads = 0
+        # Collection objects returned by get_collection().
+        self._collections = {}
         # If database "NAME" isn't specified, try to get it from HOST, if it's
         # a connection string.
         if self.settings_dict["NAME"] == "":  # Empty string = unspecified; None = _nodb_cursor()
@@ -243,6 +263,10 @@ class DatabaseWrapper(BaseDatabaseWrapper):
                 raise ImproperlyConfigured('settings.DATABASES is missing the "NAME" value.')
 
     def get_collection(self, name, **kwargs):
+        """
+        Return the Collection called name, configured with kwargs (e.g.
+        read_preference). Collections are cached until close_pool().
+        """
         if not apps.ready and not apps.stored_app_configs:
             warnings.warn(
                 CursorWrapper.APPS_NOT_READY_WARNING_MSG,
@@ -251,11 +275,45 @@ class DatabaseWrapper(BaseDatabaseWrapper):
                 # Django MongoDB Backend to the offending user code.
                 stacklevel=12,
             )
-        collection = Collection(self.database, name, **kwargs)
+        try:
+            key = (
+                name,
+                *sorted((option, _get_option_key(value)) for option, value in kwargs.items()),
+            )
+            collection = self._collections.get(key)
+        except TypeError:
+            # Unknown unhashable options aren't cached.
+            key = collection = None
+        if collection is None:
+            collection = Collection(self.database, name, **kwargs)
+            if key is not None:
+                self._collections[key] = collection
         if self.queries_logged:
             collection = OperationDebugWrapper(self, collection)
         return collection
 
+    @contextlib.contextmanager
+    def reads_from_primary(self):
+        """
+        Make the block's queries read from the primary, ignoring read
+        preferences set by MongoQuerySet.read_preference() or by routers.
+        """
+        self.primary_reads += 1
+        try:
+            yield
+        finally:
+            self.primary_reads -= 1
+
+    @cached_property
+    def query_cache(self):
+        """The cache of compiled queries used by SQLCompiler.execute_sql()."""
+        return QueryCache(self.settings_dict.get("QUERY_CACHE_SIZE", 128))
+
+    @cached_property
+    def search_index_cache(self):
+        """The cache of search indexes used by SearchExpression.as_mql()."""
+        return SearchIndexCache(self.settings_dict.get("SEARCH_INDEX_CACHE_TIMEOUT", 60))
+
     def get_database(self):
         if self.queries_logged:
             return OperationDebugWrapper(self)
@@ -271,6 +329,7 @@ class DatabaseWrapper(BaseDatabaseWrapper):
 
     def init_connection_state(self):
         self.database = self.connection[self.settings_dict["NAME"]]
+        self._collections.clear()
         super().init_connection_state()
 
     def get_connection_params(self):
@@ -335,6 +394,7 @@ class DatabaseWrapper(BaseDatabaseWrapper):
         self.connection = None
         with contextlib.suppress(AttributeError):
             del self.database
+        self._collections.clear()
         del self._connection_pools[self.alias]
         # Then close it.
         connection.close()
@@ -1,26 +1,43 @@
 import itertools
 from collections import defaultdict
+from copy import copy
 
 from bson import SON, ObjectId, json_util
 from django.core.exceptions import EmptyResultSet, FieldError, FullResultSet
-from django.db import IntegrityError, NotSupportedError
+from django.db import IntegrityError, NotSupportedError, router
 from django.db.models import Count
-from django.db.models.aggregates import Aggregate, Variance
-from django.db.models.expressions import Case, Col, OrderBy, Ref, Value, When
+from django.db.models.aggregates import Aggregate, StringAgg, Variance
+from django.db.models.constants import OnConflict
+from django.db.models.expressions import Case, Col, OrderBy, Ref, Star, Value, When, Window
 from django.db.models.functions.comparison import Coalesce
 from django.db.models.functions.math import Power
-from django.db.models.lookups import IsNull
+from django.db.models.lookups import In, IsNull
 from django.db.models.sql import compiler
 from django.db.models.sql.constants import GET_ITERATOR_CHUNK_SIZE, MULTI, SINGLE
 from django.db.models.sql.datastructures import BaseTable
 from django.db.models.sql.where import AND, OR, XOR, ExtraWhere, NothingNode, WhereNode
 from django.utils.functional import cached_property
-from pymongo import ASCENDING, DESCENDING
+from pymongo import ASCENDING, DESCENDING, InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError
 
+from .aggregates import Percentile, PercentileValue
+from .converters import get_chunk_converter
 from .expressions.search import SearchExpression, SearchVector
-from .query import MongoQuery, wrap_database_errors
+from .fields.mixins import defer_embedded_value, mark_partially_loaded
+from .query import (
+    MongoQuery,
+    get_count_arguments,
+    get_query_option,
+    get_query_options,
+    reverse_join,
+    wrap_database_errors,
+)
+from .query_cache import CompiledQuery, find_slots, get_query_shape
 from .query_utils import is_constant_value, is_direct_value
 
+# The code of a write error for a violated unique index.
+DUPLICATE_KEY_ERROR = 11000
+
 
 class SQLCompiler(compiler.SQLCompiler):
     """Base class for all Mongo compilers."""
@@ -42,6 +59,15 @@ class SQLCompiler(compiler.SQLCompiler):
         self.needs_wrap_aggregation = False
         # The MQL equivalent to a SQL HAVING clause.
         self.having_match_mql = None
+        # $setWindowFields stages (and the QUALIFY $match) for window
+        # expressions.
+        self.window_pipeline = None
+        # The alias of the "through" collection of a many-to-many
+        # prefetch_related() query.
+        self.prefetch_through_alias = None
+        # The collection that get_lookup_pipeline()'s pipeline runs on if it
+        # isn't this query's collection.
+        self.lookup_from_collection = None
 
     def _get_group_alias_column(self, expr, annotation_group_idx):
         """Generate a dummy field for use in the ids fields in $group."""
@@ -70,15 +96,19 @@ class SQLCompiler(compiler.SQLCompiler):
         column_target.db_column = alias
         column_target.set_attributes_from_name(alias)
         inner_column = Col(self.collection_name, column_target)
-        if getattr(sub_expr, "distinct", False):
+        if (distinct := getattr(sub_expr, "distinct", False)) or isinstance(sub_expr, StringAgg):
             # If the expression should return distinct values, use $addToSet to
-            # deduplicate.
+            # deduplicate. StringAgg collects the values with $push and joins
+            # them in a subsequent stage.
             rhs = sub_expr.as_mql(
                 self, self.connection, resolve_inner_expression=True, as_expr=True
             )
-            group[alias] = {"$addToSet": rhs}
+            group[alias] = {"$addToSet" if distinct else "$push": rhs}
+            # Replace the aggregated expression with the array column; the
+            # filter has already been applied.
             replacing_expr = sub_expr.copy()
-            replacing_expr.set_source_expressions([inner_column, None])
+            _, *args, _, order_by = replacing_expr.get_source_expressions()
+            replacing_expr.set_source_expressions([inner_column, *args, None, order_by])
         else:
             group[alias] = sub_expr.as_mql(self, self.connection, as_expr=True)
             replacing_expr = inner_column
@@ -88,6 +118,9 @@ class SQLCompiler(compiler.SQLCompiler):
         # Variance = StdDev^2
         if isinstance(sub_expr, Variance):
             replacing_expr = Power(replacing_expr, 2)
+        # $percentile returns an array of percentiles.
+        if isinstance(sub_expr, Percentile):
+            replacing_expr = PercentileValue(replacing_expr)
         return replacing_expr
 
     def _prepare_expressions_for_pipeline(self, expression, target, annotation_group_idx):
@@ -304,7 +337,84 @@ class SQLCompiler(compiler.SQLCompiler):
             )
         return pipeline
 
+    def _annotate_prefetch_related_values(self):
+        """
+        Replace the extra selects that prefetch_related() adds to many-to-many
+        querysets (e.g. "_prefetch_related_val_book_id": "app_through.book_id")
+        with annotations of the same name that reference the column of the
+        joined "through" collection.
+        """
+        for name, (sql, _) in list(self.query.extra.items()):
+            if not name.startswith("_prefetch_related_"):
+                continue
+            # The first join of a table uses the table name as its alias.
+            alias, _, column = sql.rpartition(".")
+            if (join := self.query.alias_map.get(alias)) is None:
+                continue
+            field = getattr(join.join_field, "field", join.join_field)
+            model = field.model if field.model._meta.db_table == alias else field.related_model
+            target = next(f for f in model._meta.concrete_fields if f.column == column)
+            self.query.add_annotation(Col(alias, target), name)
+            self.prefetch_through_alias = alias
+            del self.query.extra[name]
+            # Clear the extra select cache.
+            self.query.set_extra_mask(self.query.extra_select_mask)
+
+    def _prepare_window_expressions(self):
+        """
+        Compute window expressions with $setWindowFields stages and replace
+        them with columns named `__window{n}`. Window expressions with the
+        same partition and sort are computed by a single stage. Return the
+        pipeline, which ends with a $match for filters that reference window
+        expressions (the SQL equivalent of QUALIFY).
+        """
+        expressions = [*self.annotations.values(), *self.order_by_objs]
+        if self.qualify:
+            expressions.append(self.qualify)
+        windows = {}
+        for expr in expressions:
+            for window in self._get_all_expressions_of_type(expr, Window):
+                windows.setdefault(window, f"__window{len(windows) + 1}")
+        if not windows:
+            return None
+        sort_fields = {}
+        stages = {}
+        replacements = {}
+        for window, alias in windows.items():
+            partition_by, sort_by, output = window.as_mql_window(self, self.connection, sort_fields)
+            key = (json_util.dumps(partition_by), tuple(sort_by.items()))
+            if (stage := stages.get(key)) is None:
+                stage = stages[key] = {}
+                if partition_by is not None:
+                    stage["partitionBy"] = partition_by
+                if sort_by:
+                    stage["sortBy"] = sort_by
+                stage["output"] = {}
+            stage["output"][alias] = output
+            replacements[window] = self._get_column_from_expression(window, alias)
+        pipeline = []
+        if sort_fields:
+            pipeline.append({"$addFields": sort_fields})
+        pipeline.extend({"$setWindowFields": stage} for stage in stages.values())
+
+        def replace_windows(expr):
+            # Leave other expressions alone since the columns that replace
+            # aggregates aren't hashable.
+            if next(self._get_all_expressions_of_type(expr, Window), None) is None:
+                return expr
+            return expr.replace_expressions(replacements)
+
+        self.annotations = {
+            target: replace_windows(expr) for target, expr in self.annotations.items()
+        }
+        self.order_by_objs = [replace_windows(expr) for expr in self.order_by_objs]
+        if self.qualify:
+            qualify = self.qualify.replace_expressions(replacements)
+            pipeline.append({"$match": qualify.as_mql(self, self.connection)})
+        return pipeline
+
     def pre_sql_setup(self, with_col_aliases=False):
+        self._annotate_prefetch_related_values()
         extra_select, order_by, group_by = super().pre_sql_setup(with_col_aliases=with_col_aliases)
         search_replacements = self._prepare_search_query_for_aggregation_pipeline(order_by)
         group, group_replacements = self._prepare_annotations_for_aggregation_pipeline(order_by)
@@ -336,6 +446,10 @@ class SQLCompiler(compiler.SQLCompiler):
         self.order_by_objs = [expr.replace_expressions(all_replacements) for expr, _ in order_by]
         if (where := self.get_where()) and search_replacements:
             self.set_where(where.replace_expressions(search_replacements))
+        self.window_pipeline = self._prepare_window_expressions()
+        # The arrays of with_related() follow the columns in each row.
+        for position, name in enumerate(self.with_related, start=len(self.columns)):
+            self.annotation_col_map[name] = position
         return extra_select, order_by, group_by
 
     def get_project_columns(self, columns):
@@ -350,33 +464,163 @@ class SQLCompiler(compiler.SQLCompiler):
             or self.query.distinct
             # The query has a select mask (e.g. QuerySet.defer()/only())
             or self.query.get_select_mask()
+            # Arrays are sliced (MongoQuerySet.slice_array())
+            or self.array_slices
         )
         return columns if needs_projection else None
 
     def execute_sql(
         self, result_type=MULTI, chunked_fetch=False, chunk_size=GET_ITERATOR_CHUNK_SIZE
     ):
-        self.pre_sql_setup()
+        if result_type == MULTI and (queries := self._split_prefetch_query()) is not None:
+            # The rows of each query are converted using this compiler's
+            # columns.
+            self.pre_sql_setup()
+            results = itertools.chain.from_iterable(
+                query.get_compiler(self.using).execute_sql(
+                    MULTI, chunked_fetch=True, chunk_size=chunk_size
+                )
+                for query in queries
+            )
+            return results if chunked_fetch else list(results)
         try:
-            query = self.build_query(self.get_project_columns(self.columns))
+            query = self.build_cached_query()
         except EmptyResultSet:
             return iter([]) if result_type == MULTI else None
 
-        cursor = query.get_cursor()
+        if (documents := get_query_option(self.query, "facet_documents")) is not None:
+            # The documents were fetched by MongoQuerySet.facets().
+            cursor = iter(documents)
+        elif result_type == SINGLE and (count_args := self.get_count_arguments(query)):
+            filter_, kwargs = count_args
+            return [query.count_documents(filter_, **kwargs)]
+        else:
+            cursor = query.get_cursor()
         if result_type == SINGLE:
             try:
-                obj = cursor.next()
+                obj = next(cursor)
             except StopIteration:
                 return None  # No result
             else:
-                return self._make_result(obj, self.columns)
+                return self._make_result(obj, self.result_columns)
         # result_type is MULTI
-        result = self.cursor_iter(cursor, chunk_size, self.columns)
+        result = self.cursor_iter(cursor, chunk_size, self.result_columns)
         if not chunked_fetch:
             # If using non-chunked reads, read data into memory.
             return list(result)
         return result
 
+    def _split_prefetch_query(self):
+        """
+        Return copies of a many-to-many prefetch_related() query that each
+        fetch the related objects of at most PREFETCH_CHUNK_SIZE objects, or
+        None if the query doesn't need to be split, so that the $in list of
+        the objects' ids stays well below the maximum document size.
+        """
+        chunk_size = self.connection.settings_dict.get("PREFETCH_CHUNK_SIZE", 10000)
+        aliases = {
+            sql.rpartition(".")[0]
+            for name, (sql, _) in self.query.extra.items()
+            if name.startswith("_prefetch_related_")
+        }
+        where = self.query.where
+        if not chunk_size or not aliases or where.connector != AND or where.negated:
+            return None
+        for lookup in where.children:
+            if (
+                isinstance(lookup, In)
+                and isinstance(lookup.lhs, Col)
+                and lookup.lhs.alias in aliases
+                and isinstance(lookup.rhs, (list, tuple))
+                and len(lookup.rhs) > chunk_size
+            ):
+                break
+        else:
+            return None
+        queries = []
+        for start in range(0, len(lookup.rhs), chunk_size):
+            chunk = copy(lookup)
+            chunk.rhs = lookup.rhs[start : start + chunk_size]
+            query = self.query.clone()
+            query.where = where.replace_expressions({lookup: chunk})
+            queries.append(query)
+        return queries
+
+    def has_results(self):
+        """
+        Use Collection.find_one() rather than an aggregation if the existence
+        of results only depends on a filter.
+        """
+        try:
+            query = self.build_cached_query()
+        except EmptyResultSet:
+            return False
+        pipeline = query.get_pipeline()
+        if (count_args := get_count_arguments(pipeline)) is None:
+            return next(query.get_cursor(), None) is not None
+        filter_, kwargs = count_args
+        # The $limit stage of QuerySet.exists() doesn't need to be passed.
+        kwargs.pop("limit", None)
+        return query.find_one(filter_, {"_id": 1}, **kwargs) is not None
+
+    def _is_count_query(self):
+        """
+        Return True if the query only counts rows, e.g. QuerySet.count() or
+        QuerySet.aggregate(Count("*")).
+        """
+        annotations = list(self.query.annotation_select.values())
+        if len(annotations) != 1 or self.query.select or self.query.default_cols:
+            return False
+        annotation = annotations[0]
+        return (
+            isinstance(annotation, Count)
+            and not annotation.distinct
+            and annotation.filter is None
+            and isinstance(annotation.get_source_expressions()[0], Star)
+        )
+
+    def get_count_arguments(self, query):
+        """
+        Return the (filter, kwargs) to pass to Collection.count_documents() if
+        this query only counts the documents matching a filter, otherwise
+        None.
+        """
+        if not self._is_count_query() or self.query.group_by is not None or self.having:
+            return None
+        # The documents that the $group stage counts.
+        counted = copy(query)
+        counted.aggregation_pipeline = None
+        counted.needs_wrap_aggregation = False
+        counted.project_fields = None
+        return get_count_arguments(counted.get_pipeline())
+
+    def build_cached_query(self):
+        """
+        Return the MongoQuery for this compiler, binding the lookup values of
+        the query to a previously compiled query of the same shape if
+        possible.
+        """
+        query_cache = self.connection.query_cache
+        shape = get_query_shape(self.query) if query_cache.maxsize > 0 else None
+        if shape is not None:
+            key, lookups = shape
+            if compiled := query_cache.get(key):
+                try:
+                    return compiled.bind(self, lookups)
+                except (EmptyResultSet, FullResultSet):
+                    pass
+        self.pre_sql_setup()
+        query = self.build_query(self.get_project_columns(self.columns))
+        if shape is not None and not query.subqueries:
+            try:
+                mqls = [lookup.as_mql(self, self.connection) for lookup in lookups]
+            except (EmptyResultSet, FullResultSet):
+                pass
+            else:
+                if (slots := find_slots(query.match_mql, mqls)) is not None:
+                    query_cache.set(key, CompiledQuery(self, query, slots))
+        return query
+
     def results_iter(
         self,
         results=None,
@@ -388,14 +632,15 @@ class SQLCompiler(compiler.SQLCompiler):
         Return an iterator over the results from executing query given
         to this compiler. Called by QuerySet methods.
 
-        This method is copied from the superclass with one modification: the
-        `if tuple_expected` block is deindented so that the result of
-        _make_result() (a list) is cast to tuple as needed. For SQL database
-        drivers, tuple results come from cursor.fetchmany(), so the cast is
-        only needed there when apply_converters() casts the tuple to a list.
-        This customized method could be removed if _make_result() cast its
-        return value to a tuple, but that would be more expensive since that
-        cast is not always needed.
+        This method is copied from the superclass with two modifications.
+        First, the converters are compiled by get_chunk_converter() into a
+        function that converts a chunk of rows in place, which is faster than
+        apply_converters() since the rows from _make_result() are already
+        lists. Second, the `if tuple_expected` block is deindented so that the
+        result of _make_result() (a list) is cast to tuple as needed. For SQL
+        database drivers, tuple results come from cursor.fetchmany(), so the
+        cast is only needed there when apply_converters() casts the tuple to a
+        list.
         """
         if results is None:
             # QuerySet.values() or values_list()
@@ -403,13 +648,57 @@ class SQLCompiler(compiler.SQLCompiler):
 
         fields = [s[0] for s in self.select[0 : self.col_count]]
         converters = self.get_converters(fields)
-        rows = itertools.chain.from_iterable(results)
+        if self.klass_info:
+            self._mark_partially_loaded_fields(converters)
+            self._defer_lazy_fields(converters)
         if converters:
-            rows = self.apply_converters(rows, converters)
+            # Convert each chunk of rows (lists from _make_result()) in place
+            # rather than using apply_converters().
+            results = map(get_chunk_converter(converters, self.connection), results)
+        rows = itertools.chain.from_iterable(results)
         if tuple_expected:
             rows = map(tuple, rows)
         return rows
 
+    def _defer_lazy_fields(self, converters):
+        """
+        Replace the converters of the model instances' lazy embedded model
+        fields with one that defers their conversion until the attribute is
+        accessed. Values that aren't model fields (e.g. annotations) are
+        converted as usual.
+        """
+        klass_infos = [self.klass_info]
+        while klass_infos:
+            klass_info = klass_infos.pop()
+            for position in klass_info["select_fields"]:
+                expression = self.select[position][0]
+                if (
+                    position in converters
+                    and getattr(expression.target, "lazy", False)
+                    # Partially loaded fields must be converted to be marked.
+                    and mark_partially_loaded not in converters[position][0]
+                ):
+                    converters[position] = ([defer_embedded_value], expression)
+            klass_infos.extend(klass_info.get("related_klass_infos", ()))
+
+    def _mark_partially_loaded_fields(self, converters):
+        """
+        Add a converter that marks the values of the model fields that only()
+        or defer() partially load (and of the arrays that slice_array()
+        slices) so that saving them raises an error rather than overwriting
+        the parts that weren't loaded.
+        """
+        partial_fields = {*self.embedded_select_masks, *self.array_slices}
+        if not partial_fields:
+            return
+        for position in self.klass_info["select_fields"]:
+            expression = self.select[position][0]
+            if getattr(expression, "alias", None) == self.collection_name and (
+                expression.target in partial_fields
+            ):
+                field_converters = converters[position][0] if position in converters else []
+                converters[position] = ([*field_converters, mark_partially_loaded], expression)
+
     def _make_result(self, entity, columns):
         """
         Decode values for the given fields from the database entity.
@@ -483,6 +772,7 @@ class SQLCompiler(compiler.SQLCompiler):
             if columns is None:
                 extra_fields += ordering_fields
             query.lookup_pipeline = self.get_lookup_pipeline()
+            query.from_collection = self.lookup_from_collection
             where = self.get_where()
             try:
                 match_mql = where.as_mql(self, self.connection) if where else {}
@@ -492,6 +782,7 @@ class SQLCompiler(compiler.SQLCompiler):
                 query.match_mql = match_mql
         if extra_fields:
             query.extra_fields = self.get_project_fields(extra_fields, force_expression=True)
+        query.related_pipeline = [{"$lookup": lookup} for lookup in self.with_related.values()]
         query.subqueries = self.subqueries
         return query
 
@@ -546,6 +837,26 @@ class SQLCompiler(compiler.SQLCompiler):
                 related_columns, _ = zip(*related_columns, strict=True)
         return tuple(selected) + tuple(map(project_field, related_columns))
 
+    @cached_property
+    def result_columns(self):
+        """
+        Return the columns followed by (name, None) for the arrays of related
+        documents loaded by MongoQuerySet.with_related().
+        """
+        return self.columns + tuple((name, None) for name in self.with_related)
+
+    @cached_property
+    def with_related(self):
+        """
+        Return a dict mapping the names of the arrays of related documents
+        loaded by MongoQuerySet.with_related() to their $lookup stages. The
+        documents are only loaded for model instances.
+        """
+        if self.klass_info is None:
+            return {}
+        lookups = get_query_option(self.query, "with_related") or {}
+        return {lookup["as"]: lookup for lookup in lookups.values()}
+
     @cached_property
     def base_table(self):
         return next(
@@ -577,7 +888,39 @@ class SQLCompiler(compiler.SQLCompiler):
 
     @cached_property
     def collection(self):
-        return self.connection.get_collection(self.collection_name)
+        return self.get_collection(self.collection_name)
+
+    def get_collection(self, name):
+        """Return the collection `name` with the query's read preference."""
+        options = {}
+        if (read_preference := self.get_read_preference()) is not None:
+            options["read_preference"] = read_preference
+        return self.connection.get_collection(name, **options)
+
+    def get_read_preference(self):
+        """
+        Return the read preference set by MongoQuerySet.read_preference() or
+        by a database router's read_preference_for_read() method, or None to
+        use the client's read preference.
+        """
+        # Reads in a transaction or that decide what to write (e.g. the
+        # objects to delete) must use the primary.
+        if self.connection.session is not None or self.connection.primary_reads:
+            return None
+        if (read_preference := get_query_option(self.query, "read_preference")) is not None:
+            return read_preference
+        # Reads in atomic() blocks should see the block's writes.
+        if self.connection.in_atomic_block:
+            return None
+        model = self.query.model
+        for db_router in router.routers:
+            method = getattr(db_router, "read_preference_for_read", None)
+            if (
+                method is not None
+                and (read_preference := method(model, using=self.using)) is not None
+            ):
+                return read_preference
+        return None
 
     def get_combinator_queries(self):
         parts = []
@@ -786,12 +1129,27 @@ class SQLCompiler(compiler.SQLCompiler):
         # To improve join performance, push conditions (filters) from the
         # WHERE ($match) clause to the JOIN ($lookup) clause.
         pushed_filters = self._get_pushable_conditions()
+        self.lookup_from_collection = None
         for alias in tuple(self.query.alias_map):
             if not self.query.alias_refcount[alias] or self.collection_name == alias:
                 continue
-            result += self.query.alias_map[alias].as_mql(
-                self, self.connection, pushed_filters.get(alias)
-            )
+            join = self.query.alias_map[alias]
+            if (
+                alias == self.prefetch_through_alias
+                and not result
+                and not self.search_pipeline
+                and not self.needs_wrap_aggregation
+            ):
+                # Rather than joining the "through" collection to every
+                # document of this collection, select the "through" documents
+                # of the prefetched objects first and join this collection to
+                # them.
+                stages = reverse_join(join, self, self.connection, pushed_filters.get(alias))
+                if stages is not None:
+                    self.lookup_from_collection = join.table_name
+                    result += stages
+                    continue
+            result += join.as_mql(self, self.connection, pushed_filters.get(alias))
         return result
 
     def _get_aggregate_expressions(self, expr):
@@ -813,8 +1171,25 @@ class SQLCompiler(compiler.SQLCompiler):
         if not columns:
             return {}
         fields = defaultdict(dict)
+        embedded_select_masks = {} if force_expression else self.embedded_select_masks
+        array_slices = self.array_slices
         for name, expr in columns + (ordering or ()):
             collection = expr.alias if isinstance(expr, Col) else None
+            if collection == self.collection_name and expr.target in array_slices:
+                # Retrieve only the part of the array set by slice_array().
+                fields[collection][name] = {
+                    "$slice": [f"${expr.target.column}", *array_slices[expr.target]]
+                }
+                continue
+            if (
+                collection == self.collection_name
+                and name == expr.target.column
+                and (embedded_select_mask := embedded_select_masks.get(expr.target))
+            ):
+                # Project only the embedded fields loaded by only()/defer().
+                for path in self._get_embedded_paths(name, embedded_select_mask):
+                    fields[collection][path] = 1
+                continue
             try:
                 fields[collection][name] = (
                     1
@@ -839,6 +1214,43 @@ class SQLCompiler(compiler.SQLCompiler):
         # "defaultdict(<CLASS 'dict'>, ..." in query logging.
         return dict(fields)
 
+    @cached_property
+    def array_slices(self):
+        """
+        Return a dict mapping the array fields passed to
+        MongoQuerySet.slice_array() to their $slice arguments.
+        """
+        slices = get_query_option(self.query, "array_slices") or {}
+        opts = self.query.get_meta()
+        return {opts.get_field(name): args for name, args in slices.items()}
+
+    @cached_property
+    def embedded_select_masks(self):
+        """
+        Return the select masks of the embedded model fields that only() or
+        defer() partially load, e.g. {address field: {city field: {}}} for
+        only("address__city").
+        """
+        if not self.query.default_cols:
+            return {}
+        return {
+            field: select_mask
+            for field, select_mask in self.query.get_select_mask().items()
+            if select_mask and getattr(field, "embedded_model", None) is not None
+        }
+
+    @classmethod
+    def _get_embedded_paths(cls, path, select_mask):
+        """Return the dotted paths of the fields in an embedded select mask."""
+        paths = []
+        for field, field_select_mask in select_mask.items():
+            field_path = f"{path}.{field.column}"
+            if field_select_mask:
+                paths.extend(cls._get_embedded_paths(field_path, field_select_mask))
+            else:
+                paths.append(field_path)
+        return paths
+
     def _get_ordering(self):
         """
         Process the query's OrderBy objects and return:
@@ -893,15 +1305,20 @@ class SQLCompiler(compiler.SQLCompiler):
                 kwargs[option] = value
         explain = self.connection.get_database().command(
             "explain",
-            {"aggregate": self.collection_name, "pipeline": pipeline, "cursor": {}},
+            {
+                "aggregate": query.from_collection or self.collection_name,
+                "pipeline": pipeline,
+                "cursor": {},
+            },
             **kwargs,
         )
         return [json_util.dumps(explain, indent=4, ensure_ascii=False)]
 
     def as_sql(self, with_limits=True, with_col_aliases=False):
         self.pre_sql_setup()
-        pipeline = self.build_query(self.get_project_columns(self.columns)).get_pipeline()
-        return f"db.{self.collection_name}.aggregate({pipeline})", []
+        query = self.build_query(self.get_project_columns(self.columns))
+        collection_name = query.from_collection or self.collection_name
+        return f"db.{collection_name}.aggregate({query.get_pipeline()})", []
 
 
 class SQLInsertCompiler(SQLCompiler):
@@ -928,20 +1345,92 @@ class SQLInsertCompiler(SQLCompiler):
                     )
                 field_values[field.column] = value
             objs.append(field_values)
+        if self.query.on_conflict == OnConflict.UPDATE:
+            return self.upsert(objs, returning_fields=returning_fields)
         return self.insert(objs, returning_fields=returning_fields)
 
     @wrap_database_errors
     def insert(self, docs, returning_fields=None):
         """Store a list of documents using field columns as element names."""
+        if self.query.on_conflict == OnConflict.IGNORE:
+            # A write error, even an ignored one, aborts a transaction.
+            if self.connection.session is not None:
+                raise NotSupportedError(
+                    "bulk_create(ignore_conflicts=True) isn't supported in a transaction on "
+                    "MongoDB."
+                )
+            # Insert the documents that don't violate a unique constraint.
+            try:
+                self.collection.insert_many(docs, ordered=False, session=self.connection.session)
+            except BulkWriteError as e:
+                if e.details["writeConcernErrors"] or any(
+                    error["code"] != DUPLICATE_KEY_ERROR for error in e.details["writeErrors"]
+                ):
+                    raise
+            return []
         inserted_ids = self.collection.insert_many(
             docs, session=self.connection.session
         ).inserted_ids
         return [(x,) for x in inserted_ids] if returning_fields else []
 
+    @wrap_database_errors
+    def upsert(self, docs, returning_fields=None):
+        """
+        Insert the documents that don't match an existing document on the
+        query's unique_fields and set the update_fields of the others.
+        """
+        unique_columns = [field.column for field in self.query.unique_fields]
+        update_columns = [field.column for field in self.query.update_fields]
+        filters = {}
+        requests = []
+        for i, doc in enumerate(docs):
+            filter_ = {column: doc.get(column) for column in unique_columns}
+            if any(value is None for value in filter_.values()):
+                # Like NULL in SQL, a null (or unset auto primary key) value
+                # doesn't conflict with other rows, but {column: None} would
+                # match documents that are missing the field (or an upsert
+                # would insert a null _id), so the document is inserted.
+                requests.append(InsertOne(doc))
+                continue
+            update = {"$set": {column: doc[column] for column in update_columns}}
+            # Values of the filter are part of an inserted document.
+            if on_insert := {
+                column: value
+                for column, value in doc.items()
+                if column not in filter_ and column not in update["$set"]
+            }:
+                update["$setOnInsert"] = on_insert
+            filters[i] = filter_
+            requests.append(UpdateOne(filter_, update, upsert=True))
+        ids = self.collection.bulk_write(requests, session=self.connection.session).upserted_ids
+        if not returning_fields:
+            return []
+        # InsertOne sets the _id of the inserted documents.
+        ids.update({i: doc["_id"] for i, doc in enumerate(docs) if i not in filters})
+        # The ids of the updated documents aren't returned by bulk_write().
+        if updated := [i for i in filters if i not in ids]:
+            existing = self.collection.find(
+                {"$or": [filters[i] for i in updated]},
+                dict.fromkeys(unique_columns, 1),
+                session=self.connection.session,
+            )
+            # Values may be unhashable (e.g. embedded documents or arrays).
+            existing_ids = {
+                json_util.dumps([doc.get(column) for column in unique_columns]): doc["_id"]
+                for doc in existing
+            }
+            for i in updated:
+                ids[i] = existing_ids.get(json_util.dumps(list(filters[i].values())))
+        return [(ids[i],) for i in range(len(docs))]
+
     @cached_property
     def collection_name(self):
         return self.query.get_meta().db_table
 
+    def get_read_preference(self):
+        # Writes use the client's read preference.
+        return None
+
 
 class SQLDeleteCompiler(compiler.SQLDeleteCompiler, SQLCompiler):
     def execute_sql(self, result_type=MULTI):
@@ -966,6 +1455,10 @@ class SQLDeleteCompiler(compiler.SQLDeleteCompiler, SQLCompiler):
     def collection_name(self):
         return self.query.base_table
 
+    def get_read_preference(self):
+        # Writes use the client's read preference.
+        return None
+
 
 class SQLUpdateCompiler(compiler.SQLUpdateCompiler, SQLCompiler):
     def execute_sql(self, result_type):
@@ -976,51 +1469,18 @@ class SQLUpdateCompiler(compiler.SQLUpdateCompiler, SQLCompiler):
         related queries are not available.
         """
         self.pre_sql_setup()
-        values = {}
-        update_has_expression = False
-        for field, _, value in self.query.values:
-            if hasattr(value, "resolve_expression"):
-                update_has_expression = True
-                value = value.resolve_expression(self.query, allow_joins=False, for_save=True)
-                if value.contains_aggregate:
-                    raise FieldError(
-                        f"Aggregate functions are not allowed in this query ({field.name}={value})."
-                    )
-                if value.contains_over_clause:
-                    raise FieldError(
-                        f"Window expressions are not allowed in this query ({field.name}={value})."
-                    )
-            elif hasattr(value, "prepare_database_save"):
-                if field.remote_field:
-                    value = value.prepare_database_save(field)
-                elif not getattr(field, "stores_model_instance", False):
-                    raise TypeError(
-                        f"Tried to update field {field} with a model "
-                        f"instance, {value!r}. Use a value compatible with "
-                        f"{field.__class__.__name__}."
-                    )
-            prepared = field.get_db_prep_save(value, connection=self.connection)
-            if is_direct_value(value):
-                # Encrypted updates don't use aggregation expression syntax and
-                # thus must not be escaped.
-                if not self.connection.auto_encryption_opts:
-                    prepared = {"$literal": prepared}
-            else:
-                prepared = prepared.as_mql(self, self.connection, as_expr=True)
-            values[field.column] = prepared
+        values = {
+            field.column: self.prepare_value(field, value) for field, _, value in self.query.values
+        }
         try:
             criteria = self.build_query().match_mql
         except EmptyResultSet:
             return 0
         is_empty = not bool(values)
-        update_expr = [{"$set": values}]
-        if self.connection.auto_encryption_opts:
-            if update_has_expression:
-                raise NotSupportedError(
-                    "Expressions in update queries are not allowed with Queryable Encryption."
-                )
-            # Pipelines in updates are not allowed with Queryable Encryption.
-            update_expr = update_expr[0]
+        update_has_expression = any(
+            hasattr(value, "resolve_expression") for _, _, value in self.query.values
+        )
+        update_expr = self.get_update_expression(values, update_has_expression)
         rows = 0 if is_empty else self.update(criteria, update_expr)
         for query in self.query.get_related_updates():
             aux_rows = query.get_compiler(self.using).execute_sql(result_type)
@@ -1029,6 +1489,62 @@ class SQLUpdateCompiler(compiler.SQLUpdateCompiler, SQLCompiler):
                 is_empty = False
         return rows
 
+    def prepare_value(self, field, value):
+        """Return the MQL that sets field to value."""
+        if hasattr(value, "resolve_expression"):
+            value = value.resolve_expression(self.query, allow_joins=False, for_save=True)
+            if value.contains_aggregate:
+                raise FieldError(
+                    f"Aggregate functions are not allowed in this query ({field.name}={value})."
+                )
+            if value.contains_over_clause:
+                raise FieldError(
+                    f"Window expressions are not allowed in this query ({field.name}={value!r})."
+                )
+        elif hasattr(value, "prepare_database_save"):
+            if field.remote_field:
+                value = value.prepare_database_save(field)
+            elif not getattr(field, "stores_model_instance", False):
+                raise TypeError(
+                    f"Tried to update field {field} with a model "
+                    f"instance, {value!r}. Use a value compatible with "
+                    f"{field.__class__.__name__}."
+                )
+        prepared = field.get_db_prep_save(value, connection=self.connection)
+        if is_direct_value(value):
+            # Encrypted updates don't use aggregation expression syntax and
+            # thus must not be escaped.
+            if not self.connection.auto_encryption_opts:
+                prepared = {"$literal": prepared}
+        else:
+            prepared = prepared.as_mql(self, self.connection, as_expr=True)
+        return prepared
+
+    def get_update_expression(self, values, has_expression):
+        """Return the update that sets the {column: mql} in values."""
+        update_expr = [{"$set": values}]
+        if self.connection.auto_encryption_opts:
+            if has_expression:
+                raise NotSupportedError(
+                    "Expressions in update queries are not allowed with Queryable Encryption."
+                )
+            # Pipelines in updates are not allowed with Queryable Encryption.
+            update_expr = update_expr[0]
+        return update_expr
+
+    @wrap_database_errors
+    def bulk_write(self, requests, ordered=True):
+        """
+        Run the write operations in requests (e.g. pymongo.UpdateOne) and
+        return the number of matched documents.
+        """
+        return self.collection.bulk_write(
+            requests,
+            ordered=ordered,
+            **get_query_options(self.query, "bulk_write"),
+            session=self.connection.session,
+        ).matched_count
+
     @wrap_database_errors
     def update(self, criteria, pipeline):
         # If "_id" is in the criteria and is an ObjectId, the update will match
@@ -1040,7 +1556,10 @@ class SQLUpdateCompiler(compiler.SQLUpdateCompiler, SQLCompiler):
             else "update_many"
         )
         return getattr(self.collection, update_method)(
-            criteria, pipeline, session=self.connection.session
+            criteria,
+            pipeline,
+            **get_query_options(self.query, update_method),
+            session=self.connection.session,
         ).matched_count
 
     def check_query(self):
@@ -1057,6 +1576,10 @@ class SQLUpdateCompiler(compiler.SQLUpdateCompiler, SQLCompiler):
     def collection_name(self):
         return self.query.base_table
 
+    def get_read_preference(self):
+        # Writes use the client's read preference.
+        return None
+
 
 class SQLAggregateCompiler(SQLCompiler):
     def build_query(self, columns=None):
@@ -1071,5 +1594,11 @@ class SQLAggregateCompiler(SQLCompiler):
         query.subqueries = [subquery]
         return query
 
+    def get_count_arguments(self, query):
+        # Count the results of the subquery, e.g. a sliced or distinct query.
+        if not self._is_count_query():
+            return None
+        return get_count_arguments(query.subqueries[0].get_pipeline())
+
     def _make_result(self, result, columns=None):
         return [result[k] for k in self.query.annotation_select]
@@ -0,0 +1,64 @@
+def preserves_null(converter):
+    """
+    Mark a database converter as one that returns None when the value is None
+    so that the compiled converters of get_chunk_converter() can skip calling
+    it for None.
+    """
+    converter.preserves_null = True
+    return converter
+
+
+def all_preserve_null(converters):
+    """Return True if all the converters are marked with preserves_null()."""
+    return all(getattr(converter, "preserves_null", False) for converter in converters)
+
+
+def fuse_converters(converters):
+    """Return a converter that applies each of the converters in turn."""
+    if len(converters) == 1:
+        return converters[0]
+
+    def convert(value, expression, connection):
+        for converter in converters:
+            value = converter(value, expression, connection)
+        return value
+
+    return convert
+
+
+def get_chunk_converter(converters, connection):
+    """
+    Compile the converters returned by SQLCompiler.get_converters() (a dict
+    mapping column positions to (converters, expression)) into a function
+    that converts, in place, each row (a list) of a chunk of results.
+    """
+    columns = [
+        (
+            position,
+            fuse_converters(column_converters),
+            expression,
+            all_preserve_null(column_converters),
+        )
+        for position, (column_converters, expression) in converters.items()
+    ]
+    if len(columns) == 1:
+        ((position, convert, expression, skip_null),) = columns
+
+        def convert_chunk(chunk):
+            for row in chunk:
+                value = row[position]
+                if value is not None or not skip_null:
+                    row[position] = convert(value, expression, connection)
+            return chunk
+
+    else:
+
+        def convert_chunk(chunk):
+            for row in chunk:
+                for position, convert, expression, skip_null in columns:
+                    value = row[position]
+                    if value is not None or not skip_null:
+                        row[position] = convert(value, expression, connection)
+            return chunk
+
+    return convert_chunk
@@ -1,6 +1,123 @@
-from django.db.models.expressions import Func
+from copy import copy
+
+from django.core.exceptions import FullResultSet
+from django.db.models import BooleanField, Q
+from django.db.models.expressions import Col, Expression, F, Func
+from django.db.models.lookups import Lookup
+from django.db.models.sql.query import Query
+from django.db.models.sql.where import XOR, WhereNode
 
 
 class Remove(Func):
     def as_mql(self, compiler, connection, as_expr=False):
         return "$$REMOVE"
+
+
+class ElemMatch(Expression):
+    """
+    Filter on the elements of an EmbeddedModelArrayField: match documents
+    that have at least one element that matches all of the conditions (a Q
+    object and/or keyword arguments, using the embedded model's field names),
+    e.g. ElemMatch("reviews", rating__gte=4, title__startswith="Great").
+    """
+
+    conditional = True
+    output_field = BooleanField()
+    # The name of the variable of each element in as_mql_expr().
+    VIRTUAL_COLUMN_ITERABLE = "item"
+
+    def __init__(self, field_name, *args, **kwargs):
+        if not args and not kwargs:
+            raise ValueError("ElemMatch requires at least one condition.")
+        super().__init__()
+        self.array = F(field_name)
+        self.condition = Q(*args, **kwargs)
+        self.where = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.array!r}, {self.condition!r})"
+
+    def as_sql(self, compiler, connection):
+        # The SQL compiler compiles annotations before as_mql() is used.
+        return "", []
+
+    def get_source_expressions(self):
+        return [self.array]
+
+    def set_source_expressions(self, exprs):
+        (self.array,) = exprs
+
+    def resolve_expression(
+        self, query=None, allow_joins=True, reuse=None, summarize=False, for_save=False
+    ):
+        from django_mongodb_backend.fields import EmbeddedModelArrayField  # noqa: PLC0415
+
+        c = super().resolve_expression(query, allow_joins, reuse, summarize, for_save)
+        field = c.array.output_field
+        if not isinstance(field, EmbeddedModelArrayField):
+            raise TypeError(
+                f"ElemMatch requires an EmbeddedModelArrayField, not {field.__class__.__name__}."
+            )
+        # The conditions are resolved against the embedded model. Without
+        # column aliases, its columns are the paths within each element.
+        c.where = Query(field.base_field.embedded_model, alias_cols=False).build_where(c.condition)
+        return c
+
+    @property
+    def can_use_path(self):
+        return self.array.is_simple_column and self._can_use_path(self.where)
+
+    @classmethod
+    def _can_use_path(cls, node):
+        if isinstance(node, WhereNode):
+            return node.connector != XOR and all(cls._can_use_path(c) for c in node.children)
+        return isinstance(node, Lookup) and node.can_use_path
+
+    def as_mql_path(self, compiler, connection):
+        lhs_mql = self.array.as_mql(compiler, connection)
+        try:
+            condition = self.where.as_mql(compiler, connection)
+        except FullResultSet:
+            # Any element matches.
+            return {f"{lhs_mql}.0": {"$exists": True}}
+        return {lhs_mql: {"$elemMatch": condition}}
+
+    def as_mql_expr(self, compiler, connection):
+        lhs_mql = self.array.as_mql(compiler, connection, as_expr=True)
+        try:
+            condition = self._get_element_where().as_mql(compiler, connection, as_expr=True)
+        except FullResultSet:
+            condition = True
+        return {
+            "$anyElementTrue": {
+                "$ifNull": [
+                    {
+                        "$map": {
+                            "input": lhs_mql,
+                            "as": self.VIRTUAL_COLUMN_ITERABLE,
+                            "in": condition,
+                        }
+                    },
+                    [],
+                ]
+            }
+        }
+
+    def _get_element_where(self):
+        """
+        Return the conditions with columns that refer to the variable of each
+        element in as_mql_expr(), e.g. "$$item.rating" rather than "$rating".
+        """
+        replacements = {}
+        nodes = [self.where]
+        while nodes:
+            node = nodes.pop()
+            if isinstance(node, WhereNode):
+                nodes.extend(node.children)
+                continue
+            if isinstance(node, Col) and node not in replacements:
+                target = copy(node.target)
+                target.column = f"${self.VIRTUAL_COLUMN_ITERABLE}.{node.target.column}"
+                replacements[node] = Col(None, target)
+            nodes.extend(expr for expr in node.get_source_expressions() if expr is not None)
+        return self.where.replace_expressions(replacements)
@@ -77,6 +77,7 @@ class SearchExpression(SearchCombinable, Expression):
     """
 
     output_field = FloatField()
+    search_index_type = "search"
 
     def __str__(self):
         cls = self.identity[0]
@@ -106,15 +107,22 @@ class SearchExpression(SearchCombinable, Expression):
                 for path in self._get_indexed_fields(definition):
                     yield f"{field}.{path}"
 
-    def _get_query_index(self, fields, compiler):
-        fields = set(fields)
-        for search_indexes in compiler.collection.list_search_indexes():
-            mappings = search_indexes["latestDefinition"]["mappings"]
+    def _find_query_index(self, fields, search_indexes):
+        for search_index in search_indexes:
+            mappings = search_index["latestDefinition"]["mappings"]
             indexed_fields = set(self._get_indexed_fields(mappings))
             if mappings["dynamic"] or fields.issubset(indexed_fields):
-                return search_indexes["name"]
+                return search_index["name"]
         return "default"
 
+    def _get_query_index(self, fields, compiler):
+        fields = frozenset(fields)
+        return compiler.connection.search_index_cache.get_index(
+            compiler.collection,
+            (self.search_index_type, fields),
+            lambda search_indexes: self._find_query_index(fields, search_indexes),
+        )
+
     def search_operator(self, compiler, connection):
         raise NotImplementedError
 
@@ -850,6 +858,8 @@ class SearchVector(SearchExpression):
     Reference: https://www.mongodb.com/docs/atlas/atlas-vector-search/vector-search-stage/
     """
 
+    search_index_type = "vectorSearch"
+
     def __init__(
         self,
         path,
@@ -886,14 +896,14 @@ class SearchVector(SearchExpression):
     def get_search_fields(self, compiler, connection):
         return {self.path.as_mql(compiler, connection)}
 
-    def _get_query_index(self, fields, compiler):
-        for search_indexes in compiler.collection.list_search_indexes():
-            if search_indexes["type"] == "vectorSearch":
+    def _find_query_index(self, fields, search_indexes):
+        for search_index in search_indexes:
+            if search_index["type"] == "vectorSearch":
                 index_field = {
-                    field["path"] for field in search_indexes["latestDefinition"]["fields"]
+                    field["path"] for field in search_index["latestDefinition"]["fields"]
                 }
                 if fields.issubset(index_field):
-                    return search_indexes["name"]
+                    return search_index["name"]
         return "default"
 
     def as_mql(self, compiler, connection, as_expr=False):
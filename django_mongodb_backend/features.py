@@ -1,5 +1,4 @@
 from django.core.exceptions import ImproperlyConfigured
-from django.core.management.base import CommandError
 from django.db import NotSupportedError
 from django.db.backends.base.features import BaseDatabaseFeatures
 from django.utils.functional import cached_property
@@ -24,6 +23,7 @@ class DatabaseFeatures(GISFeatures, BaseDatabaseFeatures):
     has_json_object_function = False
     has_native_json_field = True
     rounds_to_even = True
+    supports_aggregate_order_by_clause = True
     supports_boolean_expr_in_select_clause = True
     supports_collation_on_charfield = False
     supports_column_check_constraints = False
@@ -33,11 +33,11 @@ class DatabaseFeatures(GISFeatures, BaseDatabaseFeatures):
     supports_expression_defaults = False
     supports_expression_indexes = False
     supports_foreign_keys = False
-    supports_ignore_conflicts = False
-    supports_json_field_contains = False
+    supports_ignore_conflicts = True
     # BSON Date type doesn't support microsecond precision.
     supports_microsecond_precision = False
     supports_nulls_distinct_unique_constraints = True
+    supports_over_clause = True
     supports_paramstyle_pyformat = False
     supports_sequence_reset = False
     supports_slicing_ordering_in_compound = True
@@ -50,6 +50,8 @@ class DatabaseFeatures(GISFeatures, BaseDatabaseFeatures):
     # django.db.transaction.atomic() is a no-op on this backend.
     supports_transactions = False
     supports_unspecified_pk = True
+    supports_update_conflicts = True
+    supports_update_conflicts_with_target = True
     uses_savepoints = False
 
     _django_test_expected_failures = {
@@ -87,6 +89,10 @@ class DatabaseFeatures(GISFeatures, BaseDatabaseFeatures):
         # is of type: null"
         # https://jira.mongodb.org/browse/SERVER-99186
         "model_fields_.test_arrayfield.QueryingTests.test_contained_by_subquery",
+        # JSONField's contained_by lookup isn't supported, nor is contains with
+        # a non-constant value, e.g. KeyTransform("bax", "value").
+        "model_fields.test_jsonfield.TestQuerying.test_contained_by",
+        "model_fields.test_jsonfield.TestQuerying.test_contains_contained_by_with_key_transform",
         # Value.as_mql() doesn't call output_field.get_db_prep_save():
         # https://github.com/mongodb/django-mongodb-backend/issues/282
         "model_fields.test_jsonfield.TestSaveLoad.test_bulk_update_custom_get_prep_value",
@@ -185,8 +191,10 @@ class DatabaseFeatures(GISFeatures, BaseDatabaseFeatures):
             "aggregation.tests.AggregateAnnotationPruningTests.test_unused_aliased_aggregate_pruned",
             "aggregation.tests.AggregateAnnotationPruningTests.test_referenced_aggregate_annotation_kept",
             "aggregation.tests.AggregateTestCase.test_count_star",
+            "aggregation.tests.AggregateTestCase.test_referenced_window_requires_wrapping",
             "delete.tests.DeletionTests.test_only_referenced_fields_selected",
             "expressions.tests.ExistsTests.test_optimizations",
+            "expressions_window.tests.WindowFunctionTests.test_filter_count",
             "lookup.tests.LookupTests.test_in_ignore_none",
             "lookup.tests.LookupTests.test_lookup_direct_value_rhs_unwrapped",
             "lookup.tests.LookupTests.test_textfield_exact_null",
@@ -216,6 +224,10 @@ class DatabaseFeatures(GISFeatures, BaseDatabaseFeatures):
             "expressions.tests.BasicExpressionsTests.test_ticket_18375_kwarg_ordering",
             "expressions.tests.BasicExpressionsTests.test_ticket_18375_kwarg_ordering_2",
             "expressions_case.tests.CaseExpressionTests.test_m2m_reuse",
+            "expressions_window.tests.WindowFunctionTests.test_range_unbound",
+            "expressions_window.tests.WindowFunctionTests.test_row_range_both_following",
+            "expressions_window.tests.WindowFunctionTests.test_row_range_both_preceding",
+            "expressions_window.tests.WindowFunctionTests.test_row_range_rank",
             "filtered_relation.tests.FilteredRelationTests.test_internal_queryset_alias_mapping",
             "generic_relations_regress.tests.GenericRelationTests.test_join_reuse",
             "lookup.tests.LookupTests.test_in_keeps_value_ordering",
@@ -265,6 +277,13 @@ class DatabaseFeatures(GISFeatures, BaseDatabaseFeatures):
             "db_functions.text.test_sha384.SHA384Tests",
             "db_functions.text.test_sha512.SHA512Tests",
         },
+        "MongoDB doesn't support CumeDist, NthValue, Ntile, and PercentRank.": {
+            "expressions_window.tests.WindowFunctionTests.test_cume_dist",
+            "expressions_window.tests.WindowFunctionTests.test_nth_returns_null",
+            "expressions_window.tests.WindowFunctionTests.test_nthvalue",
+            "expressions_window.tests.WindowFunctionTests.test_ntile",
+            "expressions_window.tests.WindowFunctionTests.test_percent_rank",
+        },
         "MongoDB can't annotate ($project) a function like PI().": {
             "aggregation.tests.AggregateTestCase.test_aggregation_default_using_decimal_from_database",
             "db_functions.math.test_pi.PiTests.test",
@@ -434,13 +453,6 @@ class DatabaseFeatures(GISFeatures, BaseDatabaseFeatures):
             # django_test_expected_raises doesn't work with async def.
             "async.test_async_queryset.AsyncQuerySetTest.test_raw",
         },
-        "QuerySet.prefetch_related() is not supported on MongoDB.": {
-            # django_test_expected_raises doesn't work with subTest.
-            "prefetch_related.test_prefetch_related_objects.PrefetchRelatedObjectsTests.test_m2m_forward",
-            "prefetch_related.test_prefetch_related_objects.PrefetchRelatedObjectsTests.test_prefetch_related_objects_with_various_iterables",
-            "prefetch_related.tests.CustomPrefetchTests.test_filter_deferred",
-            "prefetch_related.tests.PrefetchRelatedTests.test_filter_deferred",
-        },
     }
 
     @cached_property
@@ -475,96 +487,10 @@ class DatabaseFeatures(GISFeatures, BaseDatabaseFeatures):
             "expressions.tests.BasicExpressionsTests.test_object_create_with_aggregate",
             "expressions.tests.BasicExpressionsTests.test_object_create_with_f_expression_in_subquery",
             "expressions.tests.BasicExpressionsTests.test_object_update_unsaved_objects",
+            "expressions_window.tests.WindowFunctionTests.test_fail_insert",
             "db_functions.math.test_round.RoundTests.test_decimal_with_precision",
             "db_functions.math.test_round.RoundTests.test_float_with_precision",
         },
-        (
-            CommandError,
-            "Unable to serialize database: QuerySet.prefetch_related() is not "
-            "supported on MongoDB.",
-        ): {
-            "fixtures.tests.FixtureLoadingTests.test_dumpdata_objects_with_prefetch_related",
-        },
-        (NotSupportedError, "QuerySet.prefetch_related() is not supported on MongoDB."): {
-            "backends.base.test_creation.TestDeserializeDbFromString.test_serialize_db_to_string_base_manager_with_prefetch_related",
-            "fixtures.tests.FixtureLoadingTests.test_loading_and_dumping",
-            "m2m_through_regress.test_multitable.MultiTableTests.test_m2m_prefetch_proxied",
-            "m2m_through_regress.test_multitable.MultiTableTests.test_m2m_prefetch_reverse_proxied",
-            "many_to_many.tests.ManyToManyQueryTests.test_prefetch_related_no_queries_optimization_disabled",
-            "many_to_many.tests.ManyToManyTests.test_add_after_prefetch",
-            "many_to_many.tests.ManyToManyTests.test_add_then_remove_after_prefetch",
-            "many_to_many.tests.ManyToManyTests.test_clear_after_prefetch",
-            "many_to_many.tests.ManyToManyTests.test_create_after_prefetch",
-            "many_to_many.tests.ManyToManyTests.test_remove_after_prefetch",
-            "many_to_many.tests.ManyToManyTests.test_set_after_prefetch",
-            "model_forms.tests.OtherModelFormTests.test_prefetch_related_queryset",
-            "prefetch_related.test_prefetch_related_objects.PrefetchRelatedObjectsTests.test_m2m_reverse",
-            "prefetch_related.test_prefetch_related_objects.PrefetchRelatedObjectsTests.test_m2m_then_m2m",
-            "prefetch_related.test_prefetch_related_objects.PrefetchRelatedObjectsTests.test_prefetch_object",
-            "prefetch_related.test_prefetch_related_objects.PrefetchRelatedObjectsTests.test_prefetch_object_to_attr",
-            "prefetch_related.test_prefetch_related_objects.PrefetchRelatedObjectsTests.test_prefetch_object_to_attr_twice",
-            "prefetch_related.test_prefetch_related_objects.PrefetchRelatedObjectsTests.test_prefetch_object_twice",
-            "prefetch_related.test_prefetch_related_objects.PrefetchRelatedObjectsTests.test_prefetch_queryset",
-            "prefetch_related.test_uuid.UUIDPrefetchRelated.test_prefetch_related_from_uuid_model",
-            "prefetch_related.test_uuid.UUIDPrefetchRelated.test_prefetch_related_from_uuid_model_to_uuid_model",
-            "prefetch_related.test_uuid.UUIDPrefetchRelated.test_prefetch_related_to_uuid_model",
-            "prefetch_related.test_uuid.UUIDPrefetchRelatedLookups.test_from_integer_pk_lookup_integer_pk_uuid_pk_uuid_pk",
-            "prefetch_related.test_uuid.UUIDPrefetchRelatedLookups.test_from_integer_pk_lookup_uuid_pk_integer_pk",
-            "prefetch_related.test_uuid.UUIDPrefetchRelatedLookups.test_from_uuid_pk_lookup_integer_pk2_uuid_pk2",
-            "prefetch_related.test_uuid.UUIDPrefetchRelatedLookups.test_from_uuid_pk_lookup_uuid_pk_integer_pk",
-            "prefetch_related.tests.CustomPrefetchTests.test_ambiguous",
-            "prefetch_related.tests.CustomPrefetchTests.test_custom_qs",
-            "prefetch_related.tests.CustomPrefetchTests.test_m2m",
-            "prefetch_related.tests.CustomPrefetchTests.test_m2m_through_fk",
-            "prefetch_related.tests.CustomPrefetchTests.test_nested_prefetch_related_are_not_overwritten",
-            "prefetch_related.tests.CustomPrefetchTests.test_nested_prefetch_related_with_duplicate_prefetch_and_depth",
-            "prefetch_related.tests.CustomPrefetchTests.test_nested_prefetch_related_with_duplicate_prefetcher",
-            "prefetch_related.tests.CustomPrefetchTests.test_o2m_through_m2m",
-            "prefetch_related.tests.CustomPrefetchTests.test_reverse_m2m",
-            "prefetch_related.tests.CustomPrefetchTests.test_to_attr_cached_property",
-            "prefetch_related.tests.CustomPrefetchTests.test_traverse_multiple_items_property",
-            "prefetch_related.tests.CustomPrefetchTests.test_traverse_qs",
-            "prefetch_related.tests.CustomPrefetchTests.test_traverse_single_item_property",
-            "prefetch_related.tests.DefaultManagerTests.test_m2m_then_m2m",
-            "prefetch_related.tests.ForeignKeyToFieldTest.test_m2m",
-            "prefetch_related.tests.GenericRelationTests.test_traverse_GFK",
-            "prefetch_related.tests.LookupOrderingTest.test_order",
-            "prefetch_related.tests.MultiDbTests.test_using_is_honored_m2m",
-            "prefetch_related.tests.MultiTableInheritanceTest.test_m2m_to_inheriting_model",
-            "prefetch_related.tests.PrefetchRelatedMTICacheTests.test_add_clears_prefetched_objects_in_grandparent",
-            "prefetch_related.tests.PrefetchRelatedMTICacheTests.test_add_clears_prefetched_objects_in_parent",
-            "prefetch_related.tests.PrefetchRelatedMTICacheTests.test_grandparent_m2m_available_in_child",
-            "prefetch_related.tests.PrefetchRelatedMTICacheTests.test_parent_m2m_available_in_child",
-            "prefetch_related.tests.PrefetchRelatedMTICacheTests.test_remove_clears_prefetched_objects_in_grandparent",
-            "prefetch_related.tests.PrefetchRelatedMTICacheTests.test_remove_clears_prefetched_objects_in_parent",
-            "prefetch_related.tests.PrefetchRelatedTests.test_attribute_error",
-            "prefetch_related.tests.PrefetchRelatedTests.test_foreign_key_then_m2m",
-            "prefetch_related.tests.PrefetchRelatedTests.test_forward_m2m_to_attr_conflict",
-            "prefetch_related.tests.PrefetchRelatedTests.test_get",
-            "prefetch_related.tests.PrefetchRelatedTests.test_invalid_final_lookup",
-            "prefetch_related.tests.PrefetchRelatedTests.test_m2m_forward",
-            "prefetch_related.tests.PrefetchRelatedTests.test_m2m_join_reuse",
-            "prefetch_related.tests.PrefetchRelatedTests.test_m2m_prefetching_iterator_with_chunks",
-            "prefetch_related.tests.PrefetchRelatedTests.test_m2m_reverse",
-            "prefetch_related.tests.PrefetchRelatedTests.test_m2m_then_m2m",
-            "prefetch_related.tests.PrefetchRelatedTests.test_m2m_then_m2m_object_ids",
-            "prefetch_related.tests.PrefetchRelatedTests.test_m2m_then_reverse_fk_object_ids",
-            "prefetch_related.tests.PrefetchRelatedTests.test_m2m_then_reverse_one_to_one_object_ids",
-            "prefetch_related.tests.PrefetchRelatedTests.test_overriding_prefetch",
-            "prefetch_related.tests.PrefetchRelatedTests.test_reverse_m2m_to_attr_conflict",
-            "prefetch_related.tests.PrefetchRelatedTests.test_reverse_one_to_one_then_m2m",
-            "prefetch_related.tests.ReadPrefetchedObjectsCacheTests.test_retrieves_results_from_prefetched_objects_cache",
-            "prefetch_related.tests.Ticket21410Tests.test_bug",
-            "queryset_pickle.tests.PickleabilityTestCase.test_pickle_prefetch_related_with_m2m_and_objects_deletion",
-            "serializers.test_json.JsonSerializerTestCase.test_serialize_prefetch_related_m2m",
-            "serializers.test_json.JsonSerializerTestCase.test_serialize_prefetch_related_m2m_with_natural_keys",
-            "serializers.test_jsonl.JsonlSerializerTestCase.test_serialize_prefetch_related_m2m",
-            "serializers.test_jsonl.JsonlSerializerTestCase.test_serialize_prefetch_related_m2m_with_natural_keys",
-            "serializers.test_xml.XmlSerializerTestCase.test_serialize_prefetch_related_m2m",
-            "serializers.test_xml.XmlSerializerTestCase.test_serialize_prefetch_related_m2m_with_natural_keys",
-            "serializers.test_yaml.YamlSerializerTestCase.test_serialize_prefetch_related_m2m",
-            "serializers.test_yaml.YamlSerializerTestCase.test_serialize_prefetch_related_m2m_with_natural_keys",
-        },
         (
             NotSupportedError,
             "Cannot use QuerySet.update() when querying across multiple collections on MongoDB.",
@@ -706,13 +632,6 @@ class DatabaseFeatures(GISFeatures, BaseDatabaseFeatures):
         (NotSupportedError, "TruncDate with tzinfo (Africa/Nairobi) isn't supported on MongoDB."): {
             "timezones.tests.NewDatabaseTests.test_query_convert_timezones",
         },
-        (NotSupportedError, "StringAgg is not supported."): {
-            "aggregation.tests.AggregateTestCase.test_distinct_on_stringagg",
-            "aggregation.tests.AggregateTestCase.test_string_agg_escapes_delimiter",
-            "aggregation.tests.AggregateTestCase.test_string_agg_filter",
-            "aggregation.tests.AggregateTestCase.test_string_agg_filter_in_subquery",
-            "aggregation.tests.AggregateTestCase.test_stringagg_default_value",
-        },
         (NotSupportedError, "ColPairs is not supported."): {
             "composite_pk.tests.CompositePKTests.test_in_bulk",
             "composite_pk.tests.CompositePKTests.test_in_bulk_batching",
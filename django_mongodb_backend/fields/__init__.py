@@ -1,7 +1,7 @@
 from .array import ArrayField
 from .auto import ObjectIdAutoField
 from .duration import register_duration_field
-from .embedded_model import EmbeddedModelField
+from .embedded_model import EmbeddedModelField, register_embedded_model_field
 from .embedded_model_array import EmbeddedModelArrayField
 from .encryption import (
     EncryptedArrayField,
@@ -74,4 +74,5 @@ __all__ = [
 
 def register_fields():
     register_duration_field()
+    register_embedded_model_field()
     register_json_field()
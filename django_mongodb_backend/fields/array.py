@@ -7,6 +7,7 @@ from django.db.models.lookups import Exact, FieldGetDbPrepValueMixin, In, Lookup
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
+from django_mongodb_backend.fields.mixins import PartiallyLoadedMixin
 from django_mongodb_backend.forms import SimpleArrayField
 from django_mongodb_backend.query_utils import is_constant_value, process_lhs, process_rhs
 from django_mongodb_backend.utils import prefix_validation_error
@@ -20,7 +21,7 @@ class AttributeSetter:
         setattr(self, name, value)
 
 
-class ArrayField(CheckFieldDefaultMixin, Field):
+class ArrayField(CheckFieldDefaultMixin, PartiallyLoadedMixin, Field):
     empty_strings_allowed = False
     default_error_messages = {
         "item_invalid": _("Item %(nth)s in the array did not validate:"),
@@ -298,6 +299,13 @@ class ArrayContainedBy(ArrayRHSMixin, FieldGetDbPrepValueMixin, Lookup):
             ]
         }
 
+    def as_mql_path(self, compiler, connection):
+        lhs_mql = process_lhs(self, compiler, connection)
+        value = process_rhs(self, compiler, connection)
+        # Match arrays without any element outside of value. $type excludes
+        # null and missing fields, which $not would otherwise match.
+        return {lhs_mql: {"$type": "array", "$not": {"$elemMatch": {"$nin": value}}}}
+
 
 @ArrayField.register_lookup
 class ArrayExact(ArrayRHSMixin, Exact):
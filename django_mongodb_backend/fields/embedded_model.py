@@ -1,18 +1,21 @@
 import difflib
 
 from django.core import checks
-from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.exceptions import FieldDoesNotExist, FieldError, ValidationError
 from django.db import models
+from django.db.models.constants import LOOKUP_SEP
 from django.db.models.fields.related import lazy_related_operation
 from django.db.models.lookups import Transform
+from django.db.models.sql.query import Query
 from django.utils.functional import cached_property
 
 from django_mongodb_backend import forms
 
+from .mixins import LazyEmbeddedModelMixin, PartiallyLoadedMixin
 from .utils import serialize_model_reference
 
 
-class EmbeddedModelField(models.Field):
+class EmbeddedModelField(PartiallyLoadedMixin, LazyEmbeddedModelMixin, models.Field):
     """Field that stores a model instance."""
 
     stores_model_instance = True
@@ -21,6 +24,9 @@ class EmbeddedModelField(models.Field):
         """
         `embedded_model` is the model class of the instance to be stored.
         Like other relational fields, it may also be passed as a string.
+
+        If `lazy` is True, the instance isn't built when a model is loaded
+        from the database but when the field's attribute is first accessed.
         """
         self.embedded_model = embedded_model
         super().__init__(*args, **kwargs)
@@ -232,3 +238,80 @@ class EmbeddedModelTransformFactory:
 
     def __call__(self, *args, **kwargs):
         return EmbeddedModelTransform(self.field, *args, **kwargs)
+
+
+def _get_embedded_select_mask(model, mask, defer):
+    """
+    Return the select mask of an embedded model: a dict mapping the fields to
+    load to their own select masks (an empty dict meaning the whole field).
+    `mask` is the tree of field names passed to only() or, if `defer` is
+    True, to defer().
+    """
+    select_mask = {}
+    for field in model._meta.concrete_fields:
+        field_mask = mask.pop(field.name, None)
+        if field_mask is None:
+            if defer:
+                select_mask[field] = {}
+        elif field_mask:
+            embedded_model = getattr(field, "embedded_model", None)
+            if embedded_model is None:
+                raise FieldError(
+                    f"{model._meta.object_name}.{field.name} is not an embedded model field."
+                )
+            if field_select_mask := _get_embedded_select_mask(embedded_model, field_mask, defer):
+                select_mask[field] = field_select_mask
+        elif not defer:
+            select_mask[field] = {}
+    # Remaining names don't refer to fields of the embedded model.
+    for name in mask:
+        model._meta.get_field(name)
+    return select_mask
+
+
+_get_select_mask = Query.get_select_mask
+
+
+def get_select_mask(self):
+    """
+    Support paths through EmbeddedModelField and EmbeddedModelArrayField in
+    QuerySet.only() and defer(), e.g. only("address__city"). The select mask
+    of such a field is the select mask of its embedded model.
+    """
+    field_names, defer = self.deferred_loading
+    if not any(LOOKUP_SEP in name for name in field_names):
+        return _get_select_mask(self)
+    mask = {}
+    for field_name in field_names:
+        part_mask = mask
+        for part in field_name.split(LOOKUP_SEP):
+            part_mask = part_mask.setdefault(part, {})
+    opts = self.get_meta()
+    embedded_select_masks = {}
+    for name, field_mask in list(mask.items()):
+        try:
+            field = opts.get_field(name)
+        except FieldDoesNotExist:
+            continue
+        embedded_model = getattr(field, "embedded_model", None)
+        if not field_mask or embedded_model is None:
+            continue
+        if embedded_select_mask := _get_embedded_select_mask(embedded_model, field_mask, defer):
+            embedded_select_masks[field] = embedded_select_mask
+        if defer and embedded_select_mask:
+            # The field is partially loaded rather than deferred.
+            del mask[name]
+        else:
+            # Load the field with only(), or defer it if defer() was given
+            # all of the embedded model's fields.
+            mask[name] = {}
+    if defer:
+        select_mask = self._get_defer_select_mask(opts, mask)
+    else:
+        select_mask = self._get_only_select_mask(opts, mask)
+    select_mask.update(embedded_select_masks)
+    return select_mask
+
+
+def register_embedded_model_field():
+    Query.get_select_mask = get_select_mask
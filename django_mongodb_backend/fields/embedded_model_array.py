@@ -12,11 +12,11 @@ from django_mongodb_backend.fields import EmbeddedModelField
 from django_mongodb_backend.fields.array import ArrayField, ArrayLenTransform
 from django_mongodb_backend.query_utils import process_lhs, process_rhs
 
-from .mixins import NoEncryptedEmbeddedFieldsMixin
+from .mixins import LazyEmbeddedModelMixin, NoEncryptedEmbeddedFieldsMixin
 from .utils import serialize_model_reference
 
 
-class EmbeddedModelArrayField(NoEncryptedEmbeddedFieldsMixin, ArrayField):
+class EmbeddedModelArrayField(NoEncryptedEmbeddedFieldsMixin, LazyEmbeddedModelMixin, ArrayField):
     def __init__(self, embedded_model, **kwargs):
         if "size" in kwargs:
             raise ValueError("EmbeddedModelArrayField does not support size.")
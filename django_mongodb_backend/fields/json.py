@@ -2,6 +2,7 @@ from functools import partialmethod
 from itertools import chain
 
 from django.db import NotSupportedError
+from django.db.models import JSONField
 from django.db.models.fields.json import (
     ContainedBy,
     DataContains,
@@ -17,7 +18,11 @@ from django.db.models.fields.json import (
     KeyTransformNumericLookupMixin,
 )
 
-from django_mongodb_backend.lookups import builtin_lookup_expr, builtin_lookup_path
+from django_mongodb_backend.lookups import (
+    builtin_lookup_expr,
+    builtin_lookup_path,
+    lookup_can_use_path,
+)
 from django_mongodb_backend.query_utils import process_lhs, process_rhs
 
 
@@ -58,8 +63,71 @@ def contained_by(self, compiler, connection, as_expr=False):  # noqa: ARG001
     raise NotSupportedError("contained_by lookup is not supported on this database backend.")
 
 
-def data_contains(self, compiler, connection, as_expr=False):  # noqa: ARG001
-    raise NotSupportedError("contains lookup is not supported on this database backend.")
+def data_contains_expr(self, compiler, connection):  # noqa: ARG001
+    raise NotSupportedError(
+        "contains lookup is only supported on this database backend for a "
+        "constant value on a JSONField or a key with a valid path name."
+    )
+
+
+def _contains_predicates(path, value):
+    """
+    Return a list of path MQL conditions that match documents whose value at
+    `path` contains `value`: objects are matched key by key, arrays must
+    include every item (objects in arrays are matched with $elemMatch), and
+    scalars must be equal.
+    """
+    if isinstance(value, dict):
+        if not value:
+            return [{path: {"$type": "object"}}]
+        return [
+            predicate
+            for key, item in value.items()
+            for predicate in _contains_predicates(key if path is None else f"{path}.{key}", item)
+        ]
+    if isinstance(value, list):
+        if not value:
+            return [{path: {"$type": "array"}}]
+        if not any(isinstance(item, dict) for item in value):
+            return [{path: {"$all": value}}]
+        predicates = []
+        for item in value:
+            if isinstance(item, dict):
+                # Paths are relative to the array's items in $elemMatch.
+                condition = (
+                    {"$and": _contains_predicates(None, item)} if item else {"$type": "object"}
+                )
+                predicates.append({path: {"$elemMatch": condition}})
+            else:
+                predicates.append({path: item})
+        return predicates
+    if value is None:
+        # Unlike {path: None}, don't match a missing key.
+        return [{path: {"$exists": True, "$eq": None}}]
+    return [{path: value}]
+
+
+def data_contains_path(self, compiler, connection):
+    lhs_mql = process_lhs(self, compiler, connection)
+    value = process_rhs(self, compiler, connection)
+    predicates = _contains_predicates(lhs_mql, value)
+    return predicates[0] if len(predicates) == 1 else {"$and": predicates}
+
+
+def _is_valid_contains_value(value):
+    if isinstance(value, dict):
+        return all(
+            valid_path_key_name(key) and _is_valid_contains_value(item)
+            for key, item in value.items()
+        )
+    if isinstance(value, list):
+        return all(_is_valid_contains_value(item) for item in value)
+    return True
+
+
+@property
+def data_contains_can_use_path(self):
+    return lookup_can_use_path.fget(self) and _is_valid_contains_value(self.rhs)
 
 
 def _has_key_predicate(path, root_column=None, negated=False, as_expr=False):
@@ -213,9 +281,44 @@ def key_transform_numeric_lookup_mixin_expr(self, compiler, connection):
     return {"$and": [expr, not_missing_or_null]}
 
 
+_json_field_from_db_value = JSONField.from_db_value
+_json_field_get_db_converters = JSONField.get_db_converters
+
+
+def reads_decoded_bson(field):
+    """
+    Return True if the values of the JSONField (or a field with the same
+    internal type) can be returned as decoded from BSON, which is the case
+    unless the field decodes them with a custom decoder or from_db_value().
+    """
+    return (
+        getattr(field, "decoder", None) is None
+        and getattr(type(field), "from_db_value", None) is json_field_from_db_value
+    )
+
+
+def json_field_from_db_value(self, value, expression, connection):
+    """
+    Return values decoded from BSON as is rather than decoding them from a
+    JSON string.
+    """
+    if connection.vendor == "mongodb" and reads_decoded_bson(self):
+        return value
+    return _json_field_from_db_value(self, value, expression, connection)
+
+
+def json_field_get_db_converters(self, connection):
+    # Values decoded from BSON don't need converting.
+    if connection.vendor == "mongodb" and reads_decoded_bson(self):
+        return []
+    return _json_field_get_db_converters(self, connection)
+
+
 def register_json_field():
     ContainedBy.as_mql = contained_by
-    DataContains.as_mql = data_contains
+    DataContains.as_mql_expr = data_contains_expr
+    DataContains.as_mql_path = data_contains_path
+    DataContains.can_use_path = data_contains_can_use_path
     HasAnyKeys.mongo_operator = "$or"
     HasKey.mongo_operator = None
     HasKeyLookup.as_mql_expr = partialmethod(has_key_lookup, as_expr=True)
@@ -223,6 +326,8 @@ def register_json_field():
     HasKeyLookup.can_use_path = has_key_lookup_can_use_path
     HasKeys.mongo_operator = "$and"
     JSONExact.process_rhs = json_exact_process_rhs
+    JSONField.from_db_value = json_field_from_db_value
+    JSONField.get_db_converters = json_field_get_db_converters
     KeyTransform.as_mql_expr = partialmethod(key_transform, as_expr=True)
     KeyTransform.as_mql_path = partialmethod(key_transform, as_expr=False)
     KeyTransform.can_use_path = key_transform_is_simple_column
@@ -1,6 +1,11 @@
 """Mixins used across multiple modules (to avoid circular imports)."""
 
 from django.core.checks import Error
+from django.db import connections
+from django.db.models.expressions import Expression
+from django.db.models.query_utils import DeferredAttribute
+
+from ..converters import preserves_null
 
 
 class NoEncryptedEmbeddedFieldsMixin:
@@ -22,3 +27,132 @@ class NoEncryptedEmbeddedFieldsMixin:
                     )
                 ]
         return []
+
+
+class UnloadedEmbeddedValue:
+    """
+    The database value of a lazy embedded model field that hasn't been
+    converted to model instance(s) yet.
+    """
+
+    __slots__ = ("alias", "value")
+
+    def __init__(self, value, alias):
+        self.value = value
+        self.alias = alias
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {self.value!r}>"
+
+    def load(self, field):
+        """Apply the field's database converters to the value."""
+        connection = connections[self.alias]
+        expression = Expression(output_field=field)
+        value = self.value
+        for converter in [
+            *connection.ops.get_db_converters(expression),
+            *field.get_db_converters(connection),
+        ]:
+            value = converter(value, expression, connection)
+        return value
+
+
+@preserves_null
+def defer_embedded_value(value, expression, connection):  # noqa: ARG001
+    """
+    Database converter for lazy embedded model fields. Their values are
+    converted by LazyEmbeddedModelDescriptor upon first access.
+    """
+    if value is None:
+        return None
+    return UnloadedEmbeddedValue(value, connection.alias)
+
+
+class LazyEmbeddedModelDescriptor(DeferredAttribute):
+    """
+    Convert the database value of a lazy embedded model field to model
+    instance(s) the first time the attribute is accessed.
+    """
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+        value = super().__get__(instance, cls)
+        if isinstance(value, UnloadedEmbeddedValue):
+            value = instance.__dict__[self.field.attname] = value.load(self.field)
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.field.attname] = value
+
+
+class LazyEmbeddedModelMixin:
+    """
+    Add a `lazy` option that defers building a model instance's embedded
+    model(s) until the attribute is accessed.
+    """
+
+    def __init__(self, *args, lazy=False, **kwargs):
+        self.lazy = lazy
+        super().__init__(*args, **kwargs)
+
+    @property
+    def descriptor_class(self):
+        return LazyEmbeddedModelDescriptor if self.lazy else super().descriptor_class
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.lazy:
+            kwargs["lazy"] = True
+        return name, path, args, kwargs
+
+
+class PartiallyLoadedList(list):
+    """
+    An array that only() or defer() partially loaded or that
+    MongoQuerySet.slice_array() sliced.
+    """
+
+
+def mark_partially_loaded(value, expression, connection):  # noqa: ARG001
+    """
+    Database converter for the fields that only() or defer() partially load
+    and the arrays that slice_array() slices. Their values are marked so that
+    saving the field raises an error rather than overwriting what wasn't
+    loaded.
+    """
+    if isinstance(value, list):
+        for instance in value:
+            if hasattr(instance, "_state"):
+                instance._state.partially_loaded = True
+        return PartiallyLoadedList(value)
+    if value is not None:
+        value._state.partially_loaded = True
+    return value
+
+
+def is_partially_loaded(value):
+    """
+    Return whether value was partially loaded by only(), defer(), or
+    slice_array().
+    """
+    if isinstance(value, list):
+        return isinstance(value, PartiallyLoadedList) or any(map(is_partially_loaded, value))
+    return getattr(getattr(value, "_state", None), "partially_loaded", False)
+
+
+class PartiallyLoadedMixin:
+    """
+    Prevent saving a value that only(), defer(), or slice_array() partially
+    loaded.
+    """
+
+    def pre_save(self, model_instance, add):
+        value = super().pre_save(model_instance, add)
+        if is_partially_loaded(value):
+            raise ValueError(
+                f"Cannot save {model_instance._meta.object_name}.{self.name} since "
+                "only(), defer(), or slice_array() partially loaded it. Use "
+                "save(update_fields=...) to save other fields."
+            )
+        return value
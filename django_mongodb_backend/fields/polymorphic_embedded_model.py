@@ -20,11 +20,26 @@ class PolymorphicEmbeddedModelField(models.Field):
         Like other relational fields, each model may also be passed as a
         string.
         """
-        # For consistency, cast list to tuple, if necessary.
-        self.embedded_models = tuple(embedded_models)
+        self.embedded_models = embedded_models
         kwargs["editable"] = False
         super().__init__(*args, **kwargs)
 
+    @property
+    def embedded_models(self):
+        return self._embedded_models
+
+    @embedded_models.setter
+    def embedded_models(self, embedded_models):
+        # For consistency, cast list to tuple, if necessary.
+        self._embedded_models = tuple(embedded_models)
+        # Map labels to models for _get_model_from_label(). Models given as
+        # strings are added when contribute_to_class() resolves them.
+        self._models_by_label = {
+            model._meta.label: model
+            for model in self._embedded_models
+            if not isinstance(model, str)
+        }
+
     def db_type(self, connection):
         return "object"
 
@@ -112,12 +127,43 @@ class PolymorphicEmbeddedModelField(models.Field):
             return None
         if not isinstance(value, dict):
             return value
-        model_class = self._get_model_from_label(value.pop("_label"))
+        model_class = self._get_model_from_label(value["_label"])
+        return self._build_instance(model_class, self._get_model_fields(model_class), value)
+
+    def to_python_list(self, values):
+        """
+        Like to_python() for each of a list of values, but look up the model
+        class and fields of each label only once.
+        """
+        models_by_label = {}
+        instances = []
+        for value in values:
+            if not isinstance(value, dict):
+                instances.append(value)
+                continue
+            label = value["_label"]
+            try:
+                model_class, fields = models_by_label[label]
+            except KeyError:
+                model_class = self._get_model_from_label(label)
+                fields = self._get_model_fields(model_class)
+                models_by_label[label] = model_class, fields
+            instances.append(self._build_instance(model_class, fields, value))
+        return instances
+
+    @staticmethod
+    def _get_model_fields(model_class):
+        return [
+            (field.attname, field.column, field.to_python) for field in model_class._meta.fields
+        ]
+
+    @staticmethod
+    def _build_instance(model_class, fields, value):
         instance = model_class(
             **{
-                field.attname: field.to_python(value[field.column])
-                for field in model_class._meta.fields
-                if field.column in value
+                attname: to_python(value[column])
+                for attname, column, to_python in fields
+                if column in value
             }
         )
         instance._state.adding = False
@@ -187,4 +233,4 @@ class PolymorphicEmbeddedModelField(models.Field):
         raise NotImplementedError("PolymorphicEmbeddedModelField does not support forms.")
 
     def _get_model_from_label(self, label):
-        return next(model for model in self.embedded_models if model._meta.label == label)
+        return self._models_by_label[label]
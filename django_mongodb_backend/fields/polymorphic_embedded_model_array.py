@@ -63,7 +63,13 @@ class PolymorphicEmbeddedModelArrayField(ArrayField):
     def formfield(self, **kwargs):
         raise NotImplementedError("PolymorphicEmbeddedModelField does not support forms.")
 
-    _get_model_from_label = PolymorphicEmbeddedModelField._get_model_from_label
+    def _get_model_from_label(self, label):
+        return self.base_field._get_model_from_label(label)
+
+    def _from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return self.base_field.to_python_list(value)
 
     def get_transform(self, name):
         transform = super().get_transform(name)
@@ -0,0 +1,151 @@
+from functools import partialmethod
+
+from django.db import NotSupportedError
+from django.db.models import (
+    DateField,
+    DecimalField,
+    DurationField,
+    FloatField,
+    IntegerField,
+)
+from django.db.models.aggregates import Aggregate
+from django.db.models.expressions import Col, OrderBy, RowRange, Window
+from django.db.models.functions.window import (
+    CumeDist,
+    DenseRank,
+    FirstValue,
+    Lag,
+    LastValue,
+    Lead,
+    NthValue,
+    Ntile,
+    PercentRank,
+    Rank,
+    RowNumber,
+)
+
+# Fields whose values can be the sort key of a "range" window.
+RANGE_FIELDS = (DateField, DecimalField, DurationField, FloatField, IntegerField)
+
+
+def dense_rank(self, compiler, connection):  # noqa: ARG001
+    return {"$denseRank": {}}
+
+
+def first_value(self, compiler, connection):
+    expression = self.get_source_expressions()[0]
+    return {"$first": expression.as_mql(compiler, connection, as_expr=True)}
+
+
+def last_value(self, compiler, connection):
+    expression = self.get_source_expressions()[0]
+    return {"$last": expression.as_mql(compiler, connection, as_expr=True)}
+
+
+def lag_lead(self, compiler, connection, direction):
+    expression, offset, *default = self.get_source_expressions()
+    shift = {
+        "output": expression.as_mql(compiler, connection, as_expr=True),
+        "by": direction * offset.value,
+    }
+    if default:
+        shift["default"] = default[0].as_mql(compiler, connection, as_expr=True)
+    return {"$shift": shift}
+
+
+def rank(self, compiler, connection):  # noqa: ARG001
+    return {"$rank": {}}
+
+
+def row_number(self, compiler, connection):  # noqa: ARG001
+    return {"$documentNumber": {}}
+
+
+def unsupported_window_function(self, compiler, connection):  # noqa: ARG001
+    raise NotSupportedError(f"{self.__class__.__name__} is not supported.")
+
+
+def window(self, compiler, connection):  # noqa: ARG001
+    raise NotSupportedError(
+        "Window expressions are only supported in annotations, ordering, and filters on MongoDB."
+    )
+
+
+def _frame_bound(value):
+    if value is None:
+        return "unbounded"
+    if value == 0:
+        return "current"
+    return value
+
+
+def window_fields(self, compiler, connection, sort_fields):
+    """
+    Return (partitionBy, sortBy, output) for the $setWindowFields stage that
+    computes this window expression. Sort keys that aren't fields are added
+    to sort_fields (a dict mapping field names to expressions) so that an
+    $addFields stage can compute them first.
+    """
+    if not connection.features.supports_over_clause:
+        raise NotSupportedError("This backend does not support window expressions.")
+    partition_by = None
+    if self.partition_by is not None:
+        partition_by = self.partition_by.as_mql(compiler, connection, as_expr=True)
+        if len(partition_by) == 1:
+            partition_by = partition_by[0]
+    sort_by = {}
+    sort_output_fields = []
+    for expression in self.order_by.get_source_expressions() if self.order_by else ():
+        descending = False
+        if isinstance(expression, OrderBy):
+            if expression.nulls_first or expression.nulls_last:
+                raise NotSupportedError(
+                    "Window.order_by doesn't support nulls_first and nulls_last on MongoDB."
+                )
+            descending = expression.descending
+            expression = expression.expression
+        sort_output_fields.append(expression.output_field)
+        if isinstance(expression, Col):
+            name = expression.as_mql(compiler, connection)
+        else:
+            name = f"__window_sort{len(sort_fields) + 1}"
+            sort_fields[name] = expression.as_mql(compiler, connection, as_expr=True)
+        sort_by[name] = -1 if descending else 1
+    output = self.source_expression.as_mql(compiler, connection, as_expr=True)
+    # Ranking functions and $shift don't take a window.
+    if isinstance(self.source_expression, (Aggregate, FirstValue, LastValue)):
+        if self.frame is not None:
+            if self.frame.exclusion is not None:
+                raise NotSupportedError("This backend does not support window frame exclusions.")
+            unit = "documents" if isinstance(self.frame, RowRange) else "range"
+            output["window"] = {
+                unit: [_frame_bound(self.frame.start.value), _frame_bound(self.frame.end.value)]
+            }
+        elif sort_by:
+            # Like SQL's default frame (RANGE BETWEEN UNBOUNDED PRECEDING AND
+            # CURRENT ROW), include the rows that sort equal to the current
+            # row. MongoDB only supports that for a single numeric or date
+            # sort key.
+            unit = (
+                "range"
+                if len(sort_output_fields) == 1 and isinstance(sort_output_fields[0], RANGE_FIELDS)
+                else "documents"
+            )
+            output["window"] = {unit: ["unbounded", "current"]}
+    return partition_by, sort_by, output
+
+
+def register_window():
+    CumeDist.as_mql_expr = unsupported_window_function
+    DenseRank.as_mql_expr = dense_rank
+    FirstValue.as_mql_expr = first_value
+    Lag.as_mql_expr = partialmethod(lag_lead, direction=-1)
+    LastValue.as_mql_expr = last_value
+    Lead.as_mql_expr = partialmethod(lag_lead, direction=1)
+    NthValue.as_mql_expr = unsupported_window_function
+    Ntile.as_mql_expr = unsupported_window_function
+    PercentRank.as_mql_expr = unsupported_window_function
+    Rank.as_mql_expr = rank
+    RowNumber.as_mql_expr = row_number
+    Window.as_mql_expr = window
+    Window.as_mql_window = window_fields
@@ -1,6 +1,7 @@
 from django.db.models.fields.related_lookups import In, RelatedIn
 from django.db.models.lookups import (
     BuiltinLookup,
+    Exact,
     FieldGetDbPrepValueIterableMixin,
     IExact,
     IsNull,
@@ -27,6 +28,31 @@ def builtin_lookup_path(self, compiler, connection):
     return connection.mongo_operators[self.lookup_name](lhs_mql, value)
 
 
+def is_conditional_filter(lookup):
+    """
+    Return whether the lookup is filter(<conditional expression>), which
+    Django resolves to Exact(expression, True), and the expression can be
+    used as a query document (e.g. ElemMatch).
+    """
+    return (
+        lookup.rhs is True
+        and getattr(lookup.lhs, "conditional", False)
+        and getattr(lookup.lhs, "can_use_path", False)
+    )
+
+
+def exact_path(self, compiler, connection):
+    if is_conditional_filter(self):
+        # Like Exact.as_sql(), avoid comparing the expression to True.
+        return self.lhs.as_mql_path(compiler, connection)
+    return builtin_lookup_path(self, compiler, connection)
+
+
+@property
+def exact_can_use_path(self):
+    return is_conditional_filter(self) or lookup_can_use_path.fget(self)
+
+
 _field_resolve_expression_parameter = FieldGetDbPrepValueIterableMixin.resolve_expression_parameter
 
 
@@ -237,6 +263,8 @@ def uuid_text_mixin_as_mql_path(self, compiler, connection):
 def register_lookups():
     BuiltinLookup.as_mql_expr = builtin_lookup_expr
     BuiltinLookup.as_mql_path = builtin_lookup_path
+    Exact.as_mql_path = exact_path
+    Exact.can_use_path = exact_can_use_path
     FieldGetDbPrepValueIterableMixin.resolve_expression_parameter = (
         field_resolve_expression_parameter
     )
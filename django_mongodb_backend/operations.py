@@ -13,8 +13,14 @@ from django.db.models import TextField
 from django.db.models.expressions import Combinable, Expression
 from django.db.models.functions import Cast, Trunc
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.regex_helper import _lazy_re_compile
 
+from .converters import all_preserve_null, fuse_converters, preserves_null
+from .fields.json import reads_decoded_bson
+from .fields.mixins import defer_embedded_value
+from .optimizer import PipelineOptimizer
+
 try:
     from .gis.operations import GISOperations
 except ImproperlyConfigured:
@@ -38,6 +44,11 @@ class DatabaseOperations(GISOperations, BaseDatabaseOperations):
     }
     explain_options = {"comment", "verbosity"}
     explain_prefix = "db.command('explain',"  # Expected value for tests.
+    pipeline_optimizer_class = PipelineOptimizer
+
+    @cached_property
+    def pipeline_optimizer(self):
+        return self.pipeline_optimizer_class()
 
     def adapt_datefield_value(self, value):
         """Store DateField as datetime."""
@@ -96,6 +107,7 @@ class DatabaseOperations(GISOperations, BaseDatabaseOperations):
 
     def _get_arrayfield_converter(self, converter, *args, **kwargs):
         # Return a database converter that can be applied to a list of values.
+        @preserves_null
         def convert_value(value, expression, connection):
             if value is None:
                 return None
@@ -129,7 +141,8 @@ class DatabaseOperations(GISOperations, BaseDatabaseOperations):
         elif internal_type == "EmbeddedModelField":
             converters.append(self.convert_embeddedmodelfield_value)
         elif internal_type == "JSONField":
-            converters.append(self.convert_jsonfield_value)
+            if not reads_decoded_bson(expression.output_field):
+                converters.append(self.convert_jsonfield_value)
         elif internal_type == "PolymorphicEmbeddedModelField":
             converters.append(self.convert_polymorphicembeddedmodelfield_value)
         elif internal_type == "TimeField":
@@ -144,22 +157,26 @@ class DatabaseOperations(GISOperations, BaseDatabaseOperations):
             converters.append(self.convert_integerfield_value)
         return converters
 
+    @preserves_null
     def convert_integerfield_value(self, value, expression, connection):
         if value is not None:
             # from Int64 to int
             value = int(value)
         return value
 
+    @preserves_null
     def convert_datefield_value(self, value, expression, connection):
         if value is not None:
             value = value.date()
         return value
 
+    @preserves_null
     def convert_datetimefield_value(self, value, expression, connection):
         if value is not None:
             value = timezone.make_aware(value, self.connection.timezone)
         return value
 
+    @preserves_null
     def convert_decimalfield_value(self, value, expression, connection):
         if value is not None:
             # from Decimal128 to decimal.Decimal()
@@ -171,6 +188,7 @@ class DatabaseOperations(GISOperations, BaseDatabaseOperations):
                 return Decimal(value)
         return value
 
+    @preserves_null
     def convert_durationfield_value(self, value, expression, connection):
         if value is not None:
             try:
@@ -181,47 +199,78 @@ class DatabaseOperations(GISOperations, BaseDatabaseOperations):
                 value = datetime.timedelta(milliseconds=int(str(value)))
         return value
 
+    @preserves_null
     def convert_embeddedmodelfield_value(self, value, expression, connection):
         if value is not None:
-            # Apply database converters to each field of the embedded model.
-            for field in expression.output_field.embedded_model._meta.fields:
-                if field.column not in value:
-                    continue
-                field_expr = Expression(output_field=field)
-                converters = connection.ops.get_db_converters(
-                    field_expr
-                ) + field_expr.get_db_converters(connection)
-                for converter in converters:
-                    value[field.column] = converter(value[field.column], field_expr, connection)
+            self._convert_embedded_model_value(
+                expression.output_field.embedded_model, value, connection
+            )
         return value
 
+    def _convert_embedded_model_value(self, model, value, connection):
+        """Apply database converters to each field of the embedded model."""
+        for column, converter, field_expr, skip_null in self._get_embedded_model_converters(model):
+            if column in value and (value[column] is not None or not skip_null):
+                value[column] = converter(value[column], field_expr, connection)
+
+    def _get_embedded_model_converters(self, model):
+        """
+        Return a list of (column, converter, expression, preserves_null) for
+        the fields of an embedded model that have database converters. The
+        list is cached for each model since it's needed for every value.
+        """
+        # The converters depend on USE_TZ, which tests may change.
+        key = (model, settings.USE_TZ)
+        try:
+            return self._embedded_model_converters[key]
+        except KeyError:
+            pass
+        model_converters = []
+        for field in model._meta.fields:
+            field_expr = Expression(output_field=field)
+            if getattr(field, "lazy", False):
+                converters = [defer_embedded_value]
+            else:
+                converters = self.get_db_converters(field_expr) + field_expr.get_db_converters(
+                    self.connection
+                )
+            if converters:
+                model_converters.append(
+                    (
+                        field.column,
+                        fuse_converters(converters),
+                        field_expr,
+                        all_preserve_null(converters),
+                    )
+                )
+        self._embedded_model_converters[key] = model_converters
+        return model_converters
+
+    @cached_property
+    def _embedded_model_converters(self):
+        return {}
+
     def convert_jsonfield_value(self, value, expression, connection):
         """
         Convert dict data to a string so that JSONField.from_db_value() can
-        decode it using json.loads().
+        decode it using json.loads() with the field's custom decoder.
         """
         return json.dumps(value)
 
+    @preserves_null
     def convert_polymorphicembeddedmodelfield_value(self, value, expression, connection):
         if value is not None:
             model_class = expression.output_field._get_model_from_label(value["_label"])
-            # Apply database converters to each field of the embedded model.
-            for field in model_class._meta.fields:
-                if field.column not in value:
-                    continue
-                field_expr = Expression(output_field=field)
-                converters = connection.ops.get_db_converters(
-                    field_expr
-                ) + field_expr.get_db_converters(connection)
-                for converter in converters:
-                    value[field.column] = converter(value[field.column], field_expr, connection)
+            self._convert_embedded_model_value(model_class, value, connection)
         return value
 
+    @preserves_null
     def convert_timefield_value(self, value, expression, connection):
         if value is not None:
             value = value.time()
         return value
 
+    @preserves_null
     def convert_uuidfield_value(self, value, expression, connection):
         if value is not None:
             value = uuid.UUID(value)
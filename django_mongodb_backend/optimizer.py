@@ -0,0 +1,337 @@
+from collections import defaultdict
+
+
+class PipelineOptimizer:
+    """
+    Rewrite an aggregation pipeline into an equivalent pipeline that the
+    server can execute more cheaply.
+
+    Each name in `passes` is a method that takes a pipeline and returns a new
+    one. Subclasses can add, remove, or reorder passes. Passes must not mutate
+    the stages they receive since they may be shared with other pipelines.
+    """
+
+    passes = (
+        "flatten_logical_operators",
+        "merge_adjacent_stages",
+        "hoist_match_conditions",
+        "merge_adjacent_stages",
+        "hoist_sort_and_limit",
+        "remove_redundant_projects",
+    )
+
+    def optimize(self, pipeline):
+        for name in self.passes:
+            pipeline = getattr(self, name)(pipeline)
+        return pipeline
+
+    def flatten_logical_operators(self, pipeline):
+        """
+        Flatten nested $and and $or conditions in $match stages, e.g.
+        {"$and": [a, {"$and": [b, c]}]} becomes {"$and": [a, b, c]}.
+        """
+        return [
+            {"$match": _flatten_condition(stage["$match"])}
+            if _stage_name(stage) == "$match"
+            else stage
+            for stage in pipeline
+        ]
+
+    def merge_adjacent_stages(self, pipeline):
+        """
+        Combine consecutive $match stages with $and and consecutive $addFields
+        (or $set) stages when the second doesn't read a field written by the
+        first.
+        """
+        result = []
+        for stage in pipeline:
+            name = _stage_name(stage)
+            previous_name = _stage_name(result[-1]) if result else None
+            if name == "$match" and previous_name == "$match":
+                conditions = [
+                    *_split_conjunction(result[-1]["$match"]),
+                    *_split_conjunction(stage["$match"]),
+                ]
+                result[-1] = {"$match": _combine_conjunction(conditions)}
+            elif name in {"$addFields", "$set"} and previous_name == name:
+                previous, current = result[-1][name], stage[name]
+                references = _get_expression_references(current)
+                if references is not None and not _overlaps(
+                    {*references, *current}, previous.keys()
+                ):
+                    result[-1] = {name: {**previous, **current}}
+                else:
+                    result.append(stage)
+            else:
+                result.append(stage)
+        return result
+
+    def hoist_match_conditions(self, pipeline):
+        """
+        Move the conditions of each $match stage ahead of the $lookup,
+        $unwind, and $addFields stages that don't write the fields the
+        conditions read, so that fewer documents flow through the joins.
+        """
+        result = []
+        for stage in pipeline:
+            if _stage_name(stage) != "$match":
+                result.append(stage)
+                continue
+            hoisted = defaultdict(list)
+            remaining = []
+            for condition in _split_conjunction(stage["$match"]):
+                position = len(result)
+                references = _get_condition_references(condition)
+                if references is not None:
+                    while position > 0:
+                        written = _get_written_fields(result[position - 1])
+                        if written is None or _overlaps(references, written):
+                            break
+                        position -= 1
+                if position == len(result):
+                    remaining.append(condition)
+                else:
+                    hoisted[position].append(condition)
+            # Insert from the end so that the earlier positions stay valid.
+            for position in sorted(hoisted, reverse=True):
+                result.insert(position, {"$match": _combine_conjunction(hoisted[position])})
+            if remaining:
+                result.append({"$match": _combine_conjunction(remaining)})
+        return result
+
+    def hoist_sort_and_limit(self, pipeline):
+        """
+        Move a $sort followed by $limit (and an optional $skip) ahead of joins
+        that can't add or remove documents, when the sort keys are fields of
+        the base collection. The $sort is repeated at its original position
+        to restore the order after the joins.
+        """
+        names = [_stage_name(stage) for stage in pipeline]
+        try:
+            sort_index = names.index("$sort")
+        except ValueError:
+            return pipeline
+        end = sort_index + 1
+        if end < len(names) and names[end] == "$skip":
+            end += 1
+        if end >= len(names) or names[end] != "$limit":
+            return pipeline
+        end += 1
+        sort_keys = set(pipeline[sort_index]["$sort"])
+        unique_lookups = _get_unique_lookups(pipeline)
+        position = sort_index
+        crossed_lookup = False
+        while position > 0:
+            stage = pipeline[position - 1]
+            name = _stage_name(stage)
+            if name == "$project":
+                # Sorting before the projection must see the same values.
+                projection = stage["$project"]
+                if any(projection.get(key, 1 if key == "_id" else 0) != 1 for key in sort_keys):
+                    break
+            else:
+                written = _get_written_fields(stage)
+                if written is None or _overlaps(sort_keys, written):
+                    break
+                # Unwinding a join that can't match more than one document and
+                # that has an empty document fallback preserves the number of
+                # documents.
+                if name == "$unwind" and _get_unwind_path(stage) not in unique_lookups:
+                    break
+                crossed_lookup |= name == "$lookup"
+            position -= 1
+        if not crossed_lookup:
+            return pipeline
+        return [
+            *pipeline[:position],
+            *pipeline[sort_index:end],
+            *pipeline[position:sort_index],
+            pipeline[sort_index],
+            *pipeline[end:],
+        ]
+
+    def remove_redundant_projects(self, pipeline):
+        """
+        Drop a $project that repeats the previous $project and fold a $project
+        that only includes fields that the previous $project includes or
+        computes into it.
+        """
+        result = []
+        for stage in pipeline:
+            if (
+                _stage_name(stage) == "$project"
+                and result
+                and _stage_name(result[-1]) == "$project"
+            ):
+                previous, current = result[-1]["$project"], stage["$project"]
+                if current == previous:
+                    continue
+                if (
+                    all(value == 1 for value in current.values())
+                    and set(current) <= set(previous)
+                    # An excluded field (e.g. {"a": 0}) can't be included
+                    # again.
+                    and not any(_is_exclusion(previous[key]) for key in current)
+                ):
+                    folded = {key: previous[key] for key in current}
+                    if "_id" in previous and "_id" not in current:
+                        folded["_id"] = previous["_id"]
+                    result[-1] = {"$project": folded}
+                    continue
+            result.append(stage)
+        return result
+
+
+def _is_exclusion(value):
+    return isinstance(value, (bool, int, float)) and not value
+
+
+def _stage_name(stage):
+    return next(iter(stage)) if len(stage) == 1 else None
+
+
+def _flatten_condition(condition):
+    if not isinstance(condition, dict):
+        return condition
+    flattened = {}
+    for key, value in condition.items():
+        if key in {"$and", "$or"}:
+            children = []
+            for child in map(_flatten_condition, value):
+                if isinstance(child, dict) and len(child) == 1 and key in child:
+                    children.extend(child[key])
+                else:
+                    children.append(child)
+            if len(children) == 1 and len(condition) == 1:
+                return children[0]
+            flattened[key] = children
+        elif key == "$nor":
+            flattened[key] = [_flatten_condition(child) for child in value]
+        else:
+            flattened[key] = value
+    return flattened
+
+
+def _split_conjunction(condition):
+    """Return the list of conditions that `condition` requires to be true."""
+    if len(condition) > 1:
+        return [
+            conjunct
+            for key, value in condition.items()
+            for conjunct in _split_conjunction({key: value})
+        ]
+    if "$and" in condition:
+        return [conjunct for child in condition["$and"] for conjunct in _split_conjunction(child)]
+    return [condition] if condition else []
+
+
+def _combine_conjunction(conditions):
+    if len(conditions) == 1:
+        return conditions[0]
+    return {"$and": conditions}
+
+
+def _get_condition_references(condition):
+    """
+    Return the set of field paths read by a query condition, or None if the
+    condition may read any field (e.g. $where or $$ROOT).
+    """
+    references = set()
+    for key, value in condition.items():
+        if key in {"$and", "$or", "$nor"}:
+            for child in value:
+                child_references = _get_condition_references(child)
+                if child_references is None:
+                    return None
+                references |= child_references
+        elif key == "$expr":
+            expr_references = _get_expression_references(value)
+            if expr_references is None:
+                return None
+            references |= expr_references
+        elif key.startswith("$"):
+            return None
+        else:
+            references.add(key)
+    return references
+
+
+def _get_expression_references(expression):
+    """
+    Return the set of field paths read by an aggregation expression, or None
+    if the expression may read any field.
+    """
+    references = set()
+    stack = [expression]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            if value.startswith("$$"):
+                if value[2:].split(".", 1)[0] in {"ROOT", "CURRENT"}:
+                    return None
+            elif value.startswith("$"):
+                references.add(value[1:])
+        elif isinstance(value, dict):
+            if len(value) == 1 and "$literal" in value:
+                continue
+            stack.extend(value.values())
+        elif isinstance(value, list | tuple):
+            stack.extend(value)
+    return references
+
+
+def _get_written_fields(stage):
+    """
+    Return the set of fields written by a stage that doesn't remove documents
+    or depend on their order, or None for other stages.
+    """
+    name = _stage_name(stage)
+    spec = stage.get(name)
+    if name == "$lookup":
+        return {spec["as"]}
+    if name == "$unwind":
+        written = {_get_unwind_path(stage)}
+        if isinstance(spec, dict) and "includeArrayIndex" in spec:
+            written.add(spec["includeArrayIndex"])
+        return written
+    if name in {"$addFields", "$set"}:
+        # {"field": "$field"} leaves the field unchanged.
+        return {key for key, value in spec.items() if value != f"${key}"}
+    return None
+
+
+def _get_unwind_path(stage):
+    spec = stage["$unwind"]
+    path = spec["path"] if isinstance(spec, dict) else spec
+    return path.removeprefix("$")
+
+
+def _get_unique_lookups(pipeline):
+    """
+    Return the names of $lookup outputs that hold exactly one document: the
+    join is on the other collection's _id and an empty result is replaced by
+    an empty document (as done for LEFT OUTER joins).
+    """
+    unique = set()
+    candidates = set()
+    for stage in pipeline:
+        name = _stage_name(stage)
+        if name == "$lookup":
+            spec = stage["$lookup"]
+            if spec.get("foreignField") == "_id":
+                candidates.add(spec["as"])
+            else:
+                candidates.discard(spec["as"])
+                unique.discard(spec["as"])
+        elif name == "$set":
+            unique |= candidates & set(stage["$set"])
+    return unique
+
+
+def _overlaps(paths, other_paths):
+    """Return True if any path is equal to, or a parent of, another path."""
+    return any(
+        path == other or path.startswith(f"{other}.") or other.startswith(f"{path}.")
+        for path in paths
+        for other in other_paths
+    )
@@ -0,0 +1,104 @@
+from django.core.paginator import EmptyPage, InvalidPage, Page, Paginator
+
+
+class SeekPaginator(Paginator):
+    """
+    A Paginator for a MongoQuerySet that uses MongoQuerySet.seek() rather
+    than slicing, so that fetching a page doesn't require the server to skip
+    the rows of all previous pages. Pages are identified by tokens rather
+    than numbers and can only be traversed forward.
+    """
+
+    def __init__(
+        self, object_list, per_page, ordering=None, allow_empty_first_page=True, error_messages=None
+    ):
+        super().__init__(
+            object_list,
+            per_page,
+            allow_empty_first_page=allow_empty_first_page,
+            error_messages=error_messages,
+        )
+        self.ordering = ordering
+        # Raise invalid orderings here rather than as an error (that
+        # get_page() can't recover from) when a page is fetched.
+        object_list._get_seek_ordering(ordering)
+
+    def __iter__(self):
+        """Yield the pages in order by following their next tokens."""
+        page = self.page(None)
+        yield page
+        while page.has_next():
+            page = self.page(page.next_token)
+            yield page
+
+    def _check_object_list_is_ordered(self):
+        # seek() always orders the QuerySet.
+        pass
+
+    def page(self, number=None):
+        """Return the page that follows the row the token was made from."""
+        try:
+            object_list = self.object_list.seek(number or None, ordering=self.ordering)
+        except ValueError as e:
+            raise InvalidPage(str(e)) from e
+        objects = list(object_list[: self.per_page + 1])
+        if not objects and (number or not self.allow_empty_first_page):
+            raise EmptyPage(self.error_messages["no_results"])
+        next_token = None
+        if len(objects) > self.per_page:
+            objects = objects[: self.per_page]
+            next_token = object_list.seek_token(objects[-1])
+        return SeekPage(objects, number or None, self, next_token)
+
+    def get_page(self, number=None):
+        """Return the first page if the token is invalid."""
+        try:
+            return self.page(number)
+        except InvalidPage:
+            return self.page(None)
+
+    def validate_number(self, number):
+        raise _unsupported("validate_number()")
+
+    @property
+    def page_range(self):
+        raise _unsupported("page_range")
+
+    def get_elided_page_range(self, number=1, *, on_each_side=3, on_ends=2):
+        raise _unsupported("get_elided_page_range()")
+
+
+class SeekPage(Page):
+    def __init__(self, object_list, number, paginator, next_token):
+        super().__init__(object_list, number, paginator)
+        self.next_token = next_token
+
+    def __repr__(self):
+        return f"<Page {self.number or 'first'}>"
+
+    def has_next(self):
+        return self.next_token is not None
+
+    def has_previous(self):
+        return False
+
+    def next_page_number(self):
+        if self.next_token is None:
+            raise EmptyPage(self.paginator.error_messages["no_results"])
+        return self.next_token
+
+    def previous_page_number(self):
+        raise EmptyPage(self.paginator.error_messages["no_results"])
+
+    def start_index(self):
+        raise _unsupported("start_index()")
+
+    def end_index(self):
+        raise _unsupported("end_index()")
+
+
+def _unsupported(name):
+    return NotImplementedError(
+        f"SeekPaginator doesn't support {name} because its pages are identified "
+        "by tokens rather than numbers."
+    )
@@ -13,6 +13,65 @@ from django.db.models.sql.datastructures import Join
 from django.db.models.sql.where import AND, OR, XOR, ExtraWhere, NothingNode, WhereNode
 from pymongo.errors import BulkWriteError, DuplicateKeyError, PyMongoError
 
+# The arguments of each Collection method that are set by the MongoQuerySet
+# methods of the same name, e.g. MongoQuerySet.hint().
+QUERY_OPTIONS = {
+    "aggregate": {
+        "allow_disk_use": "allowDiskUse",
+        "batch_size": "batchSize",
+        "collation": "collation",
+        "comment": "comment",
+        "hint": "hint",
+        "max_time_ms": "maxTimeMS",
+    },
+    "bulk_write": {"comment": "comment"},
+    "count_documents": {
+        "collation": "collation",
+        "comment": "comment",
+        "hint": "hint",
+        "max_time_ms": "maxTimeMS",
+    },
+    "delete_many": {"collation": "collation", "comment": "comment", "hint": "hint"},
+    "estimated_document_count": {"comment": "comment", "max_time_ms": "maxTimeMS"},
+    "find": {
+        "allow_disk_use": "allow_disk_use",
+        "batch_size": "batch_size",
+        "collation": "collation",
+        "comment": "comment",
+        "hint": "hint",
+        "max_time_ms": "max_time_ms",
+    },
+    "update_many": {"collation": "collation", "comment": "comment", "hint": "hint"},
+}
+QUERY_OPTIONS["find_one"] = QUERY_OPTIONS["find"]
+QUERY_OPTIONS["update_one"] = QUERY_OPTIONS["update_many"]
+
+
+def _get_options(query):
+    """Return the options set on the sql.Query by MongoQuerySet methods."""
+    options = getattr(query, "mongo_options", None)
+    if options is None:
+        # The options of an aggregation over a subquery (e.g. the count of a
+        # sliced QuerySet) are on the subquery.
+        options = getattr(getattr(query, "inner_query", None), "mongo_options", {})
+    return options
+
+
+def get_query_option(query, name):
+    """Return the value of an option set on the sql.Query, if any."""
+    return _get_options(query).get(name)
+
+
+def get_query_options(query, method):
+    """
+    Return the options set on the sql.Query by MongoQuerySet methods as
+    keyword arguments for the Collection method named `method`. Options that
+    the method doesn't support are ignored.
+    """
+    options = _get_options(query)
+    arguments = QUERY_OPTIONS[method]
+    return {arguments[name]: value for name, value in options.items() if name in arguments}
+
 
 def wrap_database_errors(func):
     @wraps(func)
@@ -53,11 +112,19 @@ class MongoQuery:
         self.aggregation_pipeline = compiler.aggregation_pipeline
         self.search_pipeline = compiler.search_pipeline
         self.extra_fields = None
+        # $lookup stages of MongoQuerySet.with_related().
+        self.related_pipeline = None
         self.combinator_pipeline = None
         # $lookup stage that encapsulates the pipeline for performing a nested
         # subquery.
         self.subquery_lookup = None
         self.needs_wrap_aggregation = compiler.needs_wrap_aggregation
+        self.window_pipeline = compiler.window_pipeline
+        # The collection to run the pipeline on if it isn't the compiler's
+        # (see SQLCompiler.get_lookup_pipeline()).
+        self.from_collection = None
+        # The sub-pipelines of MongoQuerySet.facets()'s $facet stage.
+        self.facets = None
 
     def __repr__(self):
         return f"<MongoQuery: {self.match_mql!r} ORDER {self.ordering!r}>"
@@ -68,17 +135,54 @@ class MongoQuery:
         if self.compiler.subqueries:
             raise NotSupportedError("Cannot use QuerySet.delete() when a subquery is required.")
         return self.compiler.collection.delete_many(
-            self.match_mql, session=self.compiler.connection.session
+            self.match_mql,
+            **get_query_options(self.query, "delete_many"),
+            session=self.compiler.connection.session,
         ).deleted_count
 
+    @wrap_database_errors
+    def count_documents(self, filter_, **kwargs):
+        """Return the number of documents that match the filter."""
+        return self.compiler.collection.count_documents(
+            filter_,
+            **kwargs,
+            **get_query_options(self.query, "count_documents"),
+            session=self.compiler.connection.session,
+        )
+
+    @wrap_database_errors
+    def find_one(self, filter_, projection, **kwargs):
+        """Return the first document that matches the filter, if any."""
+        return self.compiler.collection.find_one(
+            filter_,
+            projection,
+            **kwargs,
+            **get_query_options(self.query, "find_one"),
+            session=self.compiler.connection.session,
+        )
+
     @wrap_database_errors
     def get_cursor(self):
         """
-        Return a pymongo CommandCursor that can be iterated on to give the
-        results of the query.
+        Return a pymongo Cursor or CommandCursor that can be iterated on to
+        give the results of the query.
         """
-        return self.compiler.collection.aggregate(
-            self.get_pipeline(), session=self.compiler.connection.session
+        connection = self.compiler.connection
+        pipeline = self.get_pipeline()
+        if self.from_collection is None:
+            collection = self.compiler.collection
+        else:
+            collection = self.compiler.get_collection(self.from_collection)
+        if connection.settings_dict.get("USE_FIND") and (find_args := get_find_arguments(pipeline)):
+            args, kwargs = find_args
+            return collection.find(
+                *args,
+                **kwargs,
+                **get_query_options(self.query, "find"),
+                session=connection.session,
+            )
+        return collection.aggregate(
+            pipeline, **get_query_options(self.query, "aggregate"), session=connection.session
         )
 
     def get_pipeline(self):
@@ -91,6 +195,10 @@ class MongoQuery:
             pipeline.extend(query.get_pipeline())
         if self.match_mql:
             pipeline.append({"$match": self.match_mql})
+        if self.facets is not None:
+            # The facets are computed from the filtered documents.
+            pipeline.append({"$facet": self.facets})
+            return pipeline
         if self.aggregation_pipeline:
             pipeline.extend(self.aggregation_pipeline)
         if self.needs_wrap_aggregation:
@@ -131,6 +239,8 @@ class MongoQuery:
                         {"$limit": 1},
                     ]
                 )
+        if self.window_pipeline:
+            pipeline.extend(self.window_pipeline)
         if self.project_fields:
             pipeline.append({"$project": self.project_fields})
         if self.combinator_pipeline:
@@ -143,6 +253,11 @@ class MongoQuery:
             pipeline.append({"$skip": self.query.low_mark})
         if self.query.high_mark is not None:
             pipeline.append({"$limit": self.query.high_mark - self.query.low_mark})
+        if self.compiler.connection.settings_dict.get("OPTIMIZE_PIPELINES", True):
+            pipeline = self.compiler.connection.ops.pipeline_optimizer.optimize(pipeline)
+        if self.related_pipeline:
+            # Look up the related documents of the returned documents only.
+            pipeline.extend(self.related_pipeline)
         if self.subquery_lookup:
             table_output = self.subquery_lookup["as"]
             pipeline = [
@@ -167,6 +282,67 @@ class MongoQuery:
         return pipeline
 
 
+def get_find_arguments(pipeline):
+    """
+    Return the (args, kwargs) to pass to Collection.find() to give the same
+    results as Collection.aggregate(pipeline), or None if the pipeline uses
+    stages that find() doesn't support.
+
+    The pipeline must consist of (in order) any of $match, a $project that only
+    includes fields, $sort, $skip, and $limit.
+    """
+    filter_, projection, kwargs = {}, None, {}
+    stages = iter(pipeline)
+    stage = next(stages, None)
+    if stage and "$match" in stage:
+        filter_ = stage["$match"]
+        stage = next(stages, None)
+    if stage and "$project" in stage:
+        projection = stage["$project"]
+        # Computed fields could be referenced by $sort, which find() applies
+        # before the projection.
+        if any(value != 1 for value in projection.values()):
+            return None
+        stage = next(stages, None)
+    for option in ("sort", "skip", "limit"):
+        if stage and f"${option}" in stage:
+            kwargs[option] = stage[f"${option}"]
+            stage = next(stages, None)
+    if stage is not None:
+        return None
+    if "sort" in kwargs:
+        kwargs["sort"] = list(kwargs["sort"].items())
+    return (filter_, projection), kwargs
+
+
+def get_count_arguments(pipeline):
+    """
+    Return the (filter, kwargs) to pass to Collection.count_documents() to
+    give the number of documents returned by Collection.aggregate(pipeline),
+    or None if the pipeline uses stages that count_documents() doesn't
+    support.
+
+    The pipeline must consist of (in order) an optional $match, any stages
+    that don't change the number of documents ($project, $addFields, and
+    $sort), $skip, and $limit.
+    """
+    filter_, kwargs = {}, {}
+    stages = iter(pipeline)
+    stage = next(stages, None)
+    if stage and "$match" in stage:
+        filter_ = stage["$match"]
+        stage = next(stages, None)
+    while stage and len(stage) == 1 and next(iter(stage)) in {"$project", "$addFields", "$sort"}:
+        stage = next(stages, None)
+    for option in ("skip", "limit"):
+        if stage and f"${option}" in stage:
+            kwargs[option] = stage[f"${option}"]
+            stage = next(stages, None)
+    if stage is not None:
+        return None
+    return filter_, kwargs
+
+
 def extra_where(self, compiler, connection, as_expr=False):  # noqa: ARG001
     raise NotSupportedError("QuerySet.extra() is not supported on MongoDB.")
 
@@ -355,6 +531,66 @@ def join(self, compiler, connection, pushed_filter_expression=None):
     return lookup_pipeline
 
 
+def reverse_join(join, compiler, connection, pushed_filter_expression):
+    """
+    Return the stages that, run on the joined collection, produce the same
+    documents as running join()'s $lookup and $unwind on the parent
+    collection: the joined documents are filtered by
+    `pushed_filter_expression` and each one is replaced by its parent
+    document, with the joined document stored under the join's alias.
+
+    Return None if the join can't be reversed: it must be an INNER JOIN of
+    the queried collection on a single foreign key whose pushed filter only
+    involves the joined collection.
+    """
+    if (
+        join.join_type != INNER
+        or join.parent_alias != compiler.collection_name
+        or join.filtered_relation
+        or len(join.join_fields) != 1
+        or pushed_filter_expression is None
+        or join.join_field.get_extra_restriction(join.table_alias, join.parent_alias)
+    ):
+        return None
+    cols = list(_get_cols(pushed_filter_expression))
+    if any(col.alias != join.table_alias for col in cols):
+        return None
+    ((lhs, rhs),) = join.join_fields
+    lhs_prepared, rhs_prepared = connection.ops.prepare_join_on_clause(
+        join.parent_alias, lhs, compiler.collection_name, rhs
+    )
+    if not (
+        (isinstance(lhs, ForeignKey) or isinstance(rhs, ForeignKey))
+        and lhs_prepared.is_simple_column
+        and rhs_prepared.is_simple_column
+    ):
+        return None
+    # The filter is run on the joined collection, so its columns don't
+    # include the collection name.
+    replacements = {col: Col(compiler.collection_name, col.target) for col in cols}
+    try:
+        match_mql = pushed_filter_expression.replace_expressions(replacements).as_mql(
+            compiler, connection
+        )
+    except FullResultSet:
+        return None
+    parent = compiler.collection_name
+    return [
+        {"$match": match_mql},
+        {
+            "$lookup": {
+                "from": compiler.base_table.table_name,
+                "localField": rhs_prepared.as_mql(compiler, connection),
+                "foreignField": lhs_prepared.as_mql(compiler, connection),
+                "as": parent,
+            }
+        },
+        {"$unwind": f"${parent}"},
+        {"$replaceWith": {"$mergeObjects": [f"${parent}", {join.table_alias: "$$ROOT"}]}},
+        {"$unset": f"{join.table_alias}.{parent}"},
+    ]
+
+
 def where_node(self, compiler, connection, as_expr=False):
     if self.connector == AND:
         full_needed, empty_needed = len(self.children), 1
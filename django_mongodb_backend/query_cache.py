@@ -0,0 +1,201 @@
+from collections import OrderedDict, namedtuple
+
+from django.core.exceptions import FullResultSet
+from django.db.models.expressions import Col
+from django.db.models.lookups import Lookup
+from django.db.models.sql.datastructures import BaseTable
+from django.db.models.sql.query import Query
+from django.db.models.sql.where import AND, OR, WhereNode
+
+from .query import get_query_option
+from .query_utils import is_direct_value
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class CompiledQuery:
+    """
+    A template of a compiled MongoQuery. The MQL of each lookup in the $match
+    stage is a parameter slot that's rebound for every query of the same
+    shape.
+    """
+
+    # Compiler attributes set by pre_sql_setup() that are read by the
+    # QuerySet iterables and results_iter().
+    compiler_attrs = ("select", "klass_info", "annotation_col_map", "col_count", "columns")
+    # MongoQuery attributes set by build_query().
+    query_attrs = ("ordering", "lookup_pipeline", "project_fields", "extra_fields")
+
+    def __init__(self, compiler, query, slots):
+        self.compiler_state = {attr: getattr(compiler, attr) for attr in self.compiler_attrs}
+        self.query_state = {attr: getattr(query, attr) for attr in self.query_attrs}
+        self.match_mql = query.match_mql
+        self.slots = slots
+
+    def bind(self, compiler, lookups):
+        """
+        Return a MongoQuery for `compiler` using the MQL of the given lookups
+        as parameters. Raise EmptyResultSet or FullResultSet if a lookup
+        doesn't compile to a $match condition.
+        """
+        match_mql = self.match_mql
+        for path, lookup in zip(self.slots, lookups, strict=True):
+            # A lookup's value may make it match everything or nothing (e.g.
+            # an empty "in"), in which case the query has a different shape.
+            mql = lookup.as_mql(compiler, compiler.connection)
+            if not mql:
+                raise FullResultSet
+            match_mql = _replace(match_mql, path, mql)
+        for attr, value in self.compiler_state.items():
+            setattr(compiler, attr, value)
+        query = compiler.query_class(compiler)
+        for attr, value in self.query_state.items():
+            setattr(query, attr, value)
+        query.match_mql = match_mql
+        return query
+
+
+class QueryCache:
+    """
+    A least recently used cache of CompiledQuery objects keyed on the shape of
+    the query (see get_query_shape()).
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def get(self, key):
+        try:
+            compiled = self._cache[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return compiled
+
+    def set(self, key, compiled):
+        if self.maxsize <= 0:
+            return
+        self._cache[key] = compiled
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+    def clear(self):
+        self._cache.clear()
+        self.hits = self.misses = 0
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._cache))
+
+
+def get_query_shape(query):
+    """
+    Return a (key, lookups) tuple where key is a hashable representation of
+    the query with the lookup values left out and lookups is a list of the
+    lookups whose MQL varies with those values. Return None if the query is
+    too complex to be cached.
+    """
+    if (
+        type(query) is not Query
+        or query.combinator
+        or query.distinct
+        or query.extra
+        or query.annotations
+        or query.select_related
+        or query.group_by is not None
+        or query.extra_order_by
+        or not all(isinstance(field, str) for field in query.order_by)
+        or get_query_option(query, "with_related")
+    ):
+        return None
+    # Joins (including those from model inheritance) aren't cached.
+    aliases = [alias for alias, count in query.alias_refcount.items() if count]
+    if len(aliases) != 1 or not isinstance(query.alias_map[aliases[0]], BaseTable):
+        return None
+    lookups = []
+    where_shape = _get_where_shape(query.where, lookups)
+    if where_shape is None:
+        return None
+    key = (
+        query.model,
+        aliases[0],
+        where_shape,
+        query.default_cols,
+        query.select,
+        tuple(query.selected.items()) if query.selected else None,
+        query.values_select,
+        (frozenset(query.deferred_loading[0]), query.deferred_loading[1]),
+        query.order_by,
+        tuple(query.get_meta().ordering) if query.default_ordering else None,
+        query.standard_ordering,
+        tuple((get_query_option(query, "array_slices") or {}).items()),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key, lookups
+
+
+def _get_where_shape(node, lookups):
+    if isinstance(node, WhereNode):
+        if node.connector not in (AND, OR):
+            return None
+        children = []
+        for child in node.children:
+            child_shape = _get_where_shape(child, lookups)
+            if child_shape is None:
+                return None
+            children.append(child_shape)
+        return (node.connector, node.negated, tuple(children))
+    # Only lookups comparing a column to a constant are parameterized.
+    if isinstance(node, Lookup) and isinstance(node.lhs, Col) and is_direct_value(node.rhs):
+        lookups.append(node)
+        return (type(node), node.lhs)
+    return None
+
+
+def find_slots(match_mql, mqls):
+    """
+    Return the path of each MQL in `mqls` within match_mql, or None if they
+    can't all be found. The MQLs must appear in the same order as in
+    match_mql.
+    """
+    slots = []
+    remaining = iter(mqls)
+    expected = next(remaining, None)
+
+    def walk(node, path):
+        nonlocal expected
+        if expected is None:
+            return
+        if node == expected:
+            slots.append(path)
+            expected = next(remaining, None)
+        elif isinstance(node, dict):
+            for key, value in node.items():
+                walk(value, (*path, key))
+        elif isinstance(node, list):
+            for index, value in enumerate(node):
+                walk(value, (*path, index))
+
+    walk(match_mql, ())
+    return slots if expected is None and len(slots) == len(mqls) else None
+
+
+def _replace(node, path, value):
+    """Return a copy of node with the item at `path` replaced by value."""
+    if not path:
+        return value
+    key, *rest = path
+    node = node.copy() if isinstance(node, list) else dict(node)
+    node[key] = _replace(node[key], rest, value)
+    return node
@@ -1,17 +1,481 @@
+import base64
+import json
+from functools import reduce
 from itertools import chain
+from operator import or_
 
-from django.core.exceptions import FieldDoesNotExist
-from django.db import connections
-from django.db.models import QuerySet
+from django.core.exceptions import EmptyResultSet, FieldDoesNotExist, ValidationError
+from django.db import NotSupportedError, connections
+from django.db.models import Q, QuerySet
+from django.db.models.query import ModelIterable
 from django.db.models.query import RawModelIterable as BaseRawModelIterable
 from django.db.models.query import RawQuerySet as BaseRawQuerySet
+from django.db.models.sql import Query, UpdateQuery
 from django.db.models.sql.query import RawQuery as BaseRawQuery
+from pymongo import UpdateOne
+from pymongo.read_preferences import SecondaryPreferred
+
+from .fields import ArrayField
+from .query import get_query_option, get_query_options
+
+# The prefix of the fields that hold the documents of with_related().
+WITH_RELATED_PREFIX = "__with_related_"
 
 
 class MongoQuerySet(QuerySet):
+    def count(self, *, hint=None, estimated=False):
+        """
+        Like QuerySet.count() but with MongoDB-specific options:
+
+        - hint: the index to use, like hint().
+        - estimated: if True, use estimated_document_count() (which uses the
+          collection's metadata rather than scanning it) when the QuerySet
+          isn't filtered.
+        """
+        if hint is not None:
+            return self.hint(hint).count(estimated=estimated)
+        if not estimated or self._result_cache is not None:
+            return super().count()
+        connection = connections[self.db]
+        query = self.query
+        if (
+            not query.where
+            and not query.is_sliced
+            and not query.distinct
+            and not query.combinator
+            and query.group_by is None
+            # estimated_document_count() isn't supported in transactions.
+            and connection.session is None
+        ):
+            collection = query.get_compiler(self.db).get_collection(self.model._meta.db_table)
+            return collection.estimated_document_count(
+                **get_query_options(query, "estimated_document_count")
+            )
+        return super().count()
+
+    def bulk_update(self, objs, fields, batch_size=None, *, ordered=True):
+        """
+        Like QuerySet.bulk_update() but send bulk_write()s of UpdateOne
+        operations (batch_size operations per bulk_write()) rather than
+        update_many() with a $switch for each field. If ordered is False,
+        the server may apply the updates in any order and, after an error,
+        continues with the remaining updates.
+        """
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError("Batch size must be a positive integer.")
+        if not fields:
+            raise ValueError("Field names must be given to bulk_update().")
+        objs = tuple(objs)
+        if not all(obj._is_pk_set() for obj in objs):
+            raise ValueError("All bulk_update() objects must have a primary key set.")
+        opts = self.model._meta
+        fields = [opts.get_field(name) for name in fields]
+        if any(not f.concrete or f.many_to_many for f in fields):
+            raise ValueError("bulk_update() can only be used with concrete fields.")
+        if any(f.primary_key for f in fields):
+            raise ValueError("bulk_update() cannot be used with primary key fields.")
+        if self.query.has_filters() or any(
+            f.model._meta.concrete_model is not opts.concrete_model for f in fields
+        ):
+            # Filtered QuerySets and fields of parent models require
+            # Django's implementation.
+            return super().bulk_update(objs, fields=[f.name for f in fields], batch_size=batch_size)
+        if not objs:
+            return 0
+        for obj in objs:
+            obj._prepare_related_fields_for_save(operation_name="bulk_update", fields=fields)
+        self._for_write = True
+        connection = connections[self.db]
+        compiler = self.query.chain(UpdateQuery).get_compiler(self.db)
+        compiler.pre_sql_setup()
+        batch_size = batch_size or len(objs)
+        rows_updated = 0
+        for start in range(0, len(objs), batch_size):
+            requests = []
+            for obj in objs[start : start + batch_size]:
+                values = {}
+                has_expression = False
+                for field in fields:
+                    value = getattr(obj, field.attname)
+                    has_expression |= hasattr(value, "resolve_expression")
+                    values[field.column] = compiler.prepare_value(field, value)
+                requests.append(
+                    UpdateOne(
+                        {opts.pk.column: opts.pk.get_db_prep_value(obj.pk, connection)},
+                        compiler.get_update_expression(values, has_expression),
+                    )
+                )
+            rows_updated += compiler.bulk_write(requests, ordered=ordered)
+        return rows_updated
+
+    bulk_update.alters_data = True
+
+    def _set_query_option(self, name, value):
+        clone = self._chain()
+        # Query.clone() copies the options by reference, so they're replaced
+        # rather than modified.
+        clone.query.mongo_options = {**getattr(clone.query, "mongo_options", {}), name: value}
+        return clone
+
+    def allow_disk_use(self, allow_disk_use=True):
+        """Allow the server to write temporary files for large sorts."""
+        return self._set_query_option("allow_disk_use", allow_disk_use)
+
+    def batch_size(self, batch_size):
+        """Set the number of documents returned by each batch of the cursor."""
+        return self._set_query_option("batch_size", batch_size)
+
+    def collation(self, collation):
+        """
+        Set the collation (a dict or a pymongo.collation.Collation) for
+        string comparisons.
+        """
+        return self._set_query_option("collation", collation)
+
+    def comment(self, comment):
+        """Attach a comment to the operations, e.g. for the profiler."""
+        return self._set_query_option("comment", comment)
+
+    def hint(self, index):
+        """Set the index (a name or a list of (key, direction)) to use."""
+        return self._set_query_option("hint", index)
+
+    def max_time_ms(self, max_time_ms):
+        """Set the time limit, in milliseconds, for processing operations."""
+        return self._set_query_option("max_time_ms", max_time_ms)
+
+    def read_preference(self, read_preference):
+        """
+        Set the read preference (e.g. pymongo.ReadPreference.SECONDARY) of
+        the queries that read data. It's ignored in transactions.
+        """
+        return self._set_query_option("read_preference", read_preference)
+
+    def using_secondary(self, max_staleness=-1):
+        """
+        Read from a secondary (or from the primary if no secondary is
+        available) that's at most max_staleness seconds behind the primary.
+        """
+        return self.read_preference(SecondaryPreferred(max_staleness=max_staleness))
+
+    def slice_array(self, field_name, *args):
+        """
+        Retrieve only part of the array of an ArrayField (or an embedded model
+        array field) using MongoDB's $slice: slice_array(field_name, n) for
+        the first n elements (the last -n if n is negative), or
+        slice_array(field_name, position, n) for n elements starting at
+        position (counted from the end if negative).
+        """
+        field = self.model._meta.get_field(field_name)
+        if not isinstance(field, ArrayField):
+            raise TypeError(f"slice_array() requires an array field, not {field_name!r}.")
+        if not 1 <= len(args) <= 2 or not all(
+            isinstance(arg, int) and not isinstance(arg, bool) for arg in args
+        ):
+            raise TypeError("slice_array() takes n or position and n as integers.")
+        if len(args) == 1 and args[0] == 0:
+            raise ValueError("slice_array() n must not be zero.")
+        if len(args) == 2 and args[1] <= 0:
+            raise ValueError("slice_array() n must be positive when position is given.")
+        slices = getattr(self.query, "mongo_options", {}).get("array_slices", {})
+        return self._set_query_option("array_slices", {**slices, field.name: args})
+
+    def with_related(self, name, *, limit=None, ordering=None):
+        """
+        Load the objects of the reverse foreign key `name` (e.g. "comment_set")
+        in the same query using $lookup, ordered by `ordering` (the related
+        model's ordering by default) and, if `limit` is given, only the first
+        `limit` of them. Like prefetch_related(), the objects are cached so
+        that, e.g., obj.comment_set.all() doesn't query the database.
+        """
+        if self._fields is not None:
+            raise TypeError("with_related() can't be used after values() or values_list().")
+        rel = _get_reverse_relation(self.model, name)
+        if limit is not None and (
+            not isinstance(limit, int) or isinstance(limit, bool) or limit <= 0
+        ):
+            raise ValueError("with_related() limit must be a positive integer.")
+        related_opts = rel.related_model._meta
+        if ordering is None:
+            ordering = related_opts.ordering
+        sort = {}
+        for item in ordering:
+            if not isinstance(item, str) or item == "?":
+                raise ValueError(f"with_related() doesn't support ordering by {item!r}.")
+            field_name = item.removeprefix("-")
+            field = related_opts.pk if field_name == "pk" else related_opts.get_field(field_name)
+            if not field.concrete or (field.is_relation and field_name != field.attname):
+                raise ValueError(
+                    "with_related() only supports ordering by the related model's "
+                    f"fields, not {item!r}."
+                )
+            sort[field.column] = -1 if item.startswith("-") else 1
+        pipeline = []
+        if sort:
+            pipeline.append({"$sort": sort})
+        if limit is not None:
+            pipeline.append({"$limit": limit})
+        lookup = {
+            "from": related_opts.db_table,
+            "localField": rel.field.target_field.column,
+            "foreignField": rel.field.column,
+            "pipeline": pipeline,
+            "as": f"{WITH_RELATED_PREFIX}{name}",
+        }
+        with_related = getattr(self.query, "mongo_options", {}).get("with_related", {})
+        clone = self._set_query_option("with_related", {**with_related, name: lookup})
+        clone._iterable_class = WithRelatedModelIterable
+        return clone
+
+    def facets(self, **facets):
+        """
+        Compute several facets of this QuerySet's rows in a single query
+        using $facet so that the collection is scanned once. Each facet is
+        either a QuerySet of this QuerySet's model (e.g. one using values()
+        and annotate()), which is evaluated as if it were filtered like this
+        QuerySet, or a dict of aggregate expressions, which is computed like
+        aggregate(). Return a dict mapping each facet's name to its results:
+        a list for a QuerySet and a dict for aggregate expressions.
+        """
+        self._not_support_combined_queries("facets")
+        if self.query.is_sliced:
+            raise TypeError("Cannot use facets() after a slice has been taken.")
+        for facet in facets.values():
+            if isinstance(facet, dict):
+                for alias, aggregate in facet.items():
+                    if not getattr(aggregate, "contains_aggregate", False):
+                        raise TypeError(f"{alias} is not an aggregate expression")
+            elif not isinstance(facet, QuerySet) or facet.model is not self.model:
+                raise TypeError(
+                    f"facets() arguments must be QuerySets of {self.model.__name__} or "
+                    f"dicts of aggregate expressions, not {facet!r}."
+                )
+        if not facets:
+            return {}
+        compiler = self.query.get_compiler(self.db)
+        try:
+            compiler.pre_sql_setup()
+            query = compiler.build_query()
+        except EmptyResultSet:
+            return {
+                name: self.none().aggregate(**facet) if isinstance(facet, dict) else []
+                for name, facet in facets.items()
+            }
+        if compiler.aggregation_pipeline or compiler.window_pipeline or self.query.distinct:
+            raise NotSupportedError(
+                "facets() doesn't support QuerySets that use aggregation, window "
+                "expressions, or distinct()."
+            )
+        query.facets = {}
+        for name, facet in facets.items():
+            facet_query = (
+                _get_aggregation_query(self.model, facet)
+                if isinstance(facet, dict)
+                else facet.query
+            )
+            facet_compiler = facet_query.get_compiler(self.db)
+            try:
+                facet_compiler.pre_sql_setup()
+                facet_mongo_query = facet_compiler.build_query(
+                    facet_compiler.get_project_columns(facet_compiler.columns)
+                )
+            except EmptyResultSet:
+                continue
+            # An aggregation of no documents gives no results (rather than a
+            # document of default values) so that aggregate() returns its
+            # defaults.
+            facet_mongo_query.needs_wrap_aggregation = False
+            # A facet's pipeline can't be empty.
+            query.facets[name] = facet_mongo_query.get_pipeline() or [{"$match": {}}]
+        documents = next(query.get_cursor()) if query.facets else {}
+        # Each facet's documents are converted by its QuerySet like the
+        # results of its own query.
+        results = {}
+        for name, facet in facets.items():
+            facet_documents = documents.get(name, [])
+            if isinstance(facet, dict):
+                queryset = _with_facet_documents(self.model._base_manager.all(), facet_documents)
+                results[name] = queryset.aggregate(**facet)
+            else:
+                results[name] = list(_with_facet_documents(facet, facet_documents))
+        return results
+
     def raw_aggregate(self, pipeline, using=None):
         return RawQuerySet(pipeline, model=self.model, using=using)
 
+    def seek(self, after=None, *, ordering=None):
+        """
+        Return a QuerySet ordered by `ordering` (this QuerySet's ordering by
+        default) with the primary key as a tiebreaker. If `after` is a token
+        returned by seek_token(), only the rows that follow the row that the
+        token was made from are returned.
+        """
+        ordering = self._get_seek_ordering(ordering)
+        qs = self.order_by(
+            *(f"-{name}" if descending else name for name, _, descending in ordering)
+        )
+        if after is not None:
+            qs = qs.filter(_get_seek_condition(ordering, _decode_seek_token(after, ordering)))
+        return qs
+
+    def seek_token(self, obj):
+        """
+        Return an opaque token that seek() uses to return the rows that follow
+        obj in this QuerySet's ordering.
+        """
+        values = [
+            None if field.value_from_object(obj) is None else field.value_to_string(obj)
+            for _, field, _ in self._get_seek_ordering(None)
+        ]
+        return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    def _get_seek_ordering(self, ordering):
+        """
+        Return a list of (name, field, descending) tuples for the ordering of
+        seek(), ending with the primary key.
+        """
+        if ordering is None:
+            query = self.query
+            ordering = query.order_by or (
+                query.get_meta().ordering if query.default_ordering else ()
+            )
+        opts = self.model._meta
+        result = []
+        for item in ordering:
+            if not isinstance(item, str) or item == "?":
+                raise ValueError(f"seek() doesn't support ordering by {item!r}.")
+            descending = item.startswith("-")
+            name = item.removeprefix("-")
+            if name == "pk" or name == opts.pk.name:
+                result.append(("pk", opts.pk, descending))
+                break
+            field = opts.get_field(name)
+            # Ordering by a relation uses the related model's ordering.
+            if not field.concrete or (field.is_relation and name != field.attname):
+                raise ValueError(
+                    f"seek() only supports ordering by the model's fields, not {item!r}."
+                )
+            result.append((name, field, descending))
+        else:
+            result.append(("pk", opts.pk, False))
+        return result
+
+
+def _with_facet_documents(queryset, documents):
+    """
+    Return a copy of queryset whose query returns the documents of a facet
+    of MongoQuerySet.facets() rather than querying the database.
+    """
+    clone = queryset._chain()
+    clone.query.mongo_options = {
+        **getattr(clone.query, "mongo_options", {}),
+        "facet_documents": documents,
+    }
+    return clone
+
+
+def _get_aggregation_query(model, aggregates):
+    """
+    Return a Query that computes the aggregate expressions (a dict mapping
+    aliases to expressions) over all of model's rows, like aggregate().
+    """
+    query = Query(model)
+    for alias, aggregate in aggregates.items():
+        query.add_annotation(aggregate, alias)
+    query.default_cols = False
+    return query
+
+
+def _get_reverse_relation(model, name):
+    """Return the reverse foreign key of `model` with the accessor `name`."""
+    for rel in model._meta.related_objects:
+        if rel.one_to_many and rel.accessor_name == name:
+            return rel
+    raise ValueError(f"with_related() requires a reverse foreign key, not {name!r}.")
+
+
+class WithRelatedModelIterable(ModelIterable):
+    """
+    Yield a model instance for each row with the related objects loaded by
+    with_related() stored in its prefetched objects cache.
+    """
+
+    def __iter__(self):
+        queryset = self.queryset
+        db = queryset.db
+        connection = connections[db]
+        relations = [
+            (_get_reverse_relation(queryset.model, name), f"{WITH_RELATED_PREFIX}{name}")
+            for name in get_query_option(queryset.query, "with_related")
+        ]
+        for obj in super().__iter__():
+            for rel, attname in relations:
+                related_objs = [
+                    _from_document(rel.related_model, document, db, connection)
+                    for document in obj.__dict__.pop(attname, None) or ()
+                ]
+                for related_obj in related_objs:
+                    rel.field.set_cached_value(related_obj, obj)
+                qs = getattr(obj, rel.accessor_name).get_queryset()
+                qs._result_cache = related_objs
+                qs._prefetch_done = True
+                try:
+                    obj._prefetched_objects_cache[rel.cache_name] = qs
+                except AttributeError:
+                    obj._prefetched_objects_cache = {rel.cache_name: qs}
+            yield obj
+
+
+def _from_document(model, document, db, connection):
+    """Return an instance of `model` loaded from one of its documents."""
+    connection.ops._convert_embedded_model_value(model, document, connection)
+    fields = model._meta.concrete_fields
+    return model.from_db(
+        db, [field.attname for field in fields], [document.get(field.column) for field in fields]
+    )
+
+
+def _decode_seek_token(token, ordering):
+    """Return the values of the fields in `ordering` stored in `token`."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(token))
+        if not isinstance(values, list) or len(values) != len(ordering):
+            raise ValueError
+        return [
+            None if value is None else field.to_python(value)
+            for (_, field, _), value in zip(ordering, values, strict=True)
+        ]
+    except (TypeError, ValueError, ValidationError) as e:
+        raise ValueError(f"Invalid seek token: {token!r}.") from e
+
+
+def _get_seek_condition(ordering, values):
+    """
+    Return a Q object that matches the rows that follow the row with the
+    given values in the given ordering, e.g. for ordering (a, b, pk):
+    a > va OR (a = va AND b > vb) OR (a = va AND b = vb AND pk > vpk).
+    Null values sort before all other values.
+    """
+    conditions = []
+    equal = Q()
+    for (name, _, descending), value in zip(ordering, values, strict=True):
+        if descending:
+            follows = (
+                Q(**{f"{name}__lt": value}) | Q(**{f"{name}__isnull": True})
+                if value is not None
+                else None
+            )
+        else:
+            follows = (
+                Q(**{f"{name}__gt": value})
+                if value is not None
+                else Q(**{f"{name}__isnull": False})
+            )
+        if follows is not None:
+            conditions.append(equal & follows)
+        equal &= Q(**{name: value})
+    return reduce(or_, conditions)
+
 
 class RawQuerySet(BaseRawQuerySet):
     def __init__(self, pipeline, model=None, using=None):
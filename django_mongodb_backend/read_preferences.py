@@ -0,0 +1,35 @@
+from functools import wraps
+
+from django.db import connections, router
+from django.db.models.deletion import Collector
+from django.db.models.query import QuerySet
+
+
+def _reads_from_primary(method, get_using):
+    """
+    Wrap method so that its reads use the primary of the database that
+    get_using(self) returns (if it's a MongoDB database) rather than a
+    read preference.
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        connection = connections[get_using(self)]
+        if connection.vendor != "mongodb":
+            return method(self, *args, **kwargs)
+        with connection.reads_from_primary():
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def register_read_preferences():
+    # Collecting the objects to delete (e.g. cascades) happens before
+    # deletion enters atomic(), and a lagging secondary could miss some.
+    Collector.collect = _reads_from_primary(Collector.collect, lambda self: self.using)
+    # get_or_create()'s get() decides whether to write, so, like Django, read
+    # from the database used for writes.
+    QuerySet.get_or_create = _reads_from_primary(
+        QuerySet.get_or_create,
+        lambda self: self._db or router.db_for_write(self.model, **self._hints),
+    )
@@ -1,4 +1,5 @@
 from django.apps import apps
+from pymongo.read_preferences import SecondaryPreferred
 
 from django_mongodb_backend.models import EmbeddedModel
 
@@ -16,3 +17,18 @@ class MongoRouter:
         except LookupError:
             return None
         return False if issubclass(model, EmbeddedModel) else None
+
+
+class SecondaryReadsRouter:
+    """
+    Make QuerySets read from secondaries, except in transactions and atomic()
+    blocks. Writes always go to the primary.
+
+    Subclasses can set read_preference or override read_preference_for_read()
+    to choose the read preference per model.
+    """
+
+    read_preference = SecondaryPreferred()
+
+    def read_preference_for_read(self, model, **hints):
+        return self.read_preference
@@ -99,6 +99,7 @@ class BaseSchemaEditor(BaseDatabaseSchemaEditor):
             if field.remote_field.through._meta.auto_created:
                 self.delete_model(field.remote_field.through)
         self.get_collection(model._meta.db_table).drop()
+        self.connection.search_index_cache.clear(model._meta.db_table)
 
     @ignore_embedded_models
     def add_field(self, model, field):
@@ -416,14 +417,15 @@ class BaseSchemaEditor(BaseDatabaseSchemaEditor):
         if old_db_table == new_db_table:
             return
         self.get_collection(old_db_table).rename(new_db_table)
+        self.connection.search_index_cache.clear(old_db_table)
+        self.connection.search_index_cache.clear(new_db_table)
 
     def _field_should_have_unique(self, field):
         db_type = field.db_type(self.connection)
         # The _id column is automatically unique.
         return db_type and field.unique and field.column != "_id"
 
-    @staticmethod
-    def wait_until_index_created(collection, index_name, timeout=60 * 60, interval=0.5):
+    def wait_until_index_created(self, collection, index_name, timeout=60 * 60, interval=0.5):
         """
         Wait up to an hour until an index is created. Index creation time
         depends on the size of the collection being indexed.
@@ -433,17 +435,18 @@ class BaseSchemaEditor(BaseDatabaseSchemaEditor):
             indexes = list(collection.list_search_indexes())
             for idx in indexes:
                 if idx["name"] == index_name and idx["status"] == "READY":
+                    self.connection.search_index_cache.clear(collection.name)
                     return True
             sleep(interval)
         raise TimeoutError(f"Index {index_name} not ready after {timeout} seconds.")
 
-    @staticmethod
-    def wait_until_index_dropped(collection, index_name, timeout=60, interval=0.5):
+    def wait_until_index_dropped(self, collection, index_name, timeout=60, interval=0.5):
         """Wait up to 60 seconds until an index is dropped."""
         start = monotonic()
         while monotonic() - start < timeout:
             indexes = list(collection.list_search_indexes())
             if all(idx["name"] != index_name for idx in indexes):
+                self.connection.search_index_cache.clear(collection.name)
                 return True
             sleep(interval)
         raise TimeoutError(f"Index {index_name} not dropped after {timeout} seconds.")
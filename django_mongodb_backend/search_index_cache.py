@@ -0,0 +1,48 @@
+from time import monotonic
+
+
+class SearchIndexCache:
+    """
+    A cache of each collection's search indexes, as returned by
+    Collection.list_search_indexes(), and of the index that SearchExpressions
+    resolve to. A collection's entry expires after `timeout` seconds (never if
+    None) and is cleared by the schema editor when it creates or drops a
+    search index.
+    """
+
+    def __init__(self, timeout=60):
+        self.timeout = timeout
+        # {collection name: (expiry time, search indexes, {key: index name})}
+        self._cache = {}
+
+    def __len__(self):
+        return len(self._cache)
+
+    def get_index(self, collection, key, resolve):
+        """
+        Return the name of the collection's search index for `key` (e.g. the
+        type of index and the paths to search), calling
+        resolve(search_indexes) to find it if it isn't cached.
+        """
+        now = monotonic()
+        try:
+            expires, search_indexes, resolved = self._cache[collection.name]
+        except KeyError:
+            expires = None
+        if expires is None or expires <= now:
+            search_indexes = list(collection.list_search_indexes())
+            expires = float("inf") if self.timeout is None else now + self.timeout
+            resolved = {}
+            self._cache[collection.name] = (expires, search_indexes, resolved)
+        try:
+            return resolved[key]
+        except KeyError:
+            name = resolved[key] = resolve(search_indexes)
+            return name
+
+    def clear(self, collection_name=None):
+        """Clear the entry of collection_name, or of all collections."""
+        if collection_name is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(collection_name, None)
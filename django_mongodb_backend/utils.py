@@ -62,22 +62,39 @@ def set_wrapped_methods(cls):
     return cls
 
 
+def format_arguments(args, kwargs=None):
+    """
+    Format the arguments of a PyMongo method call for logging. The session
+    isn't included since it doesn't affect the operation.
+    """
+    return ", ".join(
+        [
+            *(repr(arg) for arg in args),
+            *(f"{key}={value!r}" for key, value in (kwargs or {}).items() if key != "session"),
+        ]
+    )
+
+
 @set_wrapped_methods
 class OperationDebugWrapper:
     # The PyMongo database and collection methods that this backend uses.
     wrapped_methods = {
         "aggregate",
+        "bulk_write",
         "command",
+        "count_documents",
         "create_collection",
         "create_indexes",
         "create_search_index",
         "drop",
+        "find",
         "find_one",
         "index_information",
         "insert_many",
         "delete_many",
         "drop_index",
         "drop_search_index",
+        "estimated_document_count",
         "list_search_indexes",
         "rename",
         "update_many",
@@ -101,10 +118,8 @@ class OperationDebugWrapper:
         return duration, retval
 
     def log(self, op, duration, args, kwargs=None):
-        # If kwargs are used by any operations in the future, they must be
-        # added to this logging.
         msg = "(%.3f) %s"
-        args = ", ".join(repr(arg) for arg in args)
+        args = format_arguments(args, kwargs)
         operation = f"db.{self.collection_name}{op}({args})"
         if len(settings.DATABASES) > 1:
             msg += f"; alias={self.db.alias}"
@@ -140,7 +155,7 @@ class OperationCollector(OperationDebugWrapper):
         self.collected_sql = collected_sql
 
     def log(self, op, args, kwargs=None):
-        args = ", ".join(repr(arg) for arg in args)
+        args = format_arguments(args, kwargs)
         operation = f"db.{self.collection_name}{op}({args})"
         self.collected_sql.append(operation)
 
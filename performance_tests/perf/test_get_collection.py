@@ -0,0 +1,85 @@
+"""Micro-benchmarks for DatabaseWrapper.get_collection().
+
+Every query calls get_collection() once, so these measure the per-query
+overhead of looking up a collection rather than a document throughput.
+"""
+
+from unittest import TestCase
+
+from django.db import connection
+from pymongo.collection import Collection
+from pymongo.read_preferences import SecondaryPreferred
+
+from .base import PerformanceTest, result_data
+from .models import SmallFlatModel
+
+
+class GetCollectionTest(PerformanceTest):
+    """Parent class for get_collection() micro-benchmarks."""
+
+    data_size = 0
+    kwargs = {}
+
+    def setUp(self):
+        super().setUp()
+        self.name = SmallFlatModel._meta.db_table
+        # Connect outside of the timed task.
+        connection.get_collection(self.name)
+
+    def tearDown(self):
+        # Report operations per second instead of megabytes per second.
+        median = self.percentile(50)
+        if median is None:
+            # Test failed.
+            return
+        ops_per_sec = self.num_docs / median
+        print(  # noqa: T201
+            f"Completed {self.__class__.__name__} {ops_per_sec:.0f} ops/s, "
+            f"MEDIAN={median:.6f}s, iterations={len(self.results)}"
+        )
+        result_data.append(
+            {
+                "info": {
+                    "test_name": self.__class__.__name__[4:],
+                },
+                "metrics": [
+                    {
+                        "name": "operations_per_sec",
+                        "type": "MEDIAN",
+                        "value": ops_per_sec,
+                        "metadata": {
+                            "improvement_direction": "up",
+                            "measurement_unit": "operations_per_second",
+                        },
+                    },
+                ],
+            }
+        )
+
+
+class TestGetCollection(GetCollectionTest, TestCase):
+    """Getting a collection from the connection's cache."""
+
+    def do_task(self):
+        for _ in range(self.num_docs):
+            connection.get_collection(self.name, **self.kwargs)
+
+
+class TestGetCollectionReadPreference(TestGetCollection):
+    """Getting a collection with a read preference from the cache."""
+
+    kwargs = {"read_preference": SecondaryPreferred()}
+
+
+class TestGetCollectionUncached(GetCollectionTest, TestCase):
+    """Creating a new Collection, as get_collection() did before caching."""
+
+    def do_task(self):
+        for _ in range(self.num_docs):
+            Collection(connection.database, self.name, **self.kwargs)
+
+
+class TestGetCollectionUncachedReadPreference(TestGetCollectionUncached):
+    """Creating a new Collection with a read preference."""
+
+    kwargs = {"read_preference": SecondaryPreferred()}
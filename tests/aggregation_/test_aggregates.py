@@ -0,0 +1,193 @@
+from bson import SON
+from django.db import NotSupportedError
+from django.db.models import F, Q, StringAgg, Value
+from django.test import TestCase
+
+from django_mongodb_backend.aggregates import Median, Percentile
+from django_mongodb_backend.test import MongoTestCaseMixin
+
+from .models import Author
+
+
+class StringAggTests(MongoTestCaseMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Author.objects.create(name="Carol", age=40)
+        Author.objects.create(name="Alice", age=40)
+        Author.objects.create(name="Bob", age=60)
+        Author.objects.create(name="Alice", age=60)
+
+    def test_order_by(self):
+        with self.assertNumQueries(1) as ctx:
+            result = list(
+                Author.objects.values("age")
+                .annotate(names=StringAgg("name", Value(","), order_by="-name"))
+                .order_by("age")
+            )
+        self.assertEqual(
+            result, [{"age": 40, "names": "Carol,Alice"}, {"age": 60, "names": "Bob,Alice"}]
+        )
+        self.assertAggregateQuery(
+            ctx.captured_queries[0]["sql"],
+            "aggregation__author",
+            [
+                {
+                    "$group": {
+                        "_id": {"age": "$age"},
+                        "names": {"$push": {"value": "$name", "key0": "$name"}},
+                    }
+                },
+                {"$addFields": {"age": "$_id.age"}},
+                {"$unset": "_id"},
+                {
+                    "$project": {
+                        "age": 1,
+                        "names": {
+                            "$reduce": {
+                                "input": {
+                                    "$filter": {
+                                        "input": {
+                                            "$map": {
+                                                "input": {
+                                                    "$sortArray": {
+                                                        "input": "$names",
+                                                        "sortBy": {"key0": -1},
+                                                    }
+                                                },
+                                                "in": "$$this.value",
+                                            }
+                                        },
+                                        "cond": {"$ne": ["$$this", None]},
+                                    }
+                                },
+                                "initialValue": None,
+                                "in": {
+                                    "$cond": {
+                                        "if": {"$eq": ["$$value", None]},
+                                        "then": "$$this",
+                                        "else": {
+                                            "$concat": ["$$value", {"$literal": ","}, "$$this"]
+                                        },
+                                    }
+                                },
+                            }
+                        },
+                    }
+                },
+                {"$sort": SON([("age", 1)])},
+            ],
+        )
+
+    def test_order_by_multiple(self):
+        result = Author.objects.aggregate(
+            names=StringAgg("name", Value(";"), order_by=[F("age").desc(), "name"])
+        )
+        self.assertEqual(result, {"names": "Alice;Bob;Alice;Carol"})
+
+    def test_distinct(self):
+        result = Author.objects.aggregate(
+            names=StringAgg("name", Value(","), distinct=True, order_by="name")
+        )
+        self.assertEqual(result, {"names": "Alice,Bob,Carol"})
+
+    def test_filter(self):
+        result = Author.objects.aggregate(
+            names=StringAgg("name", Value(","), filter=Q(age=60), order_by="name")
+        )
+        self.assertEqual(result, {"names": "Alice,Bob"})
+
+    def test_empty(self):
+        result = Author.objects.filter(age__gt=100).aggregate(
+            names=StringAgg("name", Value(",")),
+            default=StringAgg("name", Value(","), default=Value("")),
+        )
+        self.assertEqual(result, {"names": None, "default": ""})
+
+    def test_unsupported_nulls_last(self):
+        msg = "StringAgg.order_by doesn't support nulls_first and nulls_last on MongoDB."
+        with self.assertRaisesMessage(NotSupportedError, msg):
+            Author.objects.aggregate(
+                names=StringAgg("name", Value(","), order_by=F("name").asc(nulls_last=True))
+            )
+
+
+class PercentileTests(MongoTestCaseMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for name, age in (("a", 10), ("a", 20), ("b", 30), ("b", 40), ("b", 50)):
+            Author.objects.create(name=name, age=age, rating=None if age == 50 else age / 10)
+
+    def test_percentile(self):
+        with self.assertNumQueries(1) as ctx:
+            result = Author.objects.aggregate(p50=Percentile("age", 0.5))
+        self.assertEqual(result, {"p50": 30})
+        self.assertAggregateQuery(
+            ctx.captured_queries[0]["sql"],
+            "aggregation__author",
+            [
+                {
+                    "$group": {
+                        "_id": None,
+                        "p50": {
+                            "$percentile": {
+                                "input": "$age",
+                                "p": [0.5],
+                                "method": "approximate",
+                            }
+                        },
+                    }
+                },
+                {"$addFields": {"__now": "$$NOW"}},
+                {"$unionWith": {"pipeline": [{"$documents": [{}]}]}},
+                {"$limit": 1},
+                {"$project": {"p50": {"$arrayElemAt": ["$p50", 0]}}},
+            ],
+        )
+
+    def test_percentile_group_by(self):
+        result = Author.objects.values("name").annotate(p100=Percentile("age", 1)).order_by("name")
+        self.assertSequenceEqual(result, [{"name": "a", "p100": 20}, {"name": "b", "p100": 50}])
+
+    def test_percentile_ignores_null(self):
+        result = Author.objects.aggregate(p100=Percentile("rating", 1))
+        self.assertEqual(result, {"p100": 4})
+
+    def test_percentile_filter_and_default(self):
+        result = Author.objects.aggregate(
+            p0=Percentile("age", 0, filter=Q(age__gt=20)),
+            empty=Percentile("age", 0.5, filter=Q(age__gt=100), default=0),
+        )
+        self.assertEqual(result, {"p0": 30, "empty": 0})
+
+    def test_invalid_percentile(self):
+        msg = "Percentile's percentile must be a number between 0 and 1."
+        for percentile in (-0.1, 1.5, "0.5", True, None):
+            with (
+                self.subTest(percentile=percentile),
+                self.assertRaisesMessage(ValueError, msg),
+            ):
+                Percentile("age", percentile)
+
+    def test_median(self):
+        with self.assertNumQueries(1) as ctx:
+            result = Author.objects.aggregate(median=Median("age"))
+        self.assertEqual(result, {"median": 30})
+        self.assertAggregateQuery(
+            ctx.captured_queries[0]["sql"],
+            "aggregation__author",
+            [
+                {
+                    "$group": {
+                        "_id": None,
+                        "median": {"$median": {"input": "$age", "method": "approximate"}},
+                    }
+                },
+                {"$addFields": {"__now": "$$NOW"}},
+                {"$unionWith": {"pipeline": [{"$documents": [{}]}]}},
+                {"$limit": 1},
+                {"$project": {"median": "$median"}},
+            ],
+        )
+
+    def test_median_default_alias(self):
+        self.assertEqual(Author.objects.aggregate(Median("age")), {"age__median": 30})
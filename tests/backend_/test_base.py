@@ -4,8 +4,12 @@ from django.core.exceptions import ImproperlyConfigured
 from django.db import NotSupportedError, connection
 from django.db.backends.signals import connection_created
 from django.test import SimpleTestCase, TestCase
+from pymongo import ReadPreference
+from pymongo.read_preferences import Nearest, SecondaryPreferred
+from pymongo.write_concern import WriteConcern
 
 from django_mongodb_backend.base import DatabaseWrapper
+from django_mongodb_backend.utils import OperationDebugWrapper
 
 
 class DatabaseWrapperTests(SimpleTestCase):
@@ -148,6 +152,60 @@ class DatabaseWrapperConnectionTests(TestCase):
         self.assertEqual(data, {})
 
 
+class GetCollectionTests(TestCase):
+    def test_cached(self):
+        collection = connection.get_collection("foo")
+        self.assertIs(connection.get_collection("foo"), collection)
+        self.assertIsNot(connection.get_collection("bar"), collection)
+
+    def test_cached_by_options(self):
+        collection = connection.get_collection("foo", read_preference=SecondaryPreferred())
+        self.assertEqual(collection.read_preference, SecondaryPreferred())
+        self.assertIs(
+            connection.get_collection("foo", read_preference=SecondaryPreferred()), collection
+        )
+        self.assertIsNot(connection.get_collection("foo"), collection)
+        self.assertIsNot(
+            connection.get_collection("foo", read_preference=ReadPreference.NEAREST), collection
+        )
+
+    def test_cached_by_read_preference_tags(self):
+        collection = connection.get_collection(
+            "foo", read_preference=Nearest(tag_sets=[{"dc": "east"}])
+        )
+        self.assertIs(
+            connection.get_collection("foo", read_preference=Nearest(tag_sets=[{"dc": "east"}])),
+            collection,
+        )
+        self.assertIsNot(
+            connection.get_collection("foo", read_preference=Nearest(tag_sets=[{"dc": "west"}])),
+            collection,
+        )
+
+    def test_cached_by_write_concern(self):
+        collection = connection.get_collection("foo", write_concern=WriteConcern(w=1))
+        self.assertIs(connection.get_collection("foo", write_concern=WriteConcern(w=1)), collection)
+        self.assertIsNot(
+            connection.get_collection("foo", write_concern=WriteConcern(w="majority")), collection
+        )
+
+    def test_queries_logged(self):
+        """The cached collection is wrapped when queries are logged."""
+        collection = connection.get_collection("foo")
+        with self.assertNumQueries(0):
+            wrapper = connection.get_collection("foo")
+        self.assertIsInstance(wrapper, OperationDebugWrapper)
+        self.assertIs(wrapper.collection, collection)
+
+    def test_close_pool(self):
+        """connection.close_pool() clears the cache."""
+        collection = connection.get_collection("foo")
+        connection.close_pool()
+        new_collection = connection.get_collection("foo")
+        self.assertIsNot(new_collection, collection)
+        self.assertIs(new_collection.database.client, connection.connection)
+
+
 class CursorTests(TestCase):
     def test_callproc(self):
         msg = "MongoDB does not support cursor.callproc()."
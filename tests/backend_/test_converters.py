@@ -0,0 +1,74 @@
+from django.db import connection
+from django.test import SimpleTestCase
+
+from django_mongodb_backend.converters import get_chunk_converter, preserves_null
+
+
+def add_one(value, expression, connection):  # noqa: ARG001
+    return value + 1
+
+
+@preserves_null
+def double(value, expression, connection):  # noqa: ARG001
+    return None if value is None else value * 2
+
+
+def null_to_zero(value, expression, connection):  # noqa: ARG001
+    return 0 if value is None else value
+
+
+class GetChunkConverterTests(SimpleTestCase):
+    def test_single_column(self):
+        convert_chunk = get_chunk_converter({1: ([double], None)}, connection)
+        chunk = [["a", 1], ["b", None]]
+        self.assertIs(convert_chunk(chunk), chunk)
+        self.assertEqual(chunk, [["a", 2], ["b", None]])
+
+    def test_multiple_columns(self):
+        convert_chunk = get_chunk_converter(
+            {0: ([double], None), 2: ([null_to_zero], None)}, connection
+        )
+        self.assertEqual(
+            convert_chunk([[1, "a", None], [None, "b", 3]]), [[2, "a", 0], [None, "b", 3]]
+        )
+
+    def test_converter_chain(self):
+        """Converters are applied in order."""
+        convert_chunk = get_chunk_converter({0: ([double, add_one], None)}, connection)
+        self.assertEqual(convert_chunk([[1], [2]]), [[3], [5]])
+
+    def test_null(self):
+        """
+        None is passed to the column's converters unless they all preserve
+        null.
+        """
+        convert_chunk = get_chunk_converter({0: ([double, null_to_zero], None)}, connection)
+        self.assertEqual(convert_chunk([[None]]), [[0]])
+        # add_one() would raise TypeError if called.
+        convert_chunk = get_chunk_converter({0: ([double, add_one], None)}, connection)
+        with self.assertRaises(TypeError):
+            convert_chunk([[None]])
+
+    def test_arguments(self):
+        calls = []
+
+        def converter(value, expression, connection):
+            calls.append((value, expression, connection))
+            return value
+
+        expression = object()
+        get_chunk_converter({0: ([converter], expression)}, connection)([[1]])
+        self.assertEqual(calls, [(1, expression, connection)])
+
+    def test_operations_converters(self):
+        """The backend's converters preserve null."""
+        for name in (
+            "convert_datefield_value",
+            "convert_datetimefield_value",
+            "convert_decimalfield_value",
+            "convert_integerfield_value",
+            "convert_uuidfield_value",
+        ):
+            with self.subTest(name=name):
+                self.assertIs(getattr(connection.ops, name).preserves_null, True)
+        self.assertIs(hasattr(connection.ops.convert_jsonfield_value, "preserves_null"), False)
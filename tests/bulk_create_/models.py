@@ -0,0 +1,17 @@
+from django.db import models
+
+
+class Product(models.Model):
+    sku = models.CharField(max_length=10, unique=True)
+    name = models.CharField(max_length=20)
+    price = models.IntegerField(default=0)
+    stock = models.IntegerField(default=0)
+
+    def __str__(self):
+        return self.sku
+
+
+class Item(models.Model):
+    code = models.CharField(max_length=10, unique=True, null=True)
+    data = models.JSONField(unique=True, null=True)
+    value = models.IntegerField(default=0)
@@ -0,0 +1,122 @@
+from django.db import IntegrityError
+from django.test import TestCase
+
+from .models import Item, Product
+
+
+class BulkCreateIgnoreConflictsTests(TestCase):
+    def test_ignore_conflicts(self):
+        Product.objects.create(sku="a", name="Old")
+        with self.assertNumQueries(1) as ctx:
+            Product.objects.bulk_create(
+                [Product(sku="a", name="New"), Product(sku="b", name="B"), Product(sku="c")],
+                ignore_conflicts=True,
+            )
+        self.assertIn("ordered=False", ctx.captured_queries[0]["sql"])
+        self.assertQuerySetEqual(
+            Product.objects.order_by("sku"),
+            [("a", "Old"), ("b", "B"), ("c", "")],
+            lambda p: (p.sku, p.name),
+        )
+
+    def test_duplicates_in_objs(self):
+        Product.objects.bulk_create(
+            [Product(sku="a", name="1"), Product(sku="a", name="2")], ignore_conflicts=True
+        )
+        self.assertEqual(Product.objects.get().name, "1")
+
+    def test_without_ignore_conflicts(self):
+        Product.objects.create(sku="a")
+        with self.assertRaisesMessage(IntegrityError, "duplicate key error"):
+            Product.objects.bulk_create([Product(sku="a"), Product(sku="b")])
+
+
+class BulkCreateUpdateConflictsTests(TestCase):
+    def test_update_conflicts(self):
+        existing = Product.objects.create(sku="a", name="Old", price=1, stock=5)
+        with self.assertNumQueries(2) as ctx:
+            objs = Product.objects.bulk_create(
+                [Product(sku="a", name="New", price=2, stock=0), Product(sku="b", price=3)],
+                update_conflicts=True,
+                unique_fields=["sku"],
+                update_fields=["price"],
+            )
+        self.assertIn(".bulk_write([UpdateOne(", ctx.captured_queries[0]["sql"])
+        self.assertIn(".find(", ctx.captured_queries[1]["sql"])
+        # The primary keys of the inserted and updated objects are set.
+        self.assertEqual(objs[0].pk, existing.pk)
+        self.assertEqual(objs[1].pk, Product.objects.get(sku="b").pk)
+        # Only update_fields are updated.
+        self.assertQuerySetEqual(
+            Product.objects.order_by("sku"),
+            [("a", "Old", 2, 5), ("b", "", 3, 0)],
+            lambda p: (p.sku, p.name, p.price, p.stock),
+        )
+
+    def test_insert_only(self):
+        """Existing documents aren't queried if all objects are inserted."""
+        with self.assertNumQueries(1):
+            objs = Product.objects.bulk_create(
+                [Product(sku="a"), Product(sku="b")],
+                update_conflicts=True,
+                unique_fields=["sku"],
+                update_fields=["name"],
+            )
+        self.assertEqual([obj.pk for obj in objs], [p.pk for p in Product.objects.order_by("sku")])
+
+    def test_idempotent(self):
+        for _ in range(2):
+            Product.objects.bulk_create(
+                [Product(sku="a", price=1), Product(sku="b", price=2)],
+                update_conflicts=True,
+                unique_fields=["sku"],
+                update_fields=["price"],
+            )
+        self.assertEqual(Product.objects.count(), 2)
+
+    def test_unset_auto_pk(self):
+        """An object without a primary key is inserted with a new one."""
+        existing = Product.objects.create(sku="a", price=1)
+        objs = Product.objects.bulk_create(
+            [Product(pk=existing.pk, sku="a", price=2), Product(sku="b", price=3)],
+            update_conflicts=True,
+            unique_fields=["pk"],
+            update_fields=["price"],
+        )
+        self.assertEqual(objs[0].pk, existing.pk)
+        self.assertIsNotNone(objs[1].pk)
+        self.assertQuerySetEqual(
+            Product.objects.order_by("sku"),
+            [(existing.pk, "a", 2), (objs[1].pk, "b", 3)],
+            lambda p: (p.pk, p.sku, p.price),
+        )
+
+    def test_null_unique_value(self):
+        """A null unique value doesn't match other documents."""
+        existing = Item.objects.create(code=None, data={"a": 1}, value=1)
+        objs = Item.objects.bulk_create(
+            [Item(code=None, data={"b": 2}, value=2)],
+            update_conflicts=True,
+            unique_fields=["code"],
+            update_fields=["value"],
+        )
+        self.assertIsNotNone(objs[0].pk)
+        self.assertNotEqual(objs[0].pk, existing.pk)
+        self.assertQuerySetEqual(
+            Item.objects.order_by("value"),
+            [(existing.pk, 1), (objs[0].pk, 2)],
+            lambda i: (i.pk, i.value),
+        )
+
+    def test_unhashable_unique_value(self):
+        existing = Item.objects.create(data={"a": [1, 2]}, value=1)
+        with self.assertNumQueries(2):
+            objs = Item.objects.bulk_create(
+                [Item(data={"a": [1, 2]}, value=2), Item(data=[3], value=3)],
+                update_conflicts=True,
+                unique_fields=["data"],
+                update_fields=["value"],
+            )
+        self.assertEqual(objs[0].pk, existing.pk)
+        self.assertEqual(objs[1].pk, Item.objects.get(value=3).pk)
+        self.assertEqual(Item.objects.get(pk=existing.pk).value, 2)
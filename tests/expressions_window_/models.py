@@ -0,0 +1,11 @@
+from django.db import models
+
+
+class Employee(models.Model):
+    name = models.CharField(max_length=40)
+    department = models.CharField(max_length=40)
+    salary = models.IntegerField()
+    hire_date = models.DateField()
+
+    def __str__(self):
+        return self.name
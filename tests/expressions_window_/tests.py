@@ -0,0 +1,339 @@
+import datetime
+
+from django.db import NotSupportedError
+from django.db.models import Avg, F, RowRange, Sum, Window
+from django.db.models.functions import (
+    DenseRank,
+    FirstValue,
+    Lag,
+    Lead,
+    Lower,
+    Ntile,
+    Rank,
+    RowNumber,
+)
+from django.test import TestCase
+
+from django_mongodb_backend.test import MongoTestCaseMixin
+
+from .models import Employee
+
+
+class WindowTests(MongoTestCaseMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for name, department, salary, hire_date in (
+            ("Adams", "Accounting", 50000, datetime.date(2005, 11, 1)),
+            ("Jenson", "Accounting", 45000, datetime.date(2008, 4, 1)),
+            ("Jones", "Accounting", 45000, datetime.date(2005, 11, 1)),
+            ("Williams", "Accounting", 37000, datetime.date(2009, 6, 1)),
+            ("Smith", "Sales", 55000, datetime.date(2007, 6, 1)),
+            ("Brown", "Sales", 53000, datetime.date(2009, 9, 1)),
+        ):
+            Employee.objects.create(
+                name=name, department=department, salary=salary, hire_date=hire_date
+            )
+
+    def test_rank(self):
+        with self.assertNumQueries(1) as ctx:
+            employees = list(
+                Employee.objects.annotate(
+                    rank=Window(Rank(), partition_by=F("department"), order_by=F("salary").desc())
+                )
+                .order_by("department", "-salary", "name")
+                .values_list("name", "rank")
+            )
+        self.assertEqual(
+            employees,
+            [
+                ("Adams", 1),
+                ("Jenson", 2),
+                ("Jones", 2),
+                ("Williams", 4),
+                ("Smith", 1),
+                ("Brown", 2),
+            ],
+        )
+        self.assertAggregateQuery(
+            ctx.captured_queries[0]["sql"],
+            "expressions_window__employee",
+            [
+                {
+                    "$setWindowFields": {
+                        "partitionBy": "$department",
+                        "sortBy": {"salary": -1},
+                        "output": {"__window1": {"$rank": {}}},
+                    }
+                },
+                {
+                    "$project": {
+                        "name": 1,
+                        "rank": "$__window1",
+                        "department": 1,
+                        "salary": 1,
+                    }
+                },
+                {"$sort": {"department": 1, "salary": -1, "name": 1}},
+            ],
+        )
+
+    def test_same_window_single_stage(self):
+        window = {"partition_by": F("department"), "order_by": [F("salary").desc(), F("name")]}
+        with self.assertNumQueries(1) as ctx:
+            employees = list(
+                Employee.objects.annotate(
+                    dense_rank=Window(DenseRank(), **window),
+                    row_number=Window(RowNumber(), **window),
+                )
+                .order_by("department", "-salary", "name")
+                .values_list("name", "dense_rank", "row_number")
+            )
+        self.assertEqual(
+            employees,
+            [
+                ("Adams", 1, 1),
+                ("Jenson", 2, 2),
+                ("Jones", 2, 3),
+                ("Williams", 3, 4),
+                ("Smith", 1, 1),
+                ("Brown", 2, 2),
+            ],
+        )
+        self.assertAggregateQuery(
+            ctx.captured_queries[0]["sql"],
+            "expressions_window__employee",
+            [
+                {
+                    "$setWindowFields": {
+                        "partitionBy": "$department",
+                        "sortBy": {"salary": -1, "name": 1},
+                        "output": {
+                            "__window1": {"$denseRank": {}},
+                            "__window2": {"$documentNumber": {}},
+                        },
+                    }
+                },
+                {
+                    "$project": {
+                        "name": 1,
+                        "dense_rank": "$__window1",
+                        "row_number": "$__window2",
+                        "department": 1,
+                        "salary": 1,
+                    }
+                },
+                {"$sort": {"department": 1, "salary": -1, "name": 1}},
+            ],
+        )
+
+    def test_lag_lead(self):
+        window = {"partition_by": F("department"), "order_by": [F("salary"), F("name")]}
+        employees = (
+            Employee.objects.annotate(
+                lag=Window(Lag("salary", default=0), **window),
+                lead=Window(Lead("salary"), **window),
+            )
+            .order_by("department", "salary", "name")
+            .values_list("name", "lag", "lead")
+        )
+        self.assertSequenceEqual(
+            employees,
+            [
+                ("Williams", 0, 45000),
+                ("Jenson", 37000, 45000),
+                ("Jones", 45000, 50000),
+                ("Adams", 45000, None),
+                ("Brown", 0, 55000),
+                ("Smith", 53000, None),
+            ],
+        )
+
+    def test_first_value(self):
+        employees = (
+            Employee.objects.annotate(
+                highest_paid=Window(
+                    FirstValue("name"),
+                    partition_by=F("department"),
+                    order_by=F("salary").desc(),
+                )
+            )
+            .order_by("name")
+            .values_list("name", "highest_paid")
+        )
+        self.assertSequenceEqual(
+            employees,
+            [
+                ("Adams", "Adams"),
+                ("Brown", "Smith"),
+                ("Jenson", "Adams"),
+                ("Jones", "Adams"),
+                ("Smith", "Smith"),
+                ("Williams", "Adams"),
+            ],
+        )
+
+    def test_running_sum(self):
+        """Rows with the same sort key are included in the running total."""
+        with self.assertNumQueries(1) as ctx:
+            employees = list(
+                Employee.objects.annotate(
+                    total=Window(Sum("salary"), partition_by=F("department"), order_by=F("salary"))
+                )
+                .order_by("department", "salary", "name")
+                .values_list("name", "total")
+            )
+        self.assertEqual(
+            employees,
+            [
+                ("Williams", 37000),
+                ("Jenson", 127000),
+                ("Jones", 127000),
+                ("Adams", 177000),
+                ("Brown", 53000),
+                ("Smith", 108000),
+            ],
+        )
+        self.assertAggregateQuery(
+            ctx.captured_queries[0]["sql"],
+            "expressions_window__employee",
+            [
+                {
+                    "$setWindowFields": {
+                        "partitionBy": "$department",
+                        "sortBy": {"salary": 1},
+                        "output": {
+                            "__window1": {
+                                "$sum": "$salary",
+                                "window": {"range": ["unbounded", "current"]},
+                            }
+                        },
+                    }
+                },
+                {
+                    "$project": {
+                        "name": 1,
+                        "total": "$__window1",
+                        "department": 1,
+                        "salary": 1,
+                    }
+                },
+                {"$sort": {"department": 1, "salary": 1, "name": 1}},
+            ],
+        )
+
+    def test_partition_sum(self):
+        employees = (
+            Employee.objects.annotate(
+                total=Window(Sum("salary"), partition_by=F("department")),
+            )
+            .order_by("name")
+            .values_list("name", "total")
+        )
+        self.assertSequenceEqual(
+            employees,
+            [
+                ("Adams", 177000),
+                ("Brown", 108000),
+                ("Jenson", 177000),
+                ("Jones", 177000),
+                ("Smith", 108000),
+                ("Williams", 177000),
+            ],
+        )
+
+    def test_moving_avg(self):
+        employees = (
+            Employee.objects.annotate(
+                avg=Window(
+                    Avg("salary"),
+                    partition_by=F("department"),
+                    order_by=[F("salary"), F("name")],
+                    frame=RowRange(start=-1, end=0),
+                )
+            )
+            .order_by("department", "salary", "name")
+            .values_list("name", "avg")
+        )
+        self.assertSequenceEqual(
+            employees,
+            [
+                ("Williams", 37000),
+                ("Jenson", 41000),
+                ("Jones", 45000),
+                ("Adams", 47500),
+                ("Brown", 53000),
+                ("Smith", 54000),
+            ],
+        )
+
+    def test_order_by_expression(self):
+        employees = (
+            Employee.objects.annotate(
+                row_number=Window(RowNumber(), order_by=Lower("name").desc()),
+            )
+            .order_by("name")
+            .values_list("name", "row_number")
+        )
+        self.assertSequenceEqual(
+            employees,
+            [
+                ("Adams", 6),
+                ("Brown", 5),
+                ("Jenson", 4),
+                ("Jones", 3),
+                ("Smith", 2),
+                ("Williams", 1),
+            ],
+        )
+
+    def test_order_by_window(self):
+        employees = Employee.objects.order_by(
+            Window(Rank(), order_by=F("hire_date")).desc(), "name"
+        ).values_list("name", flat=True)
+        self.assertSequenceEqual(
+            employees, ["Brown", "Williams", "Jenson", "Smith", "Adams", "Jones"]
+        )
+
+    def test_filter(self):
+        employees = (
+            Employee.objects.alias(
+                rank=Window(Rank(), partition_by=F("department"), order_by=F("salary").desc())
+            )
+            .filter(rank=1)
+            .order_by("name")
+        )
+        self.assertQuerySetEqual(employees, ["Adams", "Smith"], lambda e: e.name)
+
+    def test_filter_combined_with_where(self):
+        employees = (
+            Employee.objects.annotate(
+                rank=Window(Rank(), partition_by=F("department"), order_by=F("salary").desc())
+            )
+            .filter(rank__lte=2, department="Accounting")
+            .order_by("name")
+        )
+        self.assertQuerySetEqual(employees, ["Adams", "Jenson", "Jones"], lambda e: e.name)
+
+    def test_aggregate(self):
+        """Windows are computed over the groups of an aggregation."""
+        departments = (
+            Employee.objects.values("department")
+            .annotate(total=Sum("salary"), rank=Window(Rank(), order_by=Sum("salary").desc()))
+            .order_by("rank")
+            .values_list("department", "total", "rank")
+        )
+        self.assertSequenceEqual(departments, [("Accounting", 177000, 1), ("Sales", 108000, 2)])
+
+    def test_unsupported_function(self):
+        msg = "Ntile is not supported."
+        with self.assertRaisesMessage(NotSupportedError, msg):
+            list(Employee.objects.annotate(tile=Window(Ntile(2), order_by=F("salary"))))
+
+    def test_unsupported_nulls_last(self):
+        msg = "Window.order_by doesn't support nulls_first and nulls_last on MongoDB."
+        with self.assertRaisesMessage(NotSupportedError, msg):
+            list(
+                Employee.objects.annotate(
+                    rank=Window(Rank(), order_by=F("salary").asc(nulls_last=True))
+                )
+            )
@@ -1,4 +1,5 @@
 import enum
+import json
 
 from django.db import models
 
@@ -119,6 +120,17 @@ class ArrayEnumModel(models.Model):
     array_of_enums = ArrayField(EnumField(max_length=20))
 
 
+# JSONField
+class UppercaseKeysDecoder(json.JSONDecoder):
+    def __init__(self, **kwargs):
+        super().__init__(object_hook=lambda obj: {k.upper(): v for k, v in obj.items()}, **kwargs)
+
+
+class JSONModel(models.Model):
+    value = models.JSONField(null=True)
+    decoded = models.JSONField(decoder=UppercaseKeysDecoder, null=True)
+
+
 # EmbeddedModelField
 class Holder(models.Model):
     data = EmbeddedModelField("Data", null=True, blank=True)
@@ -165,6 +177,13 @@ class Library(models.Model):
         return self.name
 
 
+# Lazy EmbeddedModelField and EmbeddedModelArrayField
+class LazyHolder(models.Model):
+    name = models.CharField(max_length=100)
+    data = EmbeddedModelField("Data", lazy=True, null=True, blank=True)
+    reviews = EmbeddedModelArrayField("Review", lazy=True, null=True, blank=True)
+
+
 # EmbeddedModelArrayField
 class Movie(models.Model):
     title = models.CharField(max_length=255)
@@ -390,7 +390,8 @@ class QueryingTests(MongoTestCaseMixin, TestCase):
                     "$match": {
                         "$and": [
                             {"field": {"$lt": [2]}},
-                            {"$and": [{"field": {"$exists": True}}, {"field": {"$ne": None}}]},
+                            {"field": {"$exists": True}},
+                            {"field": {"$ne": None}},
                         ]
                     }
                 }
@@ -497,9 +498,22 @@ class QueryingTests(MongoTestCaseMixin, TestCase):
         )
 
     def test_contained_by(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertSequenceEqual(
+                NullableIntegerArrayModel.objects.filter(field__contained_by=[1, 2]),
+                self.objs[:2],
+            )
+        self.assertAggregateQuery(
+            ctx.captured_queries[0]["sql"],
+            "model_fields__nullableintegerarraymodel",
+            [{"$match": {"field": {"$type": "array", "$not": {"$elemMatch": {"$nin": [1, 2]}}}}}],
+        )
+
+    def test_contained_by_empty_array(self):
+        obj = NullableIntegerArrayModel.objects.create(field=[])
         self.assertSequenceEqual(
             NullableIntegerArrayModel.objects.filter(field__contained_by=[1, 2]),
-            self.objs[:2],
+            [*self.objs[:2], obj],
         )
 
     def test_contained_by_including_F_object(self):
@@ -1,10 +1,13 @@
 import operator
 from datetime import timedelta
+from decimal import Decimal
 
-from django.core.exceptions import FieldDoesNotExist, ValidationError
+from bson import Decimal128, Int64
+from django.core.exceptions import FieldDoesNotExist, FieldError, ValidationError
 from django.db import connection, models
 from django.db.models import (
     Exists,
+    Expression,
     ExpressionWrapper,
     F,
     Max,
@@ -78,6 +81,30 @@ class MethodTests(SimpleTestCase):
             obj.full_clean()
 
 
+class ConverterTests(SimpleTestCase):
+    def test_converters_cached(self):
+        converters = connection.ops._get_embedded_model_converters(Data)
+        self.assertIs(connection.ops._get_embedded_model_converters(Data), converters)
+        columns = [column for column, *_ in converters]
+        self.assertIn("integer_", columns)
+        self.assertIn("nested_data", columns)
+
+    def test_convert(self):
+        value = {
+            "integer_": Int64(1),
+            "decimal": None,
+            "nested_data": {"decimal": Decimal128("2.5")},
+        }
+        expression = Expression(output_field=Holder._meta.get_field("data"))
+        connection.ops.convert_embeddedmodelfield_value(value, expression, connection)
+        self.assertIs(type(value["integer_"]), int)
+        self.assertEqual(value["integer_"], 1)
+        self.assertIsNone(value["decimal"])
+        # Nested embedded models are converted to model instances.
+        self.assertIsInstance(value["nested_data"], NestedData)
+        self.assertEqual(value["nested_data"].decimal, Decimal("2.5"))
+
+
 class ModelTests(TestCase):
     def test_save_load(self):
         Holder.objects.create(data=Data(integer="5"))
@@ -196,12 +223,8 @@ class QueryingTests(MongoTestCaseMixin, TestCase):
                     "$match": {
                         "$and": [
                             {"data.integer_": {"$lt": 3}},
-                            {
-                                "$and": [
-                                    {"data.integer_": {"$exists": True}},
-                                    {"data.integer_": {"$ne": None}},
-                                ]
-                            },
+                            {"data.integer_": {"$exists": True}},
+                            {"data.integer_": {"$ne": None}},
                         ]
                     }
                 }
@@ -275,12 +298,8 @@ class QueryingTests(MongoTestCaseMixin, TestCase):
                     "$match": {
                         "$and": [
                             {"data.integer_": {"$lte": 3}},
-                            {
-                                "$and": [
-                                    {"data.integer_": {"$exists": True}},
-                                    {"data.integer_": {"$ne": None}},
-                                ]
-                            },
+                            {"data.integer_": {"$exists": True}},
+                            {"data.integer_": {"$ne": None}},
                         ]
                     }
                 }
@@ -653,6 +672,103 @@ class ArrayFieldTests(TestCase):
         self.assertCountEqual(Book.objects.filter(author__address__tags__len=2), [self.book])
 
 
+class EmbeddedPathProjectionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.book = Book.objects.create(
+            name="Hamlet",
+            author=Author(
+                name="Shakespeare",
+                age=55,
+                skills=["writing"],
+                address=Address(city="NYC", state="NY", zip_code=10001),
+            ),
+        )
+
+    def test_only(self):
+        with self.assertNumQueries(1) as ctx:
+            book = Book.objects.only("author__name").get()
+        self.assertIn("{'$project': {'_id': 1, 'author.name': 1}}", ctx.captured_queries[0]["sql"])
+        self.assertEqual(book.get_deferred_fields(), {"name"})
+        self.assertEqual(book.author.name, "Shakespeare")
+        self.assertIsNone(book.author.age)
+
+    def test_only_nested(self):
+        with self.assertNumQueries(1) as ctx:
+            book = Book.objects.only("name", "author__age", "author__address__city").get()
+        self.assertIn(
+            "{'$project': {'_id': 1, 'name': 1, 'author.age': 1, 'author.address.city': 1}}",
+            ctx.captured_queries[0]["sql"],
+        )
+        self.assertEqual(book.name, "Hamlet")
+        self.assertEqual(book.author.age, 55)
+        self.assertEqual(book.author.address.city, "NYC")
+        self.assertIsNone(book.author.address.zip_code)
+
+    def test_defer(self):
+        with self.assertNumQueries(1) as ctx:
+            book = Book.objects.defer("author__address", "author__skills").get()
+        self.assertIn(
+            "{'$project': {'_id': 1, 'name': 1, 'author.name': 1, 'author.age': 1}}",
+            ctx.captured_queries[0]["sql"],
+        )
+        self.assertEqual(book.get_deferred_fields(), set())
+        self.assertEqual(book.author.name, "Shakespeare")
+        self.assertEqual(book.author.age, 55)
+
+    def test_defer_nested(self):
+        book = Book.objects.defer("author__address__zip_code").get()
+        self.assertEqual(book.author.address.city, "NYC")
+        self.assertIsNone(book.author.address.zip_code)
+
+    def test_defer_all_embedded_fields(self):
+        """Deferring all of an embedded model's fields defers the field."""
+        book = Book.objects.defer(
+            "author__name", "author__age", "author__address", "author__skills"
+        ).get()
+        self.assertEqual(book.get_deferred_fields(), {"author"})
+        with self.assertNumQueries(1):
+            self.assertEqual(book.author.name, "Shakespeare")
+
+    def test_save_partially_loaded(self):
+        book = Book.objects.only("name", "author__name").get()
+        msg = (
+            "Cannot save Book.author since only(), defer(), or slice_array() partially "
+            "loaded it. Use save(update_fields=...) to save other fields."
+        )
+        with self.assertRaisesMessage(ValueError, msg):
+            book.save()
+        book.name = "Macbeth"
+        book.save(update_fields=["name"])
+        book.refresh_from_db()
+        self.assertEqual(book.name, "Macbeth")
+        self.assertEqual(book.author.age, 55)
+
+    def test_save_partially_loaded_reassigned(self):
+        """A partially loaded embedded model can be replaced."""
+        book = Book.objects.defer("author__age").get()
+        book.author = Author(name="Marlowe", age=29)
+        book.save()
+        book.refresh_from_db()
+        self.assertEqual(book.author.age, 29)
+
+    def test_values(self):
+        """values() isn't affected by only()."""
+        self.assertEqual(
+            Book.objects.only("author__name").values_list("author__age", flat=True).get(), 55
+        )
+
+    def test_not_embedded_model_field(self):
+        msg = "Author.name is not an embedded model field."
+        with self.assertRaisesMessage(FieldError, msg):
+            list(Book.objects.only("author__name__foo"))
+
+    def test_nonexistent_field(self):
+        msg = "Author has no field named 'foo'"
+        with self.assertRaisesMessage(FieldDoesNotExist, msg):
+            list(Book.objects.only("author__foo"))
+
+
 class InvalidLookupTests(SimpleTestCase):
     def test_invalid_field(self):
         msg = "Author has no field named 'first_name'"
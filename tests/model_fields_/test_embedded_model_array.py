@@ -4,11 +4,13 @@ from operator import attrgetter
 
 from django.core.exceptions import FieldDoesNotExist
 from django.db import connection, models
+from django.db.models import Q
 from django.db.models.expressions import Value
 from django.db.models.functions import Concat
 from django.test import SimpleTestCase, TestCase
 from django.test.utils import CaptureQueriesContext, isolate_apps
 
+from django_mongodb_backend.expressions import ElemMatch
 from django_mongodb_backend.fields import ArrayField, EmbeddedModelArrayField
 from django_mongodb_backend.models import EmbeddedModel
 from django_mongodb_backend.test import MongoTestCaseMixin
@@ -580,6 +582,108 @@ class QueryingTests(MongoTestCaseMixin, TestCase):
         self.assertQuerySetEqual(qs, [[1], [], [2], [1, 2]], attrgetter("section_numbers"))
 
 
+class EmbeddedPathProjectionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Movie.objects.create(
+            title="Lion King",
+            reviews=[Review(title="The best", rating=10), Review(title="Horrible", rating=1)],
+        )
+
+    def test_only(self):
+        with self.assertNumQueries(1) as ctx:
+            movie = Movie.objects.only("reviews__rating").get()
+        self.assertIn(
+            "{'$project': {'_id': 1, 'reviews.rating': 1}}", ctx.captured_queries[0]["sql"]
+        )
+        self.assertEqual([review.rating for review in movie.reviews], [10, 1])
+        self.assertEqual([review.title for review in movie.reviews], ["", ""])
+
+    def test_defer(self):
+        movie = Movie.objects.defer("reviews__title").get()
+        self.assertEqual(movie.title, "Lion King")
+        self.assertEqual([review.rating for review in movie.reviews], [10, 1])
+
+    def test_save_partially_loaded(self):
+        movie = Movie.objects.defer("reviews__title").get()
+        msg = (
+            "Cannot save Movie.reviews since only(), defer(), or slice_array() partially loaded it."
+        )
+        with self.assertRaisesMessage(ValueError, msg):
+            movie.save()
+        movie.title = "The Lion King"
+        movie.save(update_fields=["title"])
+        movie.refresh_from_db()
+        self.assertEqual([review.title for review in movie.reviews], ["The best", "Horrible"])
+
+
+class ElemMatchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.good = Movie.objects.create(
+            title="Good", reviews=[Review(title="Great", rating=10), Review(title="Bad", rating=2)]
+        )
+        cls.mixed = Movie.objects.create(
+            title="Mixed", reviews=[Review(title="Great", rating=1), Review(title="Meh", rating=9)]
+        )
+        cls.none = Movie.objects.create(title="None", reviews=None)
+
+    def test_same_element(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertSequenceEqual(
+                Movie.objects.filter(ElemMatch("reviews", title="Great", rating__gte=5)),
+                [self.good],
+            )
+        sql = ctx.captured_queries[0]["sql"]
+        self.assertIn("{'$match': {'reviews': {'$elemMatch': {'$and': [{'rating': ", sql)
+        self.assertIn("{'title_': 'Great'}]}}}}", sql)
+        self.assertNotIn("$expr", sql)
+        # Separate lookups may match different elements.
+        self.assertCountEqual(
+            Movie.objects.filter(reviews__title="Great", reviews__rating__gte=5),
+            [self.good, self.mixed],
+        )
+
+    def test_q(self):
+        self.assertCountEqual(
+            Movie.objects.filter(ElemMatch("reviews", Q(title="Meh") | Q(rating__lt=2))),
+            [self.mixed],
+        )
+
+    def test_negated(self):
+        self.assertCountEqual(
+            Movie.objects.filter(~ElemMatch("reviews", title="Great", rating__gte=5)),
+            [self.mixed, self.none],
+        )
+
+    def test_expression(self):
+        """Conditions that aren't constant use an aggregation expression."""
+        with self.assertNumQueries(1) as ctx:
+            self.assertCountEqual(
+                Movie.objects.filter(ElemMatch("reviews", rating__gte=Value(4) + Value(5))),
+                [self.good, self.mixed],
+            )
+        sql = ctx.captured_queries[0]["sql"]
+        self.assertIn("'$anyElementTrue'", sql)
+        self.assertIn("'$$item.rating'", sql)
+
+    def test_annotate(self):
+        qs = Movie.objects.annotate(liked=ElemMatch("reviews", rating__gte=9)).order_by("title")
+        self.assertEqual(
+            [(movie.title, movie.liked) for movie in qs],
+            [("Good", True), ("Mixed", True), ("None", False)],
+        )
+
+    def test_not_embedded_model_array(self):
+        msg = "ElemMatch requires an EmbeddedModelArrayField, not CharField."
+        with self.assertRaisesMessage(TypeError, msg):
+            Movie.objects.filter(ElemMatch("title", title="Great"))
+
+    def test_no_conditions(self):
+        with self.assertRaisesMessage(ValueError, "ElemMatch requires at least one condition."):
+            ElemMatch("reviews")
+
+
 @isolate_apps("model_fields_")
 class CheckTests(SimpleTestCase):
     def test_no_relational_fields(self):
@@ -0,0 +1,137 @@
+from django.db import NotSupportedError, connection
+from django.db.models import Expression
+from django.test import TestCase
+
+from django_mongodb_backend.test import MongoTestCaseMixin
+
+from .models import JSONModel, OtherTypesArrayModel
+
+
+class JSONFieldTests(TestCase):
+    def test_save_load(self):
+        value = {"a": [1, {"b": None}], "c": "d", "e": 1.5}
+        obj = JSONModel.objects.create(value=value)
+        obj.refresh_from_db()
+        self.assertEqual(obj.value, value)
+
+    def test_scalar(self):
+        for value in ["a", 1, True, [1, 2], {}]:
+            with self.subTest(value=value):
+                obj = JSONModel.objects.create(value=value)
+                obj.refresh_from_db()
+                self.assertEqual(obj.value, value)
+
+    def test_null(self):
+        obj = JSONModel.objects.create(value=None)
+        obj.refresh_from_db()
+        self.assertIsNone(obj.value)
+
+    def test_no_converters(self):
+        """Values are returned as decoded from BSON."""
+        field = JSONModel._meta.get_field("value")
+        self.assertEqual(connection.ops.get_db_converters(Expression(output_field=field)), [])
+        self.assertEqual(field.get_db_converters(connection), [])
+
+    def test_custom_decoder(self):
+        """Values are decoded from JSON if the field has a custom decoder."""
+        field = JSONModel._meta.get_field("decoded")
+        self.assertEqual(
+            connection.ops.get_db_converters(Expression(output_field=field)),
+            [connection.ops.convert_jsonfield_value],
+        )
+        obj = JSONModel.objects.create(decoded={"a": {"b": 1}})
+        obj.refresh_from_db()
+        self.assertEqual(obj.decoded, {"A": {"B": 1}})
+
+    def test_key_transform(self):
+        JSONModel.objects.create(value={"a": {"b": [1, 2]}})
+        self.assertEqual(
+            list(JSONModel.objects.values_list("value__a", "value__a__b")),
+            [({"b": [1, 2]}, [1, 2])],
+        )
+
+    def test_array(self):
+        obj = OtherTypesArrayModel.objects.create(json=[{"a": 1}, [2]])
+        obj.refresh_from_db()
+        self.assertEqual(obj.json, [{"a": 1}, [2]])
+
+
+class ContainsTests(MongoTestCaseMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.objs = JSONModel.objects.bulk_create(
+            [
+                JSONModel(value={"a": 1, "b": {"c": "d", "e": True}}),
+                JSONModel(value={"a": 2, "tags": ["x", "y"]}),
+                JSONModel(value={"items": [{"k": 1, "v": "one"}, {"k": 2, "v": "two"}]}),
+                JSONModel(value={"a": None}),
+                JSONModel(value=None),
+            ]
+        )
+
+    def test_nested_object(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertSequenceEqual(
+                JSONModel.objects.filter(value__contains={"a": 1, "b": {"c": "d"}}),
+                [self.objs[0]],
+            )
+        self.assertAggregateQuery(
+            ctx.captured_queries[0]["sql"],
+            "model_fields__jsonmodel",
+            [{"$match": {"$and": [{"value.a": 1}, {"value.b.c": "d"}]}}],
+        )
+
+    def test_array(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertSequenceEqual(
+                JSONModel.objects.filter(value__contains={"tags": ["y", "x"]}),
+                [self.objs[1]],
+            )
+        self.assertAggregateQuery(
+            ctx.captured_queries[0]["sql"],
+            "model_fields__jsonmodel",
+            [{"$match": {"value.tags": {"$all": ["y", "x"]}}}],
+        )
+        self.assertSequenceEqual(JSONModel.objects.filter(value__contains={"tags": ["x", "z"]}), [])
+
+    def test_array_of_objects(self):
+        self.assertSequenceEqual(
+            JSONModel.objects.filter(value__contains={"items": [{"k": 2, "v": "two"}]}),
+            [self.objs[2]],
+        )
+        # Both conditions must match the same item.
+        self.assertSequenceEqual(
+            JSONModel.objects.filter(value__contains={"items": [{"k": 2, "v": "one"}]}), []
+        )
+
+    def test_key_transform(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertSequenceEqual(
+                JSONModel.objects.filter(value__tags__contains="x"), [self.objs[1]]
+            )
+        self.assertAggregateQuery(
+            ctx.captured_queries[0]["sql"],
+            "model_fields__jsonmodel",
+            [{"$match": {"value.tags": "x"}}],
+        )
+
+    def test_empty_object(self):
+        self.assertSequenceEqual(JSONModel.objects.filter(value__contains={}), self.objs[:4])
+
+    def test_null_value(self):
+        self.assertSequenceEqual(
+            JSONModel.objects.filter(value__contains={"a": None}), [self.objs[3]]
+        )
+
+    def test_invalid_key_name(self):
+        msg = (
+            "contains lookup is only supported on this database backend for a "
+            "constant value on a JSONField or a key with a valid path name."
+        )
+        with self.assertRaisesMessage(NotSupportedError, msg):
+            list(JSONModel.objects.filter(value__contains={"$a": 1}))
+
+    def test_contained_by_unsupported(self):
+        msg = "contained_by lookup is not supported on this database backend."
+        with self.assertRaisesMessage(NotSupportedError, msg):
+            list(JSONModel.objects.filter(value__contained_by={"a": 1}))
@@ -0,0 +1,97 @@
+import pickle
+from decimal import Decimal
+
+from django.db import connection
+from django.db.models import F
+from django.test import SimpleTestCase, TestCase
+
+from django_mongodb_backend.fields import EmbeddedModelArrayField, EmbeddedModelField
+from django_mongodb_backend.fields.mixins import (
+    LazyEmbeddedModelDescriptor,
+    UnloadedEmbeddedValue,
+)
+
+from .models import Data, LazyHolder, NestedData, Review
+
+
+class MethodTests(SimpleTestCase):
+    def test_deconstruct(self):
+        field = EmbeddedModelField("Data", lazy=True)
+        *_, kwargs = field.deconstruct()
+        self.assertEqual(kwargs, {"embedded_model": "data", "lazy": True})
+
+    def test_deconstruct_not_lazy(self):
+        field = EmbeddedModelArrayField("Data")
+        *_, kwargs = field.deconstruct()
+        self.assertNotIn("lazy", kwargs)
+
+    def test_descriptor_class(self):
+        self.assertIsInstance(LazyHolder.data, LazyEmbeddedModelDescriptor)
+        self.assertIsInstance(LazyHolder.reviews, LazyEmbeddedModelDescriptor)
+
+
+class ModelTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.obj = LazyHolder.objects.create(
+            name="Bob",
+            data=Data(integer=5, decimal="1.5", nested_data=NestedData(decimal="2.5")),
+            reviews=[Review(title="Good", rating=4), Review(title="Bad", rating=2)],
+        )
+
+    def test_load_on_access(self):
+        obj = LazyHolder.objects.get()
+        self.assertIsInstance(obj.__dict__["data"], UnloadedEmbeddedValue)
+        self.assertIsInstance(obj.__dict__["reviews"], UnloadedEmbeddedValue)
+        self.assertIsInstance(obj.data, Data)
+        self.assertEqual(obj.data.integer, 5)
+        self.assertEqual(obj.data.decimal, Decimal("1.5"))
+        self.assertEqual(obj.data.nested_data.decimal, Decimal("2.5"))
+        self.assertIs(obj.data._state.adding, False)
+        # The instance is only built once.
+        self.assertIs(obj.data, obj.data)
+        self.assertEqual([review.title for review in obj.reviews], ["Good", "Bad"])
+        self.assertEqual(obj.reviews[0].rating, Decimal("4"))
+        self.assertIsInstance(obj.__dict__["reviews"], list)
+
+    def test_null(self):
+        LazyHolder.objects.update(data=None, reviews=None)
+        obj = LazyHolder.objects.get()
+        self.assertIsNone(obj.data)
+        self.assertIsNone(obj.reviews)
+
+    def test_assign(self):
+        obj = LazyHolder.objects.get()
+        obj.data = Data(integer=6)
+        self.assertEqual(obj.data.integer, 6)
+
+    def test_save(self):
+        obj = LazyHolder.objects.get()
+        obj.name = "Rob"
+        obj.save()
+        obj = LazyHolder.objects.get()
+        self.assertEqual(obj.name, "Rob")
+        self.assertEqual(obj.data.integer, 5)
+        self.assertEqual(len(obj.reviews), 2)
+
+    def test_deferred(self):
+        obj = LazyHolder.objects.defer("data").get()
+        self.assertEqual(obj.data.integer, 5)
+
+    def test_pickle(self):
+        obj = pickle.loads(pickle.dumps(LazyHolder.objects.get()))  # noqa: S301
+        self.assertEqual(obj.data.integer, 5)
+
+    def test_values(self):
+        """values() and annotations aren't lazy."""
+        self.assertEqual(LazyHolder.objects.values_list("data", flat=True).get().integer, 5)
+        obj = LazyHolder.objects.annotate(copy=F("data")).get()
+        self.assertIsInstance(obj.copy, Data)
+
+    def test_database_value(self):
+        obj = LazyHolder.objects.get()
+        value = obj.__dict__["data"]
+        self.assertEqual(
+            value.value,
+            connection.database.model_fields__lazyholder.find_one({})["data"],
+        )
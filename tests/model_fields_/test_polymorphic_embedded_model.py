@@ -49,6 +49,25 @@ class MethodTests(SimpleTestCase):
         with self.assertRaisesMessage(TypeError, msg):
             Person(pet=42).save()
 
+    def test_get_model_from_label(self):
+        field = Person._meta.get_field("pet")
+        self.assertIs(field._get_model_from_label("model_fields_.Dog"), Dog)
+        self.assertIs(field._get_model_from_label("model_fields_.Cat"), Cat)
+
+    def test_get_model_from_label_unresolved(self):
+        field = PolymorphicEmbeddedModelField(["Dog", Cat])
+        self.assertIs(field._get_model_from_label("model_fields_.Cat"), Cat)
+        with self.assertRaises(KeyError):
+            field._get_model_from_label("model_fields_.Dog")
+
+    def test_to_python_does_not_modify_value(self):
+        value = {"_label": "model_fields_.Dog", "name": "Woofer"}
+        obj = Person._meta.get_field("pet").to_python(value)
+        self.assertIsInstance(obj, Dog)
+        self.assertEqual(obj.name, "Woofer")
+        self.assertIs(obj._state.adding, False)
+        self.assertEqual(value, {"_label": "model_fields_.Dog", "name": "Woofer"})
+
     def test_validate(self):
         obj = Person(name="Bob", pet=Dog(name="Woofer", barks=None))
         # This isn't quite right because "barks" is the subfield of data
@@ -40,6 +40,30 @@ class MethodTests(SimpleTestCase):
         with self.assertRaisesMessage(ValueError, msg):
             PolymorphicEmbeddedModelArrayField("Data", size=1)
 
+    def test_from_db_value(self):
+        """Values are grouped by label but keep their order."""
+        field = Owner._meta.get_field("pets")
+        pets = field.from_db_value(
+            [
+                {"_label": "model_fields_.Dog", "name": "Woofer"},
+                {"_label": "model_fields_.Cat", "name_": "Phoebe"},
+                None,
+                {"_label": "model_fields_.Dog", "name": "Lassie", "barks": False},
+            ],
+            None,
+            connection,
+        )
+        self.assertEqual([type(pet) for pet in pets], [Dog, Cat, type(None), Dog])
+        self.assertEqual(pets[0].name, "Woofer")
+        self.assertEqual(pets[1].name, "Phoebe")
+        self.assertEqual(pets[3].name, "Lassie")
+        self.assertIs(pets[3].barks, False)
+        self.assertIs(pets[0]._state.adding, False)
+
+    def test_get_model_from_label(self):
+        field = Owner._meta.get_field("pets")
+        self.assertIs(field._get_model_from_label("model_fields_.Cat"), Cat)
+
     def test_get_db_prep_save_invalid(self):
         msg = (
             "Expected list of (<class 'model_fields_.models.Dog'>, "
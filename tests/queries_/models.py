@@ -1,11 +1,14 @@
 from django.db import models
 
-from django_mongodb_backend.fields import ObjectIdAutoField, ObjectIdField
+from django_mongodb_backend.fields import ArrayField, ObjectIdAutoField, ObjectIdField
+from django_mongodb_backend.managers import MongoManager
 
 
 class Author(models.Model):
     name = models.CharField(max_length=10)
 
+    objects = MongoManager()
+
     def __str__(self):
         return self.name
 
@@ -15,6 +18,8 @@ class Book(models.Model):
     author = models.ForeignKey(Author, models.CASCADE)
     isbn = models.CharField(max_length=13)
 
+    objects = MongoManager()
+
     def __str__(self):
         return self.title
 
@@ -30,10 +35,22 @@ class Tag(models.Model):
     )
     group_id = ObjectIdField(null=True)
 
+    objects = MongoManager()
+
     def __str__(self):
         return self.name
 
 
+class Post(models.Model):
+    title = models.CharField(max_length=20)
+    comments = ArrayField(models.CharField(max_length=20), null=True)
+
+    objects = MongoManager()
+
+    def __str__(self):
+        return self.title
+
+
 class Order(models.Model):
     id = ObjectIdAutoField(primary_key=True)
     name = models.CharField(max_length=12, null=True, default="")
@@ -0,0 +1,128 @@
+from django.db.models import Count
+from django.test import SimpleTestCase, TestCase
+
+from django_mongodb_backend.query import get_count_arguments
+
+from .models import Author, Book
+
+
+class GetCountArgumentsTests(SimpleTestCase):
+    def test_empty(self):
+        self.assertEqual(get_count_arguments([]), ({}, {}))
+
+    def test_all_stages(self):
+        pipeline = [
+            {"$match": {"name": "Bob"}},
+            {"$project": {"name": 1}},
+            {"$addFields": {"upper": {"$toUpper": "$name"}}},
+            {"$sort": {"name": 1}},
+            {"$skip": 2},
+            {"$limit": 3},
+        ]
+        self.assertEqual(get_count_arguments(pipeline), ({"name": "Bob"}, {"skip": 2, "limit": 3}))
+
+    def test_unsupported_stage(self):
+        self.assertIsNone(get_count_arguments([{"$match": {}}, {"$group": {"_id": "$name"}}]))
+
+    def test_stage_order(self):
+        self.assertIsNone(get_count_arguments([{"$limit": 1}, {"$match": {"name": "Bob"}}]))
+
+
+class CountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.bob = Author.objects.create(name="Bob")
+        cls.john = Author.objects.create(name="John")
+        Book.objects.create(title="Don", author=cls.bob)
+
+    def test_count(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertEqual(Author.objects.filter(name="Bob").count(), 1)
+        self.assertEqual(
+            ctx.captured_queries[0]["sql"], "db.queries__author.count_documents({'name': 'Bob'})"
+        )
+
+    def test_count_sliced(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertEqual(Author.objects.order_by("name")[1:].count(), 1)
+        self.assertEqual(
+            ctx.captured_queries[0]["sql"], "db.queries__author.count_documents({}, skip=1)"
+        )
+
+    def test_count_empty_result(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(Author.objects.filter(name__in=[]).count(), 0)
+
+    def test_aggregate_count(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertEqual(Author.objects.aggregate(n=Count("*")), {"n": 2})
+        self.assertIn(".count_documents(", ctx.captured_queries[0]["sql"])
+
+    def test_count_join_uses_aggregate(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertEqual(Book.objects.filter(author__name="Bob").count(), 1)
+        self.assertIn(".aggregate(", ctx.captured_queries[0]["sql"])
+
+    def test_count_distinct_uses_aggregate(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertEqual(Book.objects.values("author").distinct().count(), 1)
+        self.assertIn(".aggregate(", ctx.captured_queries[0]["sql"])
+
+    def test_hint(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertEqual(Author.objects.filter(name="John").count(hint="_id_"), 1)
+        self.assertEqual(
+            ctx.captured_queries[0]["sql"],
+            "db.queries__author.count_documents({'name': 'John'}, hint='_id_')",
+        )
+
+    def test_estimated(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertEqual(Author.objects.count(estimated=True), 2)
+        self.assertEqual(
+            ctx.captured_queries[0]["sql"], "db.queries__author.estimated_document_count()"
+        )
+
+    def test_estimated_filtered(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertEqual(Author.objects.filter(name="Bob").count(estimated=True), 1)
+        self.assertIn(".count_documents(", ctx.captured_queries[0]["sql"])
+
+    def test_result_cache(self):
+        qs = Author.objects.all()
+        list(qs)
+        with self.assertNumQueries(0):
+            self.assertEqual(qs.count(estimated=True), 2)
+
+
+class ExistsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.bob = Author.objects.create(name="Bob")
+        Book.objects.create(title="Don", author=cls.bob)
+
+    def test_exists(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertIs(Author.objects.filter(name="Bob").exists(), True)
+        self.assertEqual(
+            ctx.captured_queries[0]["sql"],
+            "db.queries__author.find_one({'name': 'Bob'}, {'_id': 1})",
+        )
+
+    def test_not_exists(self):
+        self.assertIs(Author.objects.filter(name="John").exists(), False)
+
+    def test_exists_sliced(self):
+        self.assertIs(Author.objects.all()[1:].exists(), False)
+
+    def test_exists_empty_result(self):
+        with self.assertNumQueries(0):
+            self.assertIs(Author.objects.filter(name__in=[]).exists(), False)
+
+    def test_exists_join_uses_aggregate(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertIs(Book.objects.filter(author__name="Bob").exists(), True)
+        self.assertIn(".aggregate(", ctx.captured_queries[0]["sql"])
+
+    def test_contains(self):
+        self.assertIs(Author.objects.contains(self.bob), True)
@@ -0,0 +1,128 @@
+from django.db import NotSupportedError
+from django.db.models import Count, F, Max
+from django.test import TestCase
+
+from django_mongodb_backend.test import MongoTestCaseMixin
+
+from .models import Author, Book, Tag
+
+
+class FacetsTests(MongoTestCaseMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.alice = Author.objects.create(name="Alice")
+        cls.bob = Author.objects.create(name="Bob")
+        cls.a = Book.objects.create(title="A", author=cls.alice, isbn="1")
+        cls.b = Book.objects.create(title="B", author=cls.alice, isbn="2")
+        cls.c = Book.objects.create(title="C", author=cls.bob, isbn="3")
+        cls.d = Book.objects.create(title="D", author=cls.bob, isbn="4")
+        cls.e = Book.objects.create(title="E", author=cls.alice, isbn="5")
+
+    def test_facets(self):
+        with self.assertNumQueries(1):
+            results = Book.objects.filter(isbn__lte="4").facets(
+                by_author=Book.objects.values("author__name")
+                .annotate(count=Count("pk"))
+                .order_by("author__name"),
+                last=Book.objects.order_by("-title")[:2],
+                alice_titles=Book.objects.filter(author=self.alice)
+                .values_list("title", flat=True)
+                .order_by("title"),
+                totals={"count": Count("pk"), "max_isbn": Max("isbn")},
+            )
+        self.assertEqual(
+            results,
+            {
+                "by_author": [
+                    {"author__name": "Alice", "count": 2},
+                    {"author__name": "Bob", "count": 2},
+                ],
+                "last": [self.d, self.c],
+                "alice_titles": ["A", "B"],
+                "totals": {"count": 4, "max_isbn": "4"},
+            },
+        )
+
+    def test_pipeline(self):
+        with self.assertNumQueries(1) as ctx:
+            results = Book.objects.filter(isbn="1").facets(
+                titles=Book.objects.values_list("title", flat=True),
+                totals={"max_isbn": Max("isbn")},
+            )
+        self.assertEqual(results, {"titles": ["A"], "totals": {"max_isbn": "1"}})
+        self.assertAggregateQuery(
+            ctx.captured_queries[0]["sql"],
+            "queries__book",
+            [
+                {"$match": {"isbn": "1"}},
+                {
+                    "$facet": {
+                        "titles": [{"$project": {"title": 1}}],
+                        "totals": [
+                            {"$group": {"_id": None, "max_isbn": {"$max": "$isbn"}}},
+                            {"$project": {"max_isbn": "$max_isbn"}},
+                        ],
+                    }
+                },
+            ],
+        )
+
+    def test_model_instances(self):
+        books = Book.objects.filter(author=self.bob).facets(books=Book.objects.order_by("title"))[
+            "books"
+        ]
+        self.assertEqual(books, [self.c, self.d])
+        with self.assertNumQueries(0):
+            self.assertEqual(books[0].author_id, self.bob.pk)
+
+    def test_no_results(self):
+        with self.assertNumQueries(1):
+            results = Book.objects.filter(isbn="0").facets(
+                books=Book.objects.all(),
+                totals={"count": Count("pk"), "max_isbn": Max("isbn", default="0")},
+            )
+        self.assertEqual(results, {"books": [], "totals": {"count": 0, "max_isbn": "0"}})
+
+    def test_empty_result_set(self):
+        with self.assertNumQueries(0):
+            results = Book.objects.filter(pk__in=[]).facets(
+                books=Book.objects.all(), totals={"count": Count("pk")}
+            )
+        self.assertEqual(results, {"books": [], "totals": {"count": 0}})
+
+    def test_empty_result_set_facet(self):
+        with self.assertNumQueries(1):
+            results = Book.objects.facets(
+                none=Book.objects.filter(pk__in=[]), all=Book.objects.values_list("isbn")
+            )
+        self.assertEqual(len(results["all"]), 5)
+        self.assertEqual(results["none"], [])
+
+    def test_no_facets(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(Book.objects.facets(), {})
+
+    def test_invalid_facet(self):
+        msg = "facets() arguments must be QuerySets of Book or dicts of aggregate expressions, not "
+        for facet in (Tag.objects.all(), Count("pk"), None):
+            with self.subTest(facet=facet), self.assertRaisesMessage(TypeError, msg):
+                Book.objects.facets(facet=facet)
+
+    def test_invalid_aggregate(self):
+        with self.assertRaisesMessage(TypeError, "title is not an aggregate expression"):
+            Book.objects.facets(totals={"title": F("title")})
+
+    def test_sliced(self):
+        msg = "Cannot use facets() after a slice has been taken."
+        with self.assertRaisesMessage(TypeError, msg):
+            Book.objects.all()[:1].facets(books=Book.objects.all())
+
+    def test_aggregated(self):
+        msg = (
+            "facets() doesn't support QuerySets that use aggregation, window expressions, or "
+            "distinct()."
+        )
+        with self.assertRaisesMessage(NotSupportedError, msg):
+            Book.objects.values("author").annotate(count=Count("pk")).facets(
+                books=Book.objects.all()
+            )
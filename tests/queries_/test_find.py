@@ -0,0 +1,79 @@
+from unittest.mock import patch
+
+from bson import SON
+from django.db import connection
+from django.db.models import F
+from django.test import SimpleTestCase, TestCase
+
+from django_mongodb_backend.query import get_find_arguments
+
+from .models import Author, Book
+
+
+class GetFindArgumentsTests(SimpleTestCase):
+    def test_empty(self):
+        self.assertEqual(get_find_arguments([]), (({}, None), {}))
+
+    def test_all_stages(self):
+        pipeline = [
+            {"$match": {"name": "Bob"}},
+            {"$project": {"name": 1}},
+            {"$sort": SON([("name", 1), ("_id", -1)])},
+            {"$skip": 2},
+            {"$limit": 3},
+        ]
+        self.assertEqual(
+            get_find_arguments(pipeline),
+            (
+                ({"name": "Bob"}, {"name": 1}),
+                {"sort": [("name", 1), ("_id", -1)], "skip": 2, "limit": 3},
+            ),
+        )
+
+    def test_computed_projection(self):
+        self.assertIsNone(get_find_arguments([{"$project": {"upper": {"$toUpper": "$name"}}}]))
+
+    def test_unsupported_stage(self):
+        self.assertIsNone(get_find_arguments([{"$match": {}}, {"$addFields": {"a": 1}}]))
+
+    def test_stage_order(self):
+        self.assertIsNone(get_find_arguments([{"$limit": 1}, {"$match": {"name": "Bob"}}]))
+
+
+@patch.dict(connection.settings_dict, {"USE_FIND": True})
+class FindTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.bob = Author.objects.create(name="Bob")
+        cls.john = Author.objects.create(name="John")
+        Book.objects.create(title="Don", author=cls.bob)
+
+    def test_filter(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertSequenceEqual(Author.objects.filter(name="Bob"), [self.bob])
+        self.assertEqual(
+            ctx.captured_queries[0]["sql"], "db.queries__author.find({'name': 'Bob'}, None)"
+        )
+
+    def test_values_ordering_slicing(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertSequenceEqual(
+                Author.objects.values_list("name", flat=True).order_by("-name")[1:2], ["Bob"]
+            )
+        self.assertEqual(
+            ctx.captured_queries[0]["sql"],
+            "db.queries__author.find({}, {'name': 1}, sort=[('name', -1)], skip=1, limit=1)",
+        )
+
+    def test_get(self):
+        self.assertEqual(Author.objects.get(pk=self.john.pk), self.john)
+
+    def test_annotation_uses_aggregate(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertEqual(Author.objects.annotate(n=F("name")).get(name="Bob").n, "Bob")
+        self.assertIn(".aggregate(", ctx.captured_queries[0]["sql"])
+
+    def test_join_uses_aggregate(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertEqual(Book.objects.get(author__name="Bob").title, "Don")
+        self.assertIn(".aggregate(", ctx.captured_queries[0]["sql"])
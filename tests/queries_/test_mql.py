@@ -61,6 +61,7 @@ class FKLookupConditionPushdownTests(MongoTestCaseMixin, TestCase):
             ctx.captured_queries[0]["sql"],
             "queries__book",
             [
+                {"$match": {"title": "Don"}},
                 {
                     "$lookup": {
                         "from": "queries__author",
@@ -71,7 +72,7 @@ class FKLookupConditionPushdownTests(MongoTestCaseMixin, TestCase):
                     }
                 },
                 {"$unwind": "$queries__author"},
-                {"$match": {"$and": [{"queries__author.name": "John"}, {"title": "Don"}]}},
+                {"$match": {"queries__author.name": "John"}},
             ],
         )
 
@@ -173,6 +174,7 @@ class FKLookupConditionPushdownTests(MongoTestCaseMixin, TestCase):
             ctx.captured_queries[0]["sql"],
             "queries__order",
             [
+                {"$match": {"name": "My Order"}},
                 {
                     "$lookup": {
                         "from": "queries__orderitem",
@@ -183,6 +185,7 @@ class FKLookupConditionPushdownTests(MongoTestCaseMixin, TestCase):
                     }
                 },
                 {"$unwind": "$queries__orderitem"},
+                {"$match": {"queries__orderitem.status": ObjectId("6891ff7822e475eddc20f159")}},
                 {
                     "$lookup": {
                         "from": "queries__order",
@@ -193,15 +196,7 @@ class FKLookupConditionPushdownTests(MongoTestCaseMixin, TestCase):
                     }
                 },
                 {"$unwind": "$T3"},
-                {
-                    "$match": {
-                        "$and": [
-                            {"T3.name": "My Order"},
-                            {"queries__orderitem.status": ObjectId("6891ff7822e475eddc20f159")},
-                            {"name": "My Order"},
-                        ]
-                    }
-                },
+                {"$match": {"T3.name": "My Order"}},
                 {"$addFields": {"_id": "$_id"}},
                 {"$sort": SON([("_id", 1)])},
             ],
@@ -535,6 +530,7 @@ class FKLookupConditionPushdownTests(MongoTestCaseMixin, TestCase):
             ctx.captured_queries[0]["sql"],
             "queries__tag",
             [
+                {"$match": {"name": "T1"}},
                 {
                     "$lookup": {
                         "from": "queries__tag",
@@ -545,6 +541,7 @@ class FKLookupConditionPushdownTests(MongoTestCaseMixin, TestCase):
                     }
                 },
                 {"$unwind": "$T2"},
+                {"$match": {"T2.name": "T2"}},
                 {
                     "$lookup": {
                         "from": "queries__tag",
@@ -555,7 +552,7 @@ class FKLookupConditionPushdownTests(MongoTestCaseMixin, TestCase):
                     }
                 },
                 {"$unwind": "$T3"},
-                {"$match": {"$and": [{"name": "T1"}, {"T2.name": "T2"}, {"T3.name": "T3"}]}},
+                {"$match": {"T3.name": "T3"}},
             ],
         )
 
@@ -573,6 +570,7 @@ class FKLookupConditionPushdownTests(MongoTestCaseMixin, TestCase):
             ctx.captured_queries[0]["sql"],
             "queries__book",
             [
+                {"$match": {"title": {"$regex": "B", "$options": ""}}},
                 {
                     "$lookup": {
                         "from": "queries__author",
@@ -583,14 +581,7 @@ class FKLookupConditionPushdownTests(MongoTestCaseMixin, TestCase):
                     }
                 },
                 {"$unwind": "$queries__author"},
-                {
-                    "$match": {
-                        "$and": [
-                            {"queries__author.name": "Alice"},
-                            {"title": {"$regex": "B", "$options": ""}},
-                        ]
-                    }
-                },
+                {"$match": {"queries__author.name": "Alice"}},
             ],
         )
 
@@ -914,6 +905,7 @@ class M2MLookupConditionPushdownTests(MongoTestCaseMixin, TestCase):
             ctx.captured_queries[0]["sql"],
             "queries__library",
             [
+                {"$match": {"name": "Central"}},
                 {
                     "$lookup": {
                         "from": "queries__library_readers",
@@ -934,7 +926,7 @@ class M2MLookupConditionPushdownTests(MongoTestCaseMixin, TestCase):
                     }
                 },
                 {"$unwind": "$queries__reader"},
-                {"$match": {"$and": [{"name": "Central"}, {"queries__reader.name": "Alice"}]}},
+                {"$match": {"queries__reader.name": "Alice"}},
             ],
         )
 
@@ -949,6 +941,7 @@ class M2MLookupConditionPushdownTests(MongoTestCaseMixin, TestCase):
             ctx.captured_queries[0]["sql"],
             "queries__library",
             [
+                {"$match": {"name": "Ateneo"}},
                 {
                     "$lookup": {
                         "from": "queries__library_readers",
@@ -1006,7 +999,6 @@ class M2MLookupConditionPushdownTests(MongoTestCaseMixin, TestCase):
                     }
                 },
                 {"$unwind": "$queries__reader"},
-                {"$match": {"name": "Ateneo"}},
                 {
                     "$project": {
                         "queries__reader": {"foreing_field": "$queries__reader.name"},
@@ -0,0 +1,328 @@
+from unittest.mock import patch
+
+from bson import SON
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+
+from django_mongodb_backend.optimizer import PipelineOptimizer
+from django_mongodb_backend.test import MongoTestCaseMixin
+
+from .models import Author, Book
+
+
+def lookup(name, local_field, foreign_field="_id"):
+    return {
+        "$lookup": {
+            "from": name,
+            "localField": local_field,
+            "foreignField": foreign_field,
+            "as": name,
+            "pipeline": [],
+        }
+    }
+
+
+def left_outer_fallback(name):
+    return {
+        "$set": {
+            name: {
+                "$cond": {
+                    "if": {
+                        "$or": [
+                            {"$eq": [{"$type": f"${name}"}, "missing"]},
+                            {"$eq": [{"$size": f"${name}"}, 0]},
+                        ]
+                    },
+                    "then": [{}],
+                    "else": f"${name}",
+                }
+            }
+        }
+    }
+
+
+class PipelineOptimizerTests(SimpleTestCase):
+    optimizer = PipelineOptimizer()
+
+    def assertOptimized(self, pipeline, expected):
+        self.assertEqual(self.optimizer.optimize(pipeline), expected)
+
+    def test_empty(self):
+        self.assertOptimized([], [])
+
+    def test_flatten_and(self):
+        self.assertOptimized(
+            [{"$match": {"$and": [{"a": 1}, {"$and": [{"b": 2}, {"c": 3}]}]}}],
+            [{"$match": {"$and": [{"a": 1}, {"b": 2}, {"c": 3}]}}],
+        )
+
+    def test_flatten_or(self):
+        self.assertOptimized(
+            [{"$match": {"$or": [{"$or": [{"a": 1}, {"b": 2}]}, {"$and": [{"c": 3}]}]}}],
+            [{"$match": {"$or": [{"a": 1}, {"b": 2}, {"c": 3}]}}],
+        )
+
+    def test_flatten_mixed_operators(self):
+        """An $or inside an $and (and vice versa) isn't flattened."""
+        pipeline = [{"$match": {"$and": [{"a": 1}, {"$or": [{"b": 2}, {"c": 3}]}]}}]
+        self.assertOptimized(pipeline, pipeline)
+
+    def test_merge_match(self):
+        self.assertOptimized(
+            [{"$match": {"a": 1}}, {"$match": {"$and": [{"b": 2}, {"c": 3}]}}],
+            [{"$match": {"$and": [{"a": 1}, {"b": 2}, {"c": 3}]}}],
+        )
+
+    def test_merge_add_fields(self):
+        self.assertOptimized(
+            [{"$addFields": {"a": "$x"}}, {"$addFields": {"b": "$y"}}],
+            [{"$addFields": {"a": "$x", "b": "$y"}}],
+        )
+
+    def test_merge_add_fields_dependent(self):
+        pipeline = [{"$addFields": {"a": "$x"}}, {"$addFields": {"b": "$a"}}]
+        self.assertOptimized(pipeline, pipeline)
+
+    def test_hoist_match(self):
+        self.assertOptimized(
+            [
+                lookup("author", "author_id"),
+                {"$unwind": "$author"},
+                {"$match": {"$and": [{"author.name": "Bob"}, {"title": "Don"}]}},
+            ],
+            [
+                {"$match": {"title": "Don"}},
+                lookup("author", "author_id"),
+                {"$unwind": "$author"},
+                {"$match": {"author.name": "Bob"}},
+            ],
+        )
+
+    def test_hoist_match_between_joins(self):
+        self.assertOptimized(
+            [
+                lookup("author", "author_id"),
+                {"$unwind": "$author"},
+                lookup("publisher", "author.publisher_id"),
+                {"$unwind": "$publisher"},
+                {"$match": {"$and": [{"publisher.name": "P"}, {"author.name": "Bob"}]}},
+            ],
+            [
+                lookup("author", "author_id"),
+                {"$unwind": "$author"},
+                {"$match": {"author.name": "Bob"}},
+                lookup("publisher", "author.publisher_id"),
+                {"$unwind": "$publisher"},
+                {"$match": {"publisher.name": "P"}},
+            ],
+        )
+
+    def test_hoist_match_or(self):
+        """A disjunction is hoisted only if none of its branches use joins."""
+        pipeline = [
+            lookup("author", "author_id"),
+            {"$unwind": "$author"},
+            {"$match": {"$or": [{"author.name": "Bob"}, {"title": "Don"}]}},
+        ]
+        self.assertOptimized(pipeline, pipeline)
+        self.assertOptimized(
+            [
+                lookup("author", "author_id"),
+                {"$unwind": "$author"},
+                {"$match": {"$or": [{"isbn": "1"}, {"title": "Don"}]}},
+            ],
+            [
+                {"$match": {"$or": [{"isbn": "1"}, {"title": "Don"}]}},
+                lookup("author", "author_id"),
+                {"$unwind": "$author"},
+            ],
+        )
+
+    def test_hoist_match_expr(self):
+        self.assertOptimized(
+            [
+                lookup("author", "author_id"),
+                {"$match": {"$expr": {"$gt": ["$pages", "$chapters"]}}},
+            ],
+            [
+                {"$match": {"$expr": {"$gt": ["$pages", "$chapters"]}}},
+                lookup("author", "author_id"),
+            ],
+        )
+
+    def test_hoist_match_root_reference(self):
+        pipeline = [
+            lookup("author", "author_id"),
+            {"$match": {"$expr": {"$eq": [{"$size": {"$objectToArray": "$$ROOT"}}, 3]}}},
+        ]
+        self.assertOptimized(pipeline, pipeline)
+
+    def test_hoist_match_unknown_operator(self):
+        pipeline = [lookup("author", "author_id"), {"$match": {"$text": {"$search": "a"}}}]
+        self.assertOptimized(pipeline, pipeline)
+
+    def test_no_hoist_across_computed_field(self):
+        pipeline = [
+            {"$addFields": {"total": {"$add": ["$a", "$b"]}}},
+            {"$match": {"total": 3}},
+        ]
+        self.assertOptimized(pipeline, pipeline)
+
+    def test_no_hoist_across_group(self):
+        pipeline = [{"$group": {"_id": "$a"}}, {"$match": {"_id": 1}}]
+        self.assertOptimized(pipeline, pipeline)
+
+    def test_hoist_sort_and_limit(self):
+        self.assertOptimized(
+            [
+                lookup("author", "author_id"),
+                left_outer_fallback("author"),
+                {"$unwind": "$author"},
+                {"$sort": SON([("title", 1)])},
+                {"$skip": 10},
+                {"$limit": 5},
+            ],
+            [
+                {"$sort": SON([("title", 1)])},
+                {"$skip": 10},
+                {"$limit": 5},
+                lookup("author", "author_id"),
+                left_outer_fallback("author"),
+                {"$unwind": "$author"},
+                {"$sort": SON([("title", 1)])},
+            ],
+        )
+
+    def test_no_hoist_sort_on_joined_field(self):
+        pipeline = [
+            lookup("author", "author_id"),
+            left_outer_fallback("author"),
+            {"$unwind": "$author"},
+            {"$sort": SON([("author.name", 1)])},
+            {"$limit": 5},
+        ]
+        self.assertOptimized(pipeline, pipeline)
+
+    def test_no_hoist_sort_across_inner_join(self):
+        """An inner join may remove documents."""
+        pipeline = [
+            lookup("author", "author_id"),
+            {"$unwind": "$author"},
+            {"$sort": SON([("title", 1)])},
+            {"$limit": 5},
+        ]
+        self.assertOptimized(pipeline, pipeline)
+
+    def test_no_hoist_sort_across_multivalued_join(self):
+        """A reverse join may add documents."""
+        pipeline = [
+            lookup("book", "_id", "author_id"),
+            left_outer_fallback("book"),
+            {"$unwind": "$book"},
+            {"$sort": SON([("name", 1)])},
+            {"$limit": 5},
+        ]
+        self.assertOptimized(pipeline, pipeline)
+
+    def test_no_hoist_sort_without_limit(self):
+        pipeline = [
+            lookup("author", "author_id"),
+            left_outer_fallback("author"),
+            {"$unwind": "$author"},
+            {"$sort": SON([("title", 1)])},
+        ]
+        self.assertOptimized(pipeline, pipeline)
+
+    def test_remove_duplicate_project(self):
+        self.assertOptimized(
+            [{"$project": {"a": 1}}, {"$project": {"a": 1}}],
+            [{"$project": {"a": 1}}],
+        )
+
+    def test_fold_project(self):
+        self.assertOptimized(
+            [{"$project": {"a": 1, "b": {"$toUpper": "$c"}, "d": 1}}, {"$project": {"b": 1}}],
+            [{"$project": {"b": {"$toUpper": "$c"}}}],
+        )
+
+    def test_fold_project_keeps_id(self):
+        self.assertOptimized(
+            [{"$project": {"_id": 0, "a": 1, "b": 1}}, {"$project": {"a": 1}}],
+            [{"$project": {"a": 1, "_id": 0}}],
+        )
+
+    def test_fold_project_excluded_field(self):
+        pipeline = [{"$project": {"a": 0, "b": 0}}, {"$project": {"a": 1}}]
+        self.assertOptimized(pipeline, pipeline)
+
+    def test_does_not_mutate_pipeline(self):
+        match = {"$and": [{"author.name": "Bob"}, {"$and": [{"title": "Don"}]}]}
+        pipeline = [lookup("author", "author_id"), {"$unwind": "$author"}, {"$match": match}]
+        self.optimizer.optimize(pipeline)
+        self.assertEqual(match, {"$and": [{"author.name": "Bob"}, {"$and": [{"title": "Don"}]}]})
+        self.assertEqual(len(pipeline), 3)
+
+    def test_custom_passes(self):
+        class Optimizer(PipelineOptimizer):
+            passes = ("merge_adjacent_stages",)
+
+        pipeline = [lookup("author", "author_id"), {"$match": {"a": 1}}, {"$match": {"b": 2}}]
+        self.assertEqual(
+            Optimizer().optimize(pipeline),
+            [lookup("author", "author_id"), {"$match": {"$and": [{"a": 1}, {"b": 2}]}}],
+        )
+
+
+class OptimizePipelinesTests(MongoTestCaseMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        bob = Author.objects.create(name="Bob")
+        cls.book = Book.objects.create(title="Don", author=bob)
+
+    def test_enabled(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertSequenceEqual(
+                Book.objects.filter(title="Don", author__name="Bob"), [self.book]
+            )
+        self.assertAggregateQuery(
+            ctx.captured_queries[0]["sql"],
+            "queries__book",
+            [
+                {"$match": {"title": "Don"}},
+                {
+                    "$lookup": {
+                        "from": "queries__author",
+                        "localField": "author_id",
+                        "foreignField": "_id",
+                        "pipeline": [{"$match": {"name": "Bob"}}],
+                        "as": "queries__author",
+                    }
+                },
+                {"$unwind": "$queries__author"},
+                {"$match": {"queries__author.name": "Bob"}},
+            ],
+        )
+
+    @patch.dict(connection.settings_dict, {"OPTIMIZE_PIPELINES": False})
+    def test_disabled(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertSequenceEqual(
+                Book.objects.filter(title="Don", author__name="Bob"), [self.book]
+            )
+        self.assertAggregateQuery(
+            ctx.captured_queries[0]["sql"],
+            "queries__book",
+            [
+                {
+                    "$lookup": {
+                        "from": "queries__author",
+                        "localField": "author_id",
+                        "foreignField": "_id",
+                        "pipeline": [{"$match": {"name": "Bob"}}],
+                        "as": "queries__author",
+                    }
+                },
+                {"$unwind": "$queries__author"},
+                {"$match": {"$and": [{"queries__author.name": "Bob"}, {"title": "Don"}]}},
+            ],
+        )
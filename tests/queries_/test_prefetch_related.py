@@ -0,0 +1,144 @@
+from unittest.mock import patch
+
+from django.db import connection
+from django.db.models import Prefetch
+from django.test import TestCase
+
+from django_mongodb_backend.test import MongoTestCaseMixin
+
+from .models import Library, Order, OrderItem, Reader
+
+
+class PrefetchRelatedTests(MongoTestCaseMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.alice = Reader.objects.create(name="Alice")
+        cls.bob = Reader.objects.create(name="Bob")
+        cls.carol = Reader.objects.create(name="Carol")
+        cls.central = Library.objects.create(name="Central")
+        cls.central.readers.set([cls.alice, cls.bob])
+        cls.east = Library.objects.create(name="East")
+        cls.east.readers.set([cls.bob])
+        cls.west = Library.objects.create(name="West")
+        cls.order1 = Order.objects.create(name="first")
+        cls.order2 = Order.objects.create(name="second")
+        cls.item1 = OrderItem.objects.create(order=cls.order1)
+        cls.item2 = OrderItem.objects.create(order=cls.order1)
+        cls.item3 = OrderItem.objects.create(order=cls.order2)
+
+    def test_m2m_forward(self):
+        with self.assertNumQueries(2):
+            libraries = list(Library.objects.prefetch_related("readers").order_by("name"))
+        with self.assertNumQueries(0):
+            readers = {library.name: set(library.readers.all()) for library in libraries}
+        self.assertEqual(
+            readers,
+            {"Central": {self.alice, self.bob}, "East": {self.bob}, "West": set()},
+        )
+
+    def test_m2m_pipeline(self):
+        """
+        The "through" collection is queried first so that the related
+        collection isn't joined to it in full.
+        """
+        with self.assertNumQueries(2) as ctx:
+            library = Library.objects.prefetch_related("readers").get(name="East")
+        self.assertEqual(list(library.readers.all()), [self.bob])
+        self.assertAggregateQuery(
+            ctx.captured_queries[1]["sql"],
+            "queries__library_readers",
+            [
+                {"$match": {"library_id": {"$in": (self.east.pk,)}}},
+                {
+                    "$lookup": {
+                        "from": "queries__reader",
+                        "localField": "reader_id",
+                        "foreignField": "_id",
+                        "as": "queries__reader",
+                    }
+                },
+                {"$unwind": "$queries__reader"},
+                {
+                    "$replaceWith": {
+                        "$mergeObjects": [
+                            "$queries__reader",
+                            {"queries__library_readers": "$$ROOT"},
+                        ]
+                    }
+                },
+                {"$unset": "queries__library_readers.queries__reader"},
+                {"$match": {"queries__library_readers.library_id": {"$in": (self.east.pk,)}}},
+                {
+                    "$project": {
+                        "queries__library_readers": {
+                            "_prefetch_related_val_library_id": (
+                                "$queries__library_readers.library_id"
+                            )
+                        },
+                        "_id": 1,
+                        "name": 1,
+                    }
+                },
+            ],
+        )
+
+    @patch.dict(connection.settings_dict, {"PREFETCH_CHUNK_SIZE": 2})
+    def test_m2m_chunked(self):
+        """Objects are prefetched PREFETCH_CHUNK_SIZE at a time."""
+        with self.assertNumQueries(3):
+            readers = list(Reader.objects.prefetch_related("libraries").order_by("name"))
+        with self.assertNumQueries(0):
+            libraries = {reader.name: set(reader.libraries.all()) for reader in readers}
+        self.assertEqual(
+            libraries,
+            {"Alice": {self.central}, "Bob": {self.central, self.east}, "Carol": set()},
+        )
+
+    def test_m2m_reverse(self):
+        with self.assertNumQueries(2):
+            readers = list(Reader.objects.prefetch_related("libraries").order_by("name"))
+        with self.assertNumQueries(0):
+            libraries = {reader.name: set(reader.libraries.all()) for reader in readers}
+        self.assertEqual(
+            libraries,
+            {"Alice": {self.central}, "Bob": {self.central, self.east}, "Carol": set()},
+        )
+
+    def test_m2m_prefetch_object(self):
+        with self.assertNumQueries(2):
+            libraries = list(
+                Library.objects.prefetch_related(
+                    Prefetch(
+                        "readers",
+                        queryset=Reader.objects.filter(name="Bob"),
+                        to_attr="bobs",
+                    )
+                ).order_by("name")
+            )
+        self.assertEqual([library.bobs for library in libraries], [[self.bob], [self.bob], []])
+
+    def test_m2m_then_m2m(self):
+        with self.assertNumQueries(3):
+            library = Library.objects.prefetch_related("readers__libraries").get(name="East")
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                {lib for reader in library.readers.all() for lib in reader.libraries.all()},
+                {self.central, self.east},
+            )
+
+    def test_foreign_key(self):
+        with self.assertNumQueries(2):
+            items = list(OrderItem.objects.prefetch_related("order"))
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                [item.order for item in items], [self.order1, self.order1, self.order2]
+            )
+
+    def test_reverse_foreign_key(self):
+        with self.assertNumQueries(2):
+            orders = list(Order.objects.prefetch_related("items"))
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                [list(order.items.all()) for order in orders],
+                [[self.item1, self.item2], [self.item3]],
+            )
@@ -0,0 +1,83 @@
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase
+
+from django_mongodb_backend.test import MongoTestCaseMixin
+
+from .models import Author, Book
+
+
+class QueryCacheTests(MongoTestCaseMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.bob = Author.objects.create(name="Bob")
+        cls.john = Author.objects.create(name="John")
+        Book.objects.create(title="Don", author=cls.bob)
+
+    def setUp(self):
+        connection.query_cache.clear()
+
+    def test_hit(self):
+        self.assertEqual(Author.objects.get(name="Bob"), self.bob)
+        self.assertEqual(connection.query_cache.info()[:2], (0, 1))
+        with self.assertNumQueries(1) as ctx:
+            self.assertEqual(Author.objects.get(name="John"), self.john)
+        self.assertEqual(connection.query_cache.info()[:2], (1, 1))
+        self.assertAggregateQuery(
+            ctx.captured_queries[0]["sql"],
+            "queries__author",
+            [{"$match": {"name": "John"}}, {"$limit": 21}],
+        )
+
+    def test_hit_skips_compilation(self):
+        list(Author.objects.filter(pk=self.bob.pk))
+        with patch.object(connection.ops.compiler("SQLCompiler"), "pre_sql_setup") as mocked:
+            self.assertEqual(list(Author.objects.filter(pk=self.john.pk)), [self.john])
+        mocked.assert_not_called()
+
+    def test_nested_lookups(self):
+        qs = Author.objects.filter(name__in=["Bob"]).exclude(name="John").order_by("name")
+        self.assertSequenceEqual(qs, [self.bob])
+        qs = Author.objects.filter(name__in=["John"]).exclude(name="Bob").order_by("name")
+        self.assertSequenceEqual(qs, [self.john])
+        self.assertEqual(connection.query_cache.info()[:2], (1, 1))
+
+    def test_values(self):
+        self.assertSequenceEqual(
+            Author.objects.filter(name="Bob").values_list("name", flat=True), ["Bob"]
+        )
+        self.assertSequenceEqual(
+            Author.objects.filter(name="John").values_list("name", flat=True), ["John"]
+        )
+        self.assertEqual(connection.query_cache.info()[:2], (1, 1))
+
+    def test_different_shape(self):
+        list(Author.objects.filter(name="Bob"))
+        list(Author.objects.filter(name__startswith="Bob"))
+        list(Author.objects.filter(name="Bob").order_by("-name"))
+        self.assertEqual(connection.query_cache.info()[:2], (0, 3))
+
+    def test_value_changes_shape(self):
+        """A lookup value that matches nothing bypasses the cached query."""
+        list(Author.objects.filter(name__in=["Bob"]))
+        self.assertSequenceEqual(Author.objects.filter(name__in=[]), [])
+        self.assertSequenceEqual(Author.objects.filter(name__in=["John"]), [self.john])
+
+    def test_joins_not_cached(self):
+        list(Book.objects.filter(author__name="Bob"))
+        self.assertEqual(connection.query_cache.info(), (0, 0, 128, 0))
+
+    def test_eviction(self):
+        with patch.object(connection.query_cache, "maxsize", 1):
+            list(Author.objects.filter(name="Bob"))
+            list(Author.objects.filter(pk=self.bob.pk))
+            list(Author.objects.filter(name="Bob"))
+        self.assertEqual(connection.query_cache.info()[:2], (0, 3))
+        self.assertEqual(len(connection.query_cache), 1)
+
+    def test_disabled(self):
+        with patch.object(connection.query_cache, "maxsize", 0):
+            list(Author.objects.filter(name="Bob"))
+            list(Author.objects.filter(name="John"))
+        self.assertEqual(connection.query_cache.info(), (0, 0, 0, 0))
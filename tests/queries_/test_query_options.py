@@ -0,0 +1,111 @@
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase
+
+from .models import Author, Book
+
+
+class QueryOptionsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.bob = Author.objects.create(name="Bob")
+        cls.book = Book.objects.create(title="Don", author=cls.bob)
+
+    def test_aggregate(self):
+        qs = (
+            Author.objects.filter(name="Bob")
+            .hint("_id_")
+            .max_time_ms(1000)
+            .comment("report")
+            .allow_disk_use()
+            .batch_size(10)
+            .collation({"locale": "en"})
+        )
+        with self.assertNumQueries(1) as ctx:
+            self.assertSequenceEqual(qs, [self.bob])
+        self.assertEqual(
+            ctx.captured_queries[0]["sql"],
+            "db.queries__author.aggregate([{'$match': {'name': 'Bob'}}], hint='_id_', "
+            "maxTimeMS=1000, comment='report', allowDiskUse=True, batchSize=10, "
+            "collation={'locale': 'en'})",
+        )
+
+    @patch.dict(connection.settings_dict, {"USE_FIND": True})
+    def test_find(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertSequenceEqual(Author.objects.max_time_ms(1000).allow_disk_use(), [self.bob])
+        self.assertEqual(
+            ctx.captured_queries[0]["sql"],
+            "db.queries__author.find({}, None, max_time_ms=1000, allow_disk_use=True)",
+        )
+
+    def test_clone(self):
+        """Options survive chaining but don't modify the original QuerySet."""
+        qs = Author.objects.comment("a")
+        with self.assertNumQueries(1) as ctx:
+            list(qs.filter(name="Bob").values("name").comment("b").order_by("name"))
+        self.assertIn("comment='b')", ctx.captured_queries[0]["sql"])
+        with self.assertNumQueries(1) as ctx:
+            list(qs)
+        self.assertIn("comment='a')", ctx.captured_queries[0]["sql"])
+        with self.assertNumQueries(1) as ctx:
+            list(Author.objects.all())
+        self.assertNotIn("comment", ctx.captured_queries[0]["sql"])
+
+    def test_collation(self):
+        qs = Author.objects.filter(name="bob").collation({"locale": "en", "strength": 2})
+        self.assertSequenceEqual(qs, [self.bob])
+        self.assertEqual(qs.count(), 1)
+
+    def test_count(self):
+        """Options that count_documents() doesn't support are ignored."""
+        with self.assertNumQueries(1) as ctx:
+            self.assertEqual(Author.objects.comment("c").batch_size(5).max_time_ms(9).count(), 1)
+        self.assertEqual(
+            ctx.captured_queries[0]["sql"],
+            "db.queries__author.count_documents({}, comment='c', maxTimeMS=9)",
+        )
+
+    def test_count_subquery(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertEqual(Author.objects.comment("c")[:1].count(), 1)
+        self.assertEqual(
+            ctx.captured_queries[0]["sql"],
+            "db.queries__author.count_documents({}, limit=1, comment='c')",
+        )
+
+    def test_count_estimated(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertEqual(Author.objects.comment("c").count(estimated=True), 1)
+        self.assertEqual(
+            ctx.captured_queries[0]["sql"],
+            "db.queries__author.estimated_document_count(comment='c')",
+        )
+
+    def test_exists(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertIs(Author.objects.hint("_id_").exists(), True)
+        self.assertEqual(
+            ctx.captured_queries[0]["sql"],
+            "db.queries__author.find_one({}, {'_id': 1}, hint='_id_')",
+        )
+
+    def test_update(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertEqual(Author.objects.filter(name="Bob").comment("c").update(name="Rob"), 1)
+        self.assertEqual(
+            ctx.captured_queries[0]["sql"],
+            "db.queries__author.update_many({'name': 'Bob'}, "
+            "[{'$set': {'name': {'$literal': 'Rob'}}}], comment='c')",
+        )
+
+    def test_delete(self):
+        with self.assertNumQueries(1) as ctx:
+            self.assertEqual(
+                Book.objects.filter(title="Don").comment("c").delete(), (1, {"queries_.Book": 1})
+            )
+        self.assertEqual(
+            ctx.captured_queries[0]["sql"],
+            "db.queries__book.delete_many({'title': 'Don'}, comment='c')",
+        )
@@ -0,0 +1,135 @@
+from contextlib import ExitStack
+from unittest.mock import patch
+
+from django.db import connection
+from django.db.models.deletion import Collector
+from django.db.models.sql import UpdateQuery
+from django.test import TestCase, override_settings
+from pymongo import ReadPreference
+from pymongo.read_preferences import Secondary, SecondaryPreferred
+
+from django_mongodb_backend.compiler import SQLCompiler
+from django_mongodb_backend.routers import SecondaryReadsRouter
+
+from .models import Author, Book
+
+
+class CustomRouter(SecondaryReadsRouter):
+    def read_preference_for_read(self, model, **hints):
+        return Secondary() if model is Author else None
+
+
+class ReadPreferenceTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.bob = Author.objects.create(name="Bob")
+
+    def get_read_preference(self, qs):
+        return qs.query.get_compiler("default").get_read_preference()
+
+    def test_default(self):
+        self.assertIsNone(self.get_read_preference(Author.objects.all()))
+
+    def test_read_preference(self):
+        qs = Author.objects.read_preference(ReadPreference.SECONDARY_PREFERRED)
+        self.assertEqual(self.get_read_preference(qs), ReadPreference.SECONDARY_PREFERRED)
+        self.assertEqual(
+            self.get_read_preference(qs.filter(name="Bob")), ReadPreference.SECONDARY_PREFERRED
+        )
+        self.assertIsNone(self.get_read_preference(Author.objects.all()))
+
+    def test_using_secondary(self):
+        qs = Author.objects.using_secondary(max_staleness=120)
+        self.assertEqual(self.get_read_preference(qs), SecondaryPreferred(max_staleness=120))
+        # secondaryPreferred falls back to the primary.
+        self.assertSequenceEqual(qs, [self.bob])
+        self.assertEqual(qs.count(), 1)
+
+    def test_collection(self):
+        qs = Author.objects.using_secondary().filter(name="Bob")
+        compiler = qs.query.get_compiler("default")
+        compiler.pre_sql_setup()
+        self.assertEqual(compiler.collection.read_preference, SecondaryPreferred())
+
+    def test_write(self):
+        query = Author.objects.using_secondary().query.chain(UpdateQuery)
+        self.assertIsNone(
+            connection.ops.compiler("SQLUpdateCompiler")(
+                query, connection, "default"
+            ).get_read_preference()
+        )
+
+    def test_transaction(self):
+        qs = Author.objects.using_secondary()
+        with patch.object(connection, "session", object()):
+            self.assertIsNone(self.get_read_preference(qs))
+
+
+@override_settings(DATABASE_ROUTERS=[SecondaryReadsRouter()])
+class SecondaryReadsRouterTests(TestCase):
+    def get_read_preference(self, qs):
+        return qs.query.get_compiler("default").get_read_preference()
+
+    def test_router(self):
+        with patch.object(connection, "in_atomic_block", False):
+            self.assertEqual(
+                self.get_read_preference(Author.objects.all()), ReadPreference.SECONDARY_PREFERRED
+            )
+
+    def test_atomic(self):
+        self.assertIsNone(self.get_read_preference(Author.objects.all()))
+
+    def test_queryset_overrides_router(self):
+        qs = Author.objects.read_preference(ReadPreference.NEAREST)
+        self.assertEqual(self.get_read_preference(qs), ReadPreference.NEAREST)
+
+    @override_settings(DATABASE_ROUTERS=[CustomRouter()])
+    def test_custom_router(self):
+        with patch.object(connection, "in_atomic_block", False):
+            self.assertEqual(self.get_read_preference(Author.objects.all()), Secondary())
+            self.assertIsNone(self.get_read_preference(Book.objects.all()))
+
+    def record_read_preferences(self):
+        """
+        Return a list that records the read preferences of queries in the
+        returned context (where queries aren't in an atomic() block).
+        """
+        read_preferences = []
+        get_read_preference = SQLCompiler.get_read_preference
+
+        def record(compiler):
+            read_preferences.append(get_read_preference(compiler))
+            return read_preferences[-1]
+
+        context = ExitStack()
+        context.enter_context(patch.object(connection, "in_atomic_block", False))
+        context.enter_context(patch.object(SQLCompiler, "get_read_preference", record))
+        return read_preferences, context
+
+    def test_collect_reads_from_primary(self):
+        """The objects to delete aren't read from a lagging secondary."""
+        Author.objects.create(name="Bob")
+        for queryset in (Author.objects.all(), Author.objects.using_secondary()):
+            with self.subTest(queryset=queryset):
+                collector = Collector(using="default", origin=None)
+                read_preferences, context = self.record_read_preferences()
+                with context:
+                    collector.collect(queryset.filter(name="Bob"))
+                self.assertEqual(len(collector.data[Author]), 1)
+                self.assertGreater(len(read_preferences), 0)
+                self.assertEqual(read_preferences, [None] * len(read_preferences))
+                # Reads after the collection use the router.
+                _, context = self.record_read_preferences()
+                with context:
+                    self.assertEqual(
+                        self.get_read_preference(Author.objects.all()),
+                        ReadPreference.SECONDARY_PREFERRED,
+                    )
+
+    def test_get_or_create_reads_from_primary(self):
+        Author.objects.create(name="Bob")
+        read_preferences, context = self.record_read_preferences()
+        with context:
+            _, created = Author.objects.get_or_create(name="Bob")
+        self.assertIs(created, False)
+        self.assertEqual(read_preferences, [None])
@@ -0,0 +1,187 @@
+from bson import SON
+from django.core.exceptions import FieldDoesNotExist
+from django.core.paginator import EmptyPage, InvalidPage
+from django.test import TestCase
+
+from django_mongodb_backend.paginator import SeekPaginator
+from django_mongodb_backend.test import MongoTestCaseMixin
+
+from .models import Author, Book, Tag
+
+
+class SeekTests(MongoTestCaseMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.authors = [
+            Author.objects.create(name=name) for name in ["Ann", "Bob", "Bob", "Bob", "Cal"]
+        ]
+
+    def assertSeek(self, qs, expected):
+        """Seeking after each row of qs returns the remaining rows."""
+        rows = list(qs.seek())
+        self.assertEqual(rows, expected)
+        for index, row in enumerate(rows):
+            token = qs.seek().seek_token(row)
+            self.assertEqual(list(qs.seek(after=token)), expected[index + 1 :])
+
+    def test_default_ordering(self):
+        """The primary key is the default ordering and the tiebreaker."""
+        self.assertSeek(Author.objects.all(), sorted(self.authors, key=lambda a: a.pk))
+
+    def test_ordering(self):
+        ann, bob1, bob2, bob3, cal = self.authors
+        self.assertSeek(Author.objects.order_by("name"), [ann, bob1, bob2, bob3, cal])
+
+    def test_ordering_argument(self):
+        ann, _, bob2, bob3, _ = self.authors
+        qs = Author.objects.all()
+        token = qs.seek(ordering=["-name"]).seek_token(bob2)
+        self.assertEqual(list(qs.seek(token, ordering=["-name"])), [bob3, ann])
+
+    def test_descending_pk(self):
+        ann, bob1, bob2, bob3, cal = self.authors
+        self.assertSeek(Author.objects.order_by("name", "-pk"), [ann, bob3, bob2, bob1, cal])
+
+    def test_filter(self):
+        _, bob1, bob2, bob3, _ = self.authors
+        self.assertSeek(Author.objects.filter(name="Bob").order_by("name"), [bob1, bob2, bob3])
+
+    def test_query(self):
+        bob = self.authors[1]
+        qs = Author.objects.order_by("name")
+        qs = qs.seek(after=qs.seek().seek_token(bob))
+        self.assertEqual(qs.query.order_by, ("name", "pk"))
+        with self.assertNumQueries(1) as ctx:
+            list(qs)
+        self.assertAggregateQuery(
+            ctx.captured_queries[0]["sql"],
+            "queries__author",
+            [
+                {
+                    "$match": {
+                        "$or": [
+                            {"name": {"$gt": "Bob"}},
+                            {"$and": [{"name": "Bob"}, {"_id": {"$gt": bob.pk}}]},
+                        ]
+                    }
+                },
+                {"$sort": SON([("name", 1), ("_id", 1)])},
+            ],
+        )
+
+    def test_foreign_key(self):
+        book1 = Book.objects.create(title="A", author=self.authors[1])
+        book2 = Book.objects.create(title="B", author=self.authors[0])
+        qs = Book.objects.order_by("author_id")
+        self.assertEqual(list(qs.seek(after=qs.seek().seek_token(book2))), [book1])
+
+    def test_nullable_field(self):
+        """Null values sort first."""
+        t1 = Tag.objects.create(name="t1")
+        t2 = Tag.objects.create(name="t2", parent=t1)
+        t3 = Tag.objects.create(name="t3")
+        t4 = Tag.objects.create(name="t4", parent=t1)
+        self.assertSeek(Tag.objects.order_by("parent_id"), [t1, t3, t2, t4])
+        self.assertSeek(Tag.objects.order_by("-parent_id"), [t2, t4, t1, t3])
+
+    def test_relation_ordering(self):
+        msg = "seek() only supports ordering by the model's fields, not 'author'."
+        with self.assertRaisesMessage(ValueError, msg):
+            Book.objects.order_by("author").seek()
+
+    def test_expression_ordering(self):
+        with self.assertRaisesMessage(ValueError, "seek() doesn't support ordering by"):
+            Author.objects.order_by("?").seek()
+
+    def test_invalid_token(self):
+        for token in ["invalid", "WyJhIl0=", "bnVsbA=="]:
+            with (
+                self.subTest(token=token),
+                self.assertRaisesMessage(ValueError, "Invalid seek token"),
+            ):
+                Author.objects.order_by("name").seek(after=token)
+
+
+class SeekPaginatorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.authors = [Author.objects.create(name=f"Author {i}") for i in range(5)]
+
+    def test_pages(self):
+        paginator = SeekPaginator(Author.objects.all(), 2, ordering=["-name"])
+        page = paginator.page()
+        self.assertEqual(list(page), [self.authors[4], self.authors[3]])
+        self.assertEqual(list(paginator.page(page.next_token)), [self.authors[2], self.authors[1]])
+
+    def test_traverse(self):
+        paginator = SeekPaginator(Author.objects.all(), 2, ordering=["name"])
+        pages = []
+        page = paginator.page()
+        while True:
+            pages.append(list(page))
+            if not page.has_next():
+                break
+            page = paginator.page(page.next_page_number())
+        self.assertEqual(pages, [self.authors[:2], self.authors[2:4], self.authors[4:]])
+        self.assertIs(page.has_previous(), False)
+        with self.assertRaises(EmptyPage):
+            page.next_page_number()
+
+    def test_exact_multiple(self):
+        paginator = SeekPaginator(Author.objects.all(), 5)
+        page = paginator.page()
+        self.assertEqual(list(page), self.authors)
+        self.assertIs(page.has_next(), False)
+
+    def test_invalid_token(self):
+        paginator = SeekPaginator(Author.objects.all(), 2)
+        with self.assertRaises(InvalidPage):
+            paginator.page("invalid")
+        self.assertEqual(list(paginator.get_page("invalid")), self.authors[:2])
+
+    def test_empty(self):
+        paginator = SeekPaginator(Author.objects.none(), 2)
+        self.assertEqual(list(paginator.page()), [])
+        paginator = SeekPaginator(Author.objects.none(), 2, allow_empty_first_page=False)
+        with self.assertRaises(EmptyPage):
+            paginator.page()
+
+    def test_iter(self):
+        paginator = SeekPaginator(Author.objects.all(), 2, ordering=["name"])
+        self.assertEqual(
+            [list(page) for page in paginator],
+            [self.authors[:2], self.authors[2:4], self.authors[4:]],
+        )
+
+    def test_iter_empty(self):
+        paginator = SeekPaginator(Author.objects.none(), 2)
+        self.assertEqual([list(page) for page in paginator], [[]])
+
+    def test_invalid_ordering(self):
+        with self.assertRaisesMessage(FieldDoesNotExist, "Author has no field named 'missing'"):
+            SeekPaginator(Author.objects.all(), 2, ordering=["missing"])
+        msg = "seek() doesn't support ordering by '?'."
+        with self.assertRaisesMessage(ValueError, msg):
+            SeekPaginator(Author.objects.order_by("?"), 2)
+
+    def test_orphans(self):
+        with self.assertRaisesMessage(TypeError, "orphans"):
+            SeekPaginator(Author.objects.all(), 2, orphans=1)
+
+    def test_unsupported_number_methods(self):
+        paginator = SeekPaginator(Author.objects.all(), 2)
+        page = paginator.page()
+        msg = "SeekPaginator doesn't support %s because its pages are identified by tokens"
+        tests = (
+            ("validate_number()", lambda: paginator.validate_number(1)),
+            ("page_range", lambda: paginator.page_range),
+            ("get_elided_page_range()", paginator.get_elided_page_range),
+            ("start_index()", page.start_index),
+            ("end_index()", page.end_index),
+        )
+        for name, method in tests:
+            with (
+                self.subTest(name=name),
+                self.assertRaisesMessage(NotImplementedError, msg % name),
+            ):
+                method()
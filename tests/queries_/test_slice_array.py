@@ -0,0 +1,98 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.test import TestCase
+
+from .models import Post
+
+
+class SliceArrayTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.comments = [f"comment {i}" for i in range(10)]
+        cls.post = Post.objects.create(title="Hello", comments=cls.comments)
+        Post.objects.create(title="Empty", comments=None)
+
+    def test_first(self):
+        with self.assertNumQueries(1) as ctx:
+            post = Post.objects.slice_array("comments", 3).get(title="Hello")
+        self.assertEqual(post.comments, self.comments[:3])
+        self.assertIn(
+            "{'$project': {'_id': 1, 'title': 1, 'comments': {'$slice': ['$comments', 3]}}}",
+            ctx.captured_queries[0]["sql"],
+        )
+
+    def test_last(self):
+        post = Post.objects.slice_array("comments", -2).get(title="Hello")
+        self.assertEqual(post.comments, self.comments[-2:])
+
+    def test_position(self):
+        with self.assertNumQueries(1) as ctx:
+            post = Post.objects.slice_array("comments", 4, 3).get(title="Hello")
+        self.assertEqual(post.comments, self.comments[4:7])
+        self.assertIn("{'$slice': ['$comments', 4, 3]}", ctx.captured_queries[0]["sql"])
+
+    def test_null(self):
+        post = Post.objects.slice_array("comments", 3).get(title="Empty")
+        self.assertIsNone(post.comments)
+
+    def test_values(self):
+        self.assertEqual(
+            Post.objects.slice_array("comments", 1, 2)
+            .values_list("comments", flat=True)
+            .get(title="Hello"),
+            self.comments[1:3],
+        )
+
+    def test_only(self):
+        post = Post.objects.only("comments").slice_array("comments", 1).get(title="Hello")
+        self.assertEqual(post.comments, self.comments[:1])
+
+    def test_clone(self):
+        qs = Post.objects.slice_array("comments", 1)
+        self.assertEqual(
+            qs.slice_array("comments", 2).get(title="Hello").comments, self.comments[:2]
+        )
+        self.assertEqual(qs.get(title="Hello").comments, self.comments[:1])
+        self.assertEqual(Post.objects.get(title="Hello").comments, self.comments)
+
+    def test_save(self):
+        post = Post.objects.slice_array("comments", 2).get(title="Hello")
+        msg = (
+            "Cannot save Post.comments since only(), defer(), or slice_array() partially "
+            "loaded it. Use save(update_fields=...) to save other fields."
+        )
+        with self.assertRaisesMessage(ValueError, msg):
+            post.save()
+        post.title = "Hi"
+        post.save(update_fields=["title"])
+        self.assertEqual(Post.objects.get(title="Hi").comments, self.comments)
+        # The field can be saved after a new array is assigned.
+        post.comments = ["new"]
+        post.save()
+        self.assertEqual(Post.objects.get(title="Hi").comments, ["new"])
+
+    def test_save_null(self):
+        post = Post.objects.slice_array("comments", 2).get(title="Empty")
+        post.title = "Still empty"
+        post.save()
+        self.assertIsNone(Post.objects.get(title="Still empty").comments)
+
+    def test_invalid_field(self):
+        msg = "Post has no field named 'foo'"
+        with self.assertRaisesMessage(FieldDoesNotExist, msg):
+            Post.objects.slice_array("foo", 1)
+
+    def test_not_array_field(self):
+        msg = "slice_array() requires an array field, not 'title'."
+        with self.assertRaisesMessage(TypeError, msg):
+            Post.objects.slice_array("title", 1)
+
+    def test_invalid_arguments(self):
+        msg = "slice_array() takes n or position and n as integers."
+        for args in [(), (1, 2, 3), ("1",), (1.5,), (True,)]:
+            with self.subTest(args=args), self.assertRaisesMessage(TypeError, msg):
+                Post.objects.slice_array("comments", *args)
+        with self.assertRaisesMessage(ValueError, "slice_array() n must not be zero."):
+            Post.objects.slice_array("comments", 0)
+        msg = "slice_array() n must be positive when position is given."
+        with self.assertRaisesMessage(ValueError, msg):
+            Post.objects.slice_array("comments", 0, 0)
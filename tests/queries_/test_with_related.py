@@ -0,0 +1,91 @@
+from django.test import TestCase
+
+from django_mongodb_backend.test import MongoTestCaseMixin
+
+from .models import Author, Book
+
+
+class WithRelatedTests(MongoTestCaseMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.alice = Author.objects.create(name="Alice")
+        cls.bob = Author.objects.create(name="Bob")
+        cls.carol = Author.objects.create(name="Carol")
+        cls.b = Book.objects.create(title="B", author=cls.alice, isbn="2")
+        cls.a = Book.objects.create(title="A", author=cls.alice, isbn="1")
+        cls.c = Book.objects.create(title="C", author=cls.alice, isbn="3")
+        cls.d = Book.objects.create(title="D", author=cls.bob, isbn="4")
+
+    def test_with_related(self):
+        with self.assertNumQueries(1) as ctx:
+            authors = list(
+                Author.objects.with_related("book_set", ordering=["title"]).order_by("name")
+            )
+            books = {author.name: list(author.book_set.all()) for author in authors}
+        self.assertEqual(books, {"Alice": [self.a, self.b, self.c], "Bob": [self.d], "Carol": []})
+        self.assertAggregateQuery(
+            ctx.captured_queries[0]["sql"],
+            "queries__author",
+            [
+                {"$sort": {"name": 1}},
+                {
+                    "$lookup": {
+                        "from": "queries__book",
+                        "localField": "_id",
+                        "foreignField": "author_id",
+                        "pipeline": [{"$sort": {"title": 1}}],
+                        "as": "__with_related_book_set",
+                    }
+                },
+            ],
+        )
+
+    def test_limit(self):
+        with self.assertNumQueries(1):
+            author = Author.objects.with_related("book_set", limit=2, ordering=["-title"]).get(
+                name="Alice"
+            )
+            self.assertEqual(list(author.book_set.all()), [self.c, self.b])
+
+    def test_related_object_cached(self):
+        author = Author.objects.with_related("book_set").get(name="Bob")
+        with self.assertNumQueries(0):
+            self.assertIs(author.book_set.all()[0].author, author)
+
+    def test_iterator(self):
+        with self.assertNumQueries(1):
+            authors = Author.objects.with_related("book_set", ordering=["pk"]).order_by("name")
+            self.assertEqual(
+                [len(author.book_set.all()) for author in authors.iterator()], [3, 1, 0]
+            )
+
+    def test_values(self):
+        self.assertEqual(
+            list(
+                Author.objects.with_related("book_set")
+                .order_by("name")
+                .values_list("name", flat=True)
+            ),
+            ["Alice", "Bob", "Carol"],
+        )
+
+    def test_values_before(self):
+        msg = "with_related() can't be used after values() or values_list()."
+        with self.assertRaisesMessage(TypeError, msg):
+            Author.objects.values("name").with_related("book_set")
+
+    def test_invalid_relation(self):
+        msg = "with_related() requires a reverse foreign key, not 'name'."
+        with self.assertRaisesMessage(ValueError, msg):
+            Author.objects.with_related("name")
+
+    def test_invalid_limit(self):
+        msg = "with_related() limit must be a positive integer."
+        for limit in (0, -1, "1", True):
+            with self.subTest(limit=limit), self.assertRaisesMessage(ValueError, msg):
+                Author.objects.with_related("book_set", limit=limit)
+
+    def test_invalid_ordering(self):
+        msg = "with_related() only supports ordering by the related model's fields, not "
+        with self.assertRaisesMessage(ValueError, msg + "'author'."):
+            Author.objects.with_related("book_set", ordering=["author"])
@@ -0,0 +1,88 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from django_mongodb_backend.search_index_cache import SearchIndexCache
+
+
+class Collection:
+    name = "coll"
+
+    def __init__(self):
+        self.search_indexes = [{"name": "idx"}]
+        self.calls = 0
+
+    def list_search_indexes(self):
+        self.calls += 1
+        return iter(self.search_indexes)
+
+
+def first_index(search_indexes):
+    return search_indexes[0]["name"] if search_indexes else "default"
+
+
+class SearchIndexCacheTests(SimpleTestCase):
+    def test_cached(self):
+        cache = SearchIndexCache()
+        collection = Collection()
+        self.assertEqual(cache.get_index(collection, "a", first_index), "idx")
+        collection.search_indexes = []
+        self.assertEqual(cache.get_index(collection, "a", first_index), "idx")
+        # Other keys are resolved from the cached indexes.
+        self.assertEqual(cache.get_index(collection, "b", first_index), "idx")
+        self.assertEqual(collection.calls, 1)
+        self.assertEqual(len(cache), 1)
+
+    def test_resolved_once(self):
+        cache = SearchIndexCache()
+        collection = Collection()
+        resolved = []
+
+        def resolve(search_indexes):
+            resolved.append(search_indexes)
+            return "idx"
+
+        cache.get_index(collection, "a", resolve)
+        cache.get_index(collection, "a", resolve)
+        self.assertEqual(resolved, [[{"name": "idx"}]])
+
+    def test_timeout(self):
+        cache = SearchIndexCache(timeout=10)
+        collection = Collection()
+        with patch("django_mongodb_backend.search_index_cache.monotonic", return_value=100):
+            cache.get_index(collection, "a", first_index)
+        collection.search_indexes = []
+        with patch("django_mongodb_backend.search_index_cache.monotonic", return_value=109):
+            self.assertEqual(cache.get_index(collection, "a", first_index), "idx")
+        with patch("django_mongodb_backend.search_index_cache.monotonic", return_value=110):
+            self.assertEqual(cache.get_index(collection, "a", first_index), "default")
+        self.assertEqual(collection.calls, 2)
+
+    def test_timeout_zero(self):
+        cache = SearchIndexCache(timeout=0)
+        collection = Collection()
+        cache.get_index(collection, "a", first_index)
+        cache.get_index(collection, "a", first_index)
+        self.assertEqual(collection.calls, 2)
+
+    def test_no_timeout(self):
+        cache = SearchIndexCache(timeout=None)
+        collection = Collection()
+        cache.get_index(collection, "a", first_index)
+        with patch("django_mongodb_backend.search_index_cache.monotonic", return_value=1e12):
+            cache.get_index(collection, "a", first_index)
+        self.assertEqual(collection.calls, 1)
+
+    def test_clear(self):
+        cache = SearchIndexCache()
+        collection = Collection()
+        cache.get_index(collection, "a", first_index)
+        cache.clear("other")
+        cache.get_index(collection, "a", first_index)
+        self.assertEqual(collection.calls, 1)
+        cache.clear("coll")
+        collection.search_indexes = []
+        self.assertEqual(cache.get_index(collection, "a", first_index), "default")
+        self.assertEqual(collection.calls, 2)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
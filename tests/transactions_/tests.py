@@ -1,6 +1,6 @@
 from unittest import mock
 
-from django.db import DatabaseError, connection
+from django.db import DatabaseError, NotSupportedError, connection
 from django.test import TransactionTestCase, skipIfDBFeature, skipUnlessDBFeature
 
 from django_mongodb_backend import transaction
@@ -148,6 +148,17 @@ class AtomicTests(TransactionTestCase):
         with transaction.atomic():
             pass
 
+    def test_bulk_create_ignore_conflicts(self):
+        """
+        Ignored duplicate key errors would abort the transaction, so
+        bulk_create(ignore_conflicts=True) raises before writing.
+        """
+        msg = "bulk_create(ignore_conflicts=True) isn't supported in a transaction on MongoDB."
+        with self.assertRaisesMessage(NotSupportedError, msg), transaction.atomic():
+            Reporter.objects.create(first_name="Tintin")
+            Reporter.objects.bulk_create([Reporter(first_name="Haddock")], ignore_conflicts=True)
+        self.assertSequenceEqual(Reporter.objects.all(), [])
+
     def test_failure_on_commit_transaction(self):
         """transaction.atomic() re-raises errors during transaction commit."""
         msg = "commit failed"
@@ -1,5 +1,18 @@
 from django.db import models
 
+from django_mongodb_backend.managers import MongoManager
+
 
 class UniqueNumber(models.Model):
     number = models.IntegerField(unique=True)
+
+
+class Score(models.Model):
+    name = models.CharField(max_length=10)
+    points = models.IntegerField(default=0)
+    rank = models.IntegerField(unique=True, null=True)
+
+    objects = MongoManager()
+
+    def __str__(self):
+        return self.name
@@ -1,7 +1,8 @@
 from django.db import IntegrityError
+from django.db.models import F
 from django.test import TestCase
 
-from .models import UniqueNumber
+from .models import Score, UniqueNumber
 
 
 class UpdateTests(TestCase):
@@ -11,3 +12,100 @@ class UpdateTests(TestCase):
         msg = "duplicate key error collection"
         with self.assertRaisesMessage(IntegrityError, msg):
             UniqueNumber.objects.filter(number=1).update(number=2)
+
+
+class BulkUpdateTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.scores = [Score.objects.create(name=f"s{i}", points=i) for i in range(5)]
+
+    def assertPoints(self, expected):
+        self.assertEqual(
+            list(Score.objects.order_by("name").values_list("points", flat=True)), expected
+        )
+
+    def test_bulk_update(self):
+        for score in self.scores:
+            score.points *= 10
+            score.name = score.name.upper()
+        with self.assertNumQueries(1) as ctx:
+            self.assertEqual(Score.objects.bulk_update(self.scores, ["points"]), 5)
+        self.assertIn("db.update__score.bulk_write([UpdateOne(", ctx.captured_queries[0]["sql"])
+        self.assertIn("ordered=True", ctx.captured_queries[0]["sql"])
+        self.assertPoints([0, 10, 20, 30, 40])
+        # Fields that aren't listed aren't updated.
+        self.assertEqual(Score.objects.filter(name__startswith="S").count(), 0)
+
+    def test_batch_size(self):
+        for score in self.scores:
+            score.points += 1
+        with self.assertNumQueries(3):
+            self.assertEqual(Score.objects.bulk_update(self.scores, ["points"], batch_size=2), 5)
+        self.assertPoints([1, 2, 3, 4, 5])
+
+    def test_matched_count(self):
+        """Unchanged documents are counted but missing ones aren't."""
+        Score.objects.filter(name="s0").delete()
+        self.assertEqual(Score.objects.bulk_update(self.scores, ["points"]), 4)
+
+    def test_expression(self):
+        self.scores[0].points = F("points") + 100
+        self.scores[1].points = 50
+        Score.objects.bulk_update(self.scores[:2], ["points"])
+        self.assertPoints([100, 50, 2, 3, 4])
+
+    def test_null(self):
+        self.scores[0].rank = 1
+        Score.objects.bulk_update(self.scores[:1], ["rank"])
+        self.scores[0].rank = None
+        Score.objects.bulk_update(self.scores[:1], ["rank"])
+        self.assertIsNone(Score.objects.get(name="s0").rank)
+
+    def test_literal(self):
+        """Values that look like expressions are escaped."""
+        self.scores[0].name = "$points"
+        Score.objects.bulk_update(self.scores[:1], ["name"])
+        self.assertEqual(Score.objects.get(pk=self.scores[0].pk).name, "$points")
+
+    def test_unordered(self):
+        for i, score in enumerate(self.scores):
+            score.rank = 1 if i < 2 else i
+        with (
+            self.assertNumQueries(1) as ctx,
+            self.assertRaisesMessage(IntegrityError, "duplicate key error"),
+        ):
+            Score.objects.bulk_update(self.scores, ["rank"], ordered=False)
+        self.assertIn("ordered=False", ctx.captured_queries[0]["sql"])
+        # The updates after the error are applied.
+        self.assertEqual(
+            list(Score.objects.order_by("name").values_list("rank", flat=True)),
+            [1, None, 2, 3, 4],
+        )
+
+    def test_empty(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(Score.objects.bulk_update([], ["points"]), 0)
+
+    def test_filtered_queryset(self):
+        """A filtered QuerySet falls back to QuerySet.bulk_update()."""
+        for score in self.scores:
+            score.points = 7
+        with self.assertNumQueries(1) as ctx:
+            self.assertEqual(
+                Score.objects.filter(points__lt=2).bulk_update(self.scores, ["points"]), 2
+            )
+        self.assertIn(".update_many(", ctx.captured_queries[0]["sql"])
+        self.assertPoints([7, 7, 2, 3, 4])
+
+    def test_errors(self):
+        tests = [
+            ({"fields": []}, "Field names must be given to bulk_update()."),
+            ({"fields": ["id"]}, "bulk_update() cannot be used with primary key fields."),
+            ({"fields": ["points"], "batch_size": 0}, "Batch size must be a positive integer."),
+        ]
+        for kwargs, msg in tests:
+            with self.subTest(kwargs=kwargs), self.assertRaisesMessage(ValueError, msg):
+                Score.objects.bulk_update(self.scores, **kwargs)
+        msg = "All bulk_update() objects must have a primary key set."
+        with self.assertRaisesMessage(ValueError, msg):
+            Score.objects.bulk_update([Score(name="new")], ["points"])